@@ -112,8 +112,9 @@ FONT_SIZE = 10
 # CONFIGURACIÓN DE PROCESAMIENTO
 # ============================================
 
-# Número máximo de procesos paralelos en modo batch
-MAX_PARALLEL_PROCESSES = 1  # Por ahora solo soporta 1
+# Número máximo de remuxeos (mkvmerge) simultáneos en modo batch
+# Subir en discos SSD; en discos mecánicos conviene dejarlo bajo
+MAX_PARALLEL_REMUX = 2
 
 # Timeout para operaciones de remuxeo (segundos)
 REMUX_TIMEOUT = 3600  # 1 hora
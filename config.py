@@ -48,6 +48,9 @@ DEFAULT_SUB_LAT_TITLE = "Español Latino"
 PATTERN_JP = "_JP.mkv"
 PATTERN_LAT = "_LAT.mkv"
 
+# Remuxeo por lotes: mkvmerge simultáneos como máximo (limita la carga de disco)
+MAX_PARALLEL_REMUX = 2
+
 # Directorio de logs
 LOGS_DIR = Path("logs")
 LOGS_DIR.mkdir(exist_ok=True)
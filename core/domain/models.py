@@ -11,7 +11,7 @@ from datetime import datetime
 from .enums import TrackType, JobStatus, CodecType, LanguageCode
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Track:
     """
     Representa una pista de audio, video o subtítulos.
@@ -7,10 +7,18 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional, Callable
 import subprocess
+import sys
 
 from ..domain.models import RemuxJob, RemuxResult
 
 
+# Buffer del pipe de salida del proceso (lecturas en bloque, no byte a byte)
+_PIPE_BUFSIZE = 64 * 1024
+
+# En Windows, lanzar el proceso sin crear una consola por cada episodio
+_POPEN_CREATIONFLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+
 class BaseEngine(ABC):
     """
     Clase base abstracta para engines de remuxeo.
@@ -55,7 +63,8 @@ class BaseEngine(ABC):
     def execute(
         self,
         command: List[str],
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None
     ) -> RemuxResult:
         """
         Ejecuta un comando y retorna el resultado.
@@ -63,24 +72,38 @@ class BaseEngine(ABC):
         Args:
             command: Comando a ejecutar
             progress_callback: Callback para reportar progreso (0-100)
+            cancel_check: Se consulta en cada línea leída; si retorna True
+                se termina el proceso (SIGTERM)
             
         Returns:
             Resultado del remuxeo
         """
         try:
-            # Ejecutar proceso
+            # Ejecutar proceso: stderr va al mismo pipe que stdout, que se lee
+            # entero (un pipe sin leer se llena y bloquea al proceso)
             process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                bufsize=_PIPE_BUFSIZE,
+                creationflags=_POPEN_CREATIONFLAGS
             )
             
-            # Monitorear progreso
-            for line in process.stderr:
+            # Monitorear progreso (solo se notifica cuando cambia el porcentaje)
+            last_progress = None
+            for line in process.stdout:
+                if cancel_check and cancel_check():
+                    process.terminate()
+                    process.wait()
+                    return RemuxResult(
+                        success=False,
+                        error_message="Cancelado por el usuario"
+                    )
                 if progress_callback:
                     progress = self._parse_progress(line)
-                    if progress is not None:
+                    if progress is not None and progress != last_progress:
+                        last_progress = progress
                         progress_callback(progress)
             
             # Esperar a que termine
@@ -108,7 +131,8 @@ class BaseEngine(ABC):
     def remux(
         self,
         job: RemuxJob,
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None
     ) -> RemuxResult:
         """
         Ejecuta un remuxeo completo.
@@ -116,6 +140,7 @@ class BaseEngine(ABC):
         Args:
             job: Trabajo de remuxeo
             progress_callback: Callback para reportar progreso
+            cancel_check: Callback de cancelación (ver execute)
             
         Returns:
             Resultado del remuxeo
@@ -124,7 +149,7 @@ class BaseEngine(ABC):
         command = self.build_command(job)
         
         # Ejecutar
-        return self.execute(command, progress_callback)
+        return self.execute(command, progress_callback, cancel_check)
     
     def is_available(self) -> bool:
         """
@@ -77,7 +77,9 @@ class BatchService:
         subtitle_offset_ms: int = 0,
         include_audio_tracks: Optional[List[int]] = None,
         include_subtitle_tracks: Optional[List[str]] = None,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        episode_done_callback: Optional[Callable[[int, bool, str], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None
     ) -> BatchResult:
         """
         Procesa todos los episodios en un directorio.
@@ -91,6 +93,10 @@ class BatchService:
             include_audio_tracks: IDs de pistas de audio a incluir
             include_subtitle_tracks: Tipos de subtítulos a incluir
             progress_callback: Callback(episodio_num, progreso_0_100, mensaje)
+            episode_done_callback: Callback(episodio_num, success, output_o_error)
+                llamado al terminar cada episodio (incluye omitidos)
+            cancel_check: Callback que retorna True si hay que cancelar;
+                se consulta entre episodios y durante cada remuxeo
             
         Returns:
             BatchResult con resultados
@@ -128,6 +134,10 @@ class BatchService:
         skipped = 0
         
         for i, (ep_num, episode) in enumerate(sorted(complete_episodes.items())):
+            if cancel_check and cancel_check():
+                print("⏹️ Lote cancelado")
+                break
+            
             print(f"\n{'='*70}")
             print(f"Procesando episodio {ep_num} ({i+1}/{len(complete_episodes)})")
             print(f"{'='*70}")
@@ -154,6 +164,8 @@ class BatchService:
                     'skipped': True,
                     'error': 'Sin archivo de video'
                 })
+                if episode_done_callback:
+                    episode_done_callback(ep_num, False, 'Sin archivo de video')
                 continue
             
             # Callback de progreso por episodio
@@ -162,7 +174,7 @@ class BatchService:
                     progress_callback(ep_num, progress, f"Remuxeando... {progress}%")
             
             # Ejecutar remuxeo
-            result = self.remux_service.remux(job, episode_progress)
+            result = self.remux_service.remux(job, episode_progress, cancel_check)
             
             # Registrar resultado
             if result.success:
@@ -187,6 +199,11 @@ class BatchService:
             if progress_callback:
                 status = "✅ Completado" if result.success else "❌ Fallido"
                 progress_callback(ep_num, 100, status)
+            if episode_done_callback:
+                if result.success:
+                    episode_done_callback(ep_num, True, str(result.output_file))
+                else:
+                    episode_done_callback(ep_num, False, result.error_message or 'Error desconocido')
         
         # 5. Calcular duración total
         duration = (datetime.now() - start_time).total_seconds()
@@ -300,6 +317,50 @@ class BatchService:
         
         return job
     
+    def create_jobs(
+        self,
+        episodes: Dict[int, Episode],
+        output_directory: Path,
+        output_pattern: str = "Episode_{ep:02d}_REMUX.mkv",
+        audio_offset_ms: int = 0,
+        subtitle_offset_ms: int = 0
+    ) -> Dict[int, RemuxJob]:
+        """
+        Crea los RemuxJob de los episodios completos, sin ejecutarlos.
+        
+        Permite que la capa de presentación reparta los trabajos entre
+        varios threads en lugar de procesarlos en serie.
+        
+        Args:
+            episodes: Diccionario de episodios
+            output_directory: Directorio de salida (se crea si no existe)
+            output_pattern: Patrón para nombres
+            audio_offset_ms: Offset de audio
+            subtitle_offset_ms: Offset de subtítulos
+            
+        Returns:
+            Diccionario {ep_num: RemuxJob} ordenado por número de episodio
+        """
+        complete_episodes = self.episode_matcher.filter_complete_episodes(episodes)
+        if not complete_episodes:
+            return {}
+        
+        output_directory.mkdir(parents=True, exist_ok=True)
+        
+        jobs = {}
+        for ep_num, episode in sorted(complete_episodes.items()):
+            job = self._create_job_from_episode(
+                episode,
+                output_directory,
+                output_pattern,
+                audio_offset_ms,
+                subtitle_offset_ms
+            )
+            if job is not None:
+                jobs[ep_num] = job
+        
+        return jobs
+    
     def process_episodes(
         self,
         episodes: Dict[int, Episode],
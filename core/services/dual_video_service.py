@@ -36,7 +36,8 @@ class DualVideoService:
     def remux_dual(
         self,
         job: DualVideoRemuxJob,
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None
     ) -> RemuxResult:
         """
         Ejecuta un remuxeo de dos videos.
@@ -44,6 +45,8 @@ class DualVideoService:
         Args:
             job: Trabajo de remuxeo dual
             progress_callback: Callback para reportar progreso (0-100)
+            cancel_check: Callback que retorna True si hay que cancelar
+                (termina el proceso de MKVMerge)
             
         Returns:
             Resultado del remuxeo
@@ -67,7 +70,7 @@ class DualVideoService:
             if job.audio_offset_ms != 0:
                 print(f"   Audio offset: {job.audio_offset_ms}ms")
             
-            result = self.mkvmerge.execute_command(cmd, progress_callback)
+            result = self.mkvmerge.execute(cmd, progress_callback, cancel_check)
             
             # 5. Actualizar estado del job
             if result.success:
@@ -53,7 +53,8 @@ class RemuxService:
     def remux(
         self,
         job: RemuxJob,
-        progress_callback: Optional[Callable[[int], None]] = None
+        progress_callback: Optional[Callable[[int], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None
     ) -> RemuxResult:
         """
         Ejecuta un remuxeo completo.
@@ -61,6 +62,8 @@ class RemuxService:
         Args:
             job: Trabajo de remuxeo
             progress_callback: Callback para reportar progreso (0-100)
+            cancel_check: Callback que retorna True si hay que cancelar
+                (se consulta en cada línea de salida de MKVMerge)
 
         Returns:
             Resultado del remuxeo
@@ -76,7 +79,7 @@ class RemuxService:
 
             # 3. Ejecutar remuxeo con MKVMerge
             print(f"\n🔧 Usando MKVMerge para remuxeo")
-            result = self.mkvmerge.remux(job, progress_callback)
+            result = self.mkvmerge.remux(job, progress_callback, cancel_check)
 
             # 6. Actualizar estado del job
             if result.success:
@@ -7,7 +7,34 @@ inspirados en Blender, DaVinci Resolve y Adobe Premiere.
 """
 from PyQt6.QtGui import QFont, QColor, QPalette
 from PyQt6.QtWidgets import QApplication
-from typing import Dict, Tuple
+from typing import Callable, Dict, List, Tuple
+import functools
+
+
+# Caches de estilo de los widgets: invalidate_cache() los vacía junto al propio
+_STYLE_CACHE_CLEARERS: List[Callable[[], None]] = []
+
+
+def register_style_cache(clear: Callable[[], None]) -> None:
+    """
+    Registra un cache de estilos derivado del tema.
+    
+    Args:
+        clear: Función que vacía el cache (p. ej. dict.clear o cache_clear de lru_cache)
+    """
+    _STYLE_CACHE_CLEARERS.append(clear)
+
+
+def _cached_style(method):
+    """Memoiza un generador de estilo CSS en el cache del ThemeManager"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        style = self._style_cache.get(key)
+        if style is None:
+            style = self._style_cache[key] = method(self, *args, **kwargs)
+        return style
+    return wrapper
 
 
 class ThemeManager:
@@ -34,8 +61,16 @@ class ThemeManager:
             return
         
         self._initialized = True
+        # Estilos CSS ya generados: {(método, args, kwargs): qss}
+        self._style_cache: Dict[tuple, str] = {}
         self._setup_theme()
     
+    def invalidate_cache(self):
+        """Descarta los estilos memoizados y los caches registrados (llamar al cambiar de tema)"""
+        self._style_cache.clear()
+        for clear in _STYLE_CACHE_CLEARERS:
+            clear()
+    
     def _setup_theme(self):
         """Configura el tema de la aplicación"""
         # Paleta de colores (estilo profesional oscuro)
@@ -182,6 +217,7 @@ class ThemeManager:
     
     # === ESTILOS CSS REUTILIZABLES ===
     
+    @_cached_style
     def get_button_style(self, variant: str = 'primary') -> str:
         """
         Genera estilo CSS para botones.
@@ -224,6 +260,7 @@ class ThemeManager:
             }}
         """
     
+    @_cached_style
     def get_input_style(self) -> str:
         """Genera estilo CSS para inputs (QLineEdit)"""
         return f"""
@@ -244,6 +281,7 @@ class ThemeManager:
             }}
         """
     
+    @_cached_style
     def get_groupbox_style(self) -> str:
         """Genera estilo CSS para QGroupBox"""
         return f"""
@@ -264,6 +302,7 @@ class ThemeManager:
             }}
         """
     
+    @_cached_style
     def get_frame_style(self, elevated: bool = False) -> str:
         """
         Genera estilo CSS para QFrame.
@@ -280,6 +319,7 @@ class ThemeManager:
             }}
         """
     
+    @_cached_style
     def get_label_style(self, variant: str = 'primary') -> str:
         """
         Genera estilo CSS para QLabel.
@@ -302,6 +342,7 @@ class ThemeManager:
             }}
         """
     
+    @_cached_style
     def get_progress_bar_style(self) -> str:
         """Genera estilo CSS para QProgressBar"""
         return f"""
@@ -318,6 +359,7 @@ class ThemeManager:
             }}
         """
     
+    @_cached_style
     def get_combo_box_style(self) -> str:
         """Genera estilo CSS para QComboBox"""
         return f"""
@@ -15,6 +15,7 @@ Integra:
 from PyQt6.QtWidgets import QWidget, QFileDialog, QMessageBox
 from PyQt6.QtCore import Qt
 from pathlib import Path
+import os
 
 from ..ui_builders.assembler_layout_builder import AssemblerLayoutBuilder
 from ..widgets.mpv_preview import MPVPreviewWidget
@@ -129,7 +130,7 @@ class AssemblerTab(QWidget):
             return
         
         # Verificar que sea una carpeta
-        if not Path(video_path).is_dir():
+        if not os.path.isdir(video_path):
             self._log("⚠️ La ruta de video debe ser una carpeta", "warning")
             return
         
@@ -210,7 +211,7 @@ class AssemblerTab(QWidget):
             video_path = self.widgets.video_input.get_path()
             
             # Si es una carpeta, necesita seleccionar episodio
-            if video_path and Path(video_path).is_dir():
+            if video_path and os.path.isdir(video_path):
                 self._log("⚠️ Selecciona un episodio del combo primero", "warning")
                 return
         
@@ -263,7 +264,7 @@ class AssemblerTab(QWidget):
             self._log(f"DEBUG: Modo individual", "info")
         
         # Cargar audio externo
-        if audio_external and Path(audio_external).is_file():
+        if audio_external and os.path.isfile(audio_external):
             self._log(f"DEBUG: Cargando audio: {audio_external}", "info")
             self.mpv_widget.load_external_audio(audio_external)
             self._log(f"🎵 Audio externo cargado: {Path(audio_external).name}", "info")
@@ -271,7 +272,7 @@ class AssemblerTab(QWidget):
             self._log(f"DEBUG: No hay audio externo o no existe", "info")
         
         # Cargar subtítulos externos
-        if subtitle_external and Path(subtitle_external).is_file():
+        if subtitle_external and os.path.isfile(subtitle_external):
             self._log(f"DEBUG: Cargando subtítulos: {subtitle_external}", "info")
             self.mpv_widget.load_external_subtitle(subtitle_external)
             self._log(f"📝 Subtítulos externos cargados: {Path(subtitle_external).name}", "info")
@@ -279,7 +280,7 @@ class AssemblerTab(QWidget):
             self._log(f"DEBUG: No hay subtítulos externos o no existen", "info")
         
         # Cargar letreros/forced
-        if forced_external and Path(forced_external).is_file():
+        if forced_external and os.path.isfile(forced_external):
             self._log(f"DEBUG: Cargando letreros: {forced_external}", "info")
             self.mpv_widget.load_external_subtitle(forced_external)
             self._log(f"🔤 Letreros cargados: {Path(forced_external).name}", "info")
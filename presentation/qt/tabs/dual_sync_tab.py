@@ -10,10 +10,11 @@ from PyQt6.QtGui import QFont
 import platform
 from datetime import datetime
 from pathlib import Path
+import os
 
 # Imports de la arquitectura MVVM
 from presentation.qt.viewmodels import DualSyncViewModel
-from presentation.qt.workers import DualSyncSingleWorker, DualSyncBatchWorker
+from presentation.qt.workers import Worker, dual_remux_task, DualSyncBatchWorker, start_worker
 from presentation.qt.widgets import MPVDualPreviewWidget
 from presentation.qt.ui_builders import DualSyncLayoutBuilder
 
@@ -203,7 +204,7 @@ class DualSyncTab(QWidget):
         
         # Aplicar sincronización al widget MPV
         if self.mpv_widget:
-            self.mpv_widget.apply_sync(audio_ms, subtitle_ms)
+            self.mpv_widget.apply_sync(audio_ms, subtitle_ms, interactive=True)
     
     def toggle_play(self):
         """Toggle play/pause - Delega al widget MPV"""
@@ -246,9 +247,8 @@ class DualSyncTab(QWidget):
             return
         
         # Detectar modo basado en si son archivos o carpetas
-        from pathlib import Path
-        jp_is_file = Path(jp_path).is_file()
-        es_is_file = Path(es_path).is_file()
+        jp_is_file = os.path.isfile(jp_path)
+        es_is_file = os.path.isfile(es_path)
         
         if jp_is_file and es_is_file:
             # Modo individual
@@ -258,7 +258,7 @@ class DualSyncTab(QWidget):
             self._start_batch_remux()
     
     def _start_single_remux(self):
-        """Inicia remuxeo de un solo video - Usa DualSyncSingleWorker"""
+        """Inicia remuxeo de un solo video - Usa Worker(dual_remux_task)"""
         video_jp = self.widgets.jp_input.get_path()
         video_lat = self.widgets.lat_input.get_path()
         output = self.widgets.output_input.get_path()
@@ -277,19 +277,21 @@ class DualSyncTab(QWidget):
         subtitle_offset_ms = self.sync_controls.get_subtitle_offset_ms()
         
         # Usar Worker con DualVideoService (arquitectura SOLID)
-        self.single_worker = DualSyncSingleWorker(
+        self.single_worker = Worker(
+            dual_remux_task,
             self.viewmodel.dual_video_service,
             video_jp, video_lat, output,
             audio_offset_ms, subtitle_offset_ms
         )
         
         # Conectar signals
-        self.single_worker.progress.connect(self._on_progress)
-        self.single_worker.log.connect(self._log)
-        self.single_worker.finished.connect(self._on_single_complete)
+        signals = self.single_worker.signals
+        signals.progress.connect(self._on_progress)
+        signals.log.connect(self._log)
+        signals.finished.connect(self._on_single_complete)
         
-        # Iniciar
-        self.single_worker.start()
+        # Iniciar en el pool compartido
+        start_worker(self.single_worker)
     
     def _start_batch_remux(self):
         """Inicia procesamiento por lotes - Usa DualSyncBatchWorker"""
@@ -325,11 +327,12 @@ class DualSyncTab(QWidget):
         )
         
         # Conectar signals
-        self.batch_worker.progress.connect(self._on_progress)
-        self.batch_worker.log.connect(self._log)
-        self.batch_worker.finished.connect(self._on_batch_complete)
+        signals = self.batch_worker.signals
+        signals.progress.connect(self._on_progress)
+        signals.logs_batch.connect(self.console.log_batch)
+        signals.finished.connect(self._on_batch_complete)
         
-        # Iniciar
+        # Encolar los episodios en el pool compartido
         self.batch_worker.start()
     
     def _on_progress(self, value, text):
@@ -13,7 +13,7 @@ from ..layouts.layout_factory import LayoutFactory
 from ..widgets import FileInputGroup, PreviewPanel, SyncControls, ConsoleLog, ProgressPanel
 
 
-@dataclass
+@dataclass(slots=True)
 class AssemblerWidgets:
     """Contenedor de widgets del AssemblerTab"""
     # Selectores de archivos
@@ -4,14 +4,63 @@ Assembler UI Builder - Construcción de UI para AssemblerTab
 Estilo similar a DualSync pero con un solo preview y gestión de tracks externos.
 """
 from PyQt6.QtWidgets import (QWidget, QLabel, QLineEdit, QPushButton, QFrame,
-                              QTextEdit, QProgressBar, QComboBox)
-from PyQt6.QtCore import Qt
+                              QTextEdit, QProgressBar, QComboBox, QToolTip)
+from PyQt6.QtCore import Qt, QObject, QEvent
 from PyQt6.QtGui import QFont
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from unittest.mock import MagicMock
 from ..widgets import SyncControls, ConsoleLog
 
 
-@dataclass
+# Estilos compartidos (mismo objeto str en cada widget)
+_BG_PRIMARY = "background-color: #0071bc; color: white;"
+_BG_PRIMARY_9PT = _BG_PRIMARY + " font-size: 9pt;"
+_BG_PRIMARY_11PT = _BG_PRIMARY + " font-size: 11pt;"
+_BG_PRIMARY_14PT = _BG_PRIMARY + " font-size: 14pt;"
+_TRACK_FRAME_STYLE = "background-color: #2b2b2b; border: 2px solid #555; border-radius: 5px;"
+_LABEL_13PT_STYLE = "color: white; font-size: 13pt; background: transparent;"
+
+# Textos de tooltips por clave (se resuelven bajo demanda en _TooltipFilter)
+_TOOLTIPS = {
+    "saveAs": "Guardar como archivo",
+    "outputFolder": "Seleccionar carpeta de salida",
+}
+
+
+class _WhiteLabel(QLabel):
+    """QLabel blanco 12pt, estilizado por selector de tipo en _ASSEMBLER_QSS"""
+    pass
+
+
+# Stylesheet compartido instalado una sola vez en el parent
+_ASSEMBLER_QSS = """
+_WhiteLabel { color: white; font-size: 12pt; }
+QProgressBar { border: 1px solid #555; }
+QProgressBar::chunk { background-color: #22b573; }
+"""
+
+
+class _TooltipFilter(QObject):
+    """
+    Event filter que resuelve tooltips desde la propiedad "ttKey".
+    
+    Se instala una sola vez en el parent: los eventos ToolTip que los
+    botones no atienden se propagan al parent, donde se busca el hijo
+    bajo el cursor y se muestra el texto de _TOOLTIPS.
+    """
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.ToolTip:
+            child = obj.childAt(event.pos())
+            key = child.property("ttKey") if child else None
+            text = _TOOLTIPS.get(key) if key else None
+            if text:
+                QToolTip.showText(event.globalPos(), text, child)
+                return True
+        return False
+
+
+@dataclass(slots=True)
 class AssemblerWidgets:
     """Contenedor de widgets del AssemblerTab"""
     # Selectores de archivos
@@ -75,10 +124,13 @@ class AssemblerUIBuilder:
     def __init__(self, parent: QWidget):
         self.parent = parent
         self.y_offset = 0  # Sin offset - todo debe ser visible desde arriba
+        self._tooltip_filter = _TooltipFilter(parent)
     
     def build(self) -> AssemblerWidgets:
         """Construye toda la UI y retorna los widgets"""
         self.parent.setMinimumSize(1920, 1080)
+        self.parent.installEventFilter(self._tooltip_filter)
+        self.parent.setStyleSheet(_ASSEMBLER_QSS)
         
         # Construir secciones
         selectors = self._build_file_selectors()
@@ -103,51 +155,62 @@ class AssemblerUIBuilder:
             **process_controls
         )
     
+    def build_minimal(self) -> AssemblerWidgets:
+        """
+        Construye un AssemblerWidgets mínimo sin crear ningún widget real.
+        
+        Pensado para contextos sin GUI visible (validaciones, documentación)
+        que solo necesitan resolver los widgets por nombre.
+        
+        Returns:
+            AssemblerWidgets con un stub sin padre (MagicMock con spec) por widget
+        """
+        return AssemblerWidgets(**{
+            f.name: MagicMock(spec=f.type, name=f.name) for f in fields(AssemblerWidgets)
+        })
+    
     def _build_file_selectors(self) -> dict:
         """Construye selectores de archivos - Layout reorganizado"""
         
         # === COLUMNA IZQUIERDA: VIDEO Y SALIDA ===
         
         # VIDEO
-        video_label = QLabel("Video:", self.parent)
+        video_label = _WhiteLabel("Video:", self.parent)
         video_label.setGeometry(30, 52 + self.y_offset, 80, 28)
-        video_label.setStyleSheet("color: white; font-size: 12pt;")
         
         video_entry = QLineEdit(self.parent)
         video_entry.setGeometry(120, 52 + self.y_offset, 350, 27)
         
         video_file_btn = QPushButton("📄 Archivo", self.parent)
         video_file_btn.setGeometry(480, 52 + self.y_offset, 90, 27)
-        video_file_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        video_file_btn.setStyleSheet(_BG_PRIMARY)
         
         video_folder_btn = QPushButton("📁 Carpeta", self.parent)
         video_folder_btn.setGeometry(580, 52 + self.y_offset, 90, 27)
-        video_folder_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        video_folder_btn.setStyleSheet(_BG_PRIMARY)
         
         # SALIDA
-        output_label = QLabel("Salida:", self.parent)
+        output_label = _WhiteLabel("Salida:", self.parent)
         output_label.setGeometry(30, 92 + self.y_offset, 80, 28)
-        output_label.setStyleSheet("color: white; font-size: 12pt;")
         
         output_entry = QLineEdit(self.parent)
         output_entry.setGeometry(120, 92 + self.y_offset, 350, 27)
         
         output_file_btn = QPushButton("📄 Archivo", self.parent)
         output_file_btn.setGeometry(480, 92 + self.y_offset, 90, 27)
-        output_file_btn.setStyleSheet("background-color: #0071bc; color: white;")
-        output_file_btn.setToolTip("Guardar como archivo")
+        output_file_btn.setStyleSheet(_BG_PRIMARY)
+        output_file_btn.setProperty("ttKey", "saveAs")
         
         output_folder_btn = QPushButton("📁 Carpeta", self.parent)
         output_folder_btn.setGeometry(580, 92 + self.y_offset, 90, 27)
-        output_folder_btn.setStyleSheet("background-color: #0071bc; color: white;")
-        output_folder_btn.setToolTip("Seleccionar carpeta de salida")
+        output_folder_btn.setStyleSheet(_BG_PRIMARY)
+        output_folder_btn.setProperty("ttKey", "outputFolder")
         
         # === COLUMNA DERECHA: PISTAS EXTERNAS ===
         
         # AUDIO EXTERNO
-        audio_label = QLabel("Audio:", self.parent)
+        audio_label = _WhiteLabel("Audio:", self.parent)
         audio_label.setGeometry(720, 52 + self.y_offset, 100, 28)
-        audio_label.setStyleSheet("color: white; font-size: 12pt;")
         
         audio_entry = QLineEdit(self.parent)
         audio_entry.setGeometry(830, 52 + self.y_offset, 350, 27)
@@ -155,16 +218,15 @@ class AssemblerUIBuilder:
         
         audio_file_btn = QPushButton("📄 Archivo", self.parent)
         audio_file_btn.setGeometry(1190, 52 + self.y_offset, 90, 27)
-        audio_file_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        audio_file_btn.setStyleSheet(_BG_PRIMARY)
         
         audio_folder_btn = QPushButton("📁 Carpeta", self.parent)
         audio_folder_btn.setGeometry(1290, 52 + self.y_offset, 90, 27)
-        audio_folder_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        audio_folder_btn.setStyleSheet(_BG_PRIMARY)
         
         # SUBTÍTULOS EXTERNOS
-        subtitle_label = QLabel("Subtítulos:", self.parent)
+        subtitle_label = _WhiteLabel("Subtítulos:", self.parent)
         subtitle_label.setGeometry(720, 92 + self.y_offset, 100, 28)
-        subtitle_label.setStyleSheet("color: white; font-size: 12pt;")
         
         subtitle_entry = QLineEdit(self.parent)
         subtitle_entry.setGeometry(830, 92 + self.y_offset, 350, 27)
@@ -172,16 +234,15 @@ class AssemblerUIBuilder:
         
         subtitle_file_btn = QPushButton("📄 Archivo", self.parent)
         subtitle_file_btn.setGeometry(1190, 92 + self.y_offset, 90, 27)
-        subtitle_file_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        subtitle_file_btn.setStyleSheet(_BG_PRIMARY)
         
         subtitle_folder_btn = QPushButton("📁 Carpeta", self.parent)
         subtitle_folder_btn.setGeometry(1290, 92 + self.y_offset, 90, 27)
-        subtitle_folder_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        subtitle_folder_btn.setStyleSheet(_BG_PRIMARY)
         
         # LETREROS (FORCED) EXTERNOS
-        forced_label = QLabel("Letreros:", self.parent)
+        forced_label = _WhiteLabel("Letreros:", self.parent)
         forced_label.setGeometry(720, 132 + self.y_offset, 100, 28)
-        forced_label.setStyleSheet("color: white; font-size: 12pt;")
         
         forced_entry = QLineEdit(self.parent)
         forced_entry.setGeometry(830, 132 + self.y_offset, 350, 27)
@@ -189,17 +250,17 @@ class AssemblerUIBuilder:
         
         forced_file_btn = QPushButton("📄 Archivo", self.parent)
         forced_file_btn.setGeometry(1190, 132 + self.y_offset, 90, 27)
-        forced_file_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        forced_file_btn.setStyleSheet(_BG_PRIMARY)
         
         forced_folder_btn = QPushButton("📁 Carpeta", self.parent)
         forced_folder_btn.setGeometry(1290, 132 + self.y_offset, 90, 27)
-        forced_folder_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        forced_folder_btn.setStyleSheet(_BG_PRIMARY)
         
         # === ESCANEO Y SELECTOR DE EPISODIO (siempre visible) ===
         # Reubicado en el espacio vacío a la derecha
         scan_btn = QPushButton("🔍 Escanear Carpetas", self.parent)
         scan_btn.setGeometry(1400, 52 + self.y_offset, 180, 35)
-        scan_btn.setStyleSheet("background-color: #0071bc; color: white; font-size: 11pt;")
+        scan_btn.setStyleSheet(_BG_PRIMARY_11PT)
         
         episode_label = QLabel("Episodio:", self.parent)
         episode_label.setGeometry(1400, 97 + self.y_offset, 80, 28)
@@ -244,7 +305,7 @@ class AssemblerUIBuilder:
         # Botón cargar preview
         load_preview_btn = QPushButton("▶ Cargar Preview", self.parent)
         load_preview_btn.setGeometry(822, 180 + self.y_offset, 253, 43)
-        load_preview_btn.setStyleSheet("background-color: #0071bc; color: white; font-size: 14pt;")
+        load_preview_btn.setStyleSheet(_BG_PRIMARY_14PT)
         
         # Panel de control de video
         panel_video = QFrame(self.parent)
@@ -259,25 +320,25 @@ class AssemblerUIBuilder:
         time_label = QLabel("Time: 0:00:00/0:00:00", self.parent)
         time_label.setGeometry(834, 283 + self.y_offset, 228, 30)
         time_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        time_label.setStyleSheet("color: white; font-size: 13pt; background: transparent;")
+        time_label.setStyleSheet(_LABEL_13PT_STYLE)
         time_label.setFont(QFont("Consolas", 11))
         
         # Navegación
         nav_btn_minus10 = QPushButton("◀◀ -10s", self.parent)
         nav_btn_minus10.setGeometry(807, 350 + self.y_offset, 60, 39)
-        nav_btn_minus10.setStyleSheet("background-color: #0071bc; color: white; font-size: 9pt;")
+        nav_btn_minus10.setStyleSheet(_BG_PRIMARY_9PT)
         
         nav_btn_minus1 = QPushButton("◀ -1s", self.parent)
         nav_btn_minus1.setGeometry(878, 350 + self.y_offset, 65, 39)
-        nav_btn_minus1.setStyleSheet("background-color: #0071bc; color: white; font-size: 9pt;")
+        nav_btn_minus1.setStyleSheet(_BG_PRIMARY_9PT)
         
         nav_btn_plus1 = QPushButton("+1s ▶", self.parent)
         nav_btn_plus1.setGeometry(953, 350 + self.y_offset, 60, 39)
-        nav_btn_plus1.setStyleSheet("background-color: #0071bc; color: white; font-size: 9pt;")
+        nav_btn_plus1.setStyleSheet(_BG_PRIMARY_9PT)
         
         nav_btn_plus10 = QPushButton("+10s ▶▶", self.parent)
         nav_btn_plus10.setGeometry(1024, 350 + self.y_offset, 65, 39)
-        nav_btn_plus10.setStyleSheet("background-color: #0071bc; color: white; font-size: 9pt;")
+        nav_btn_plus10.setStyleSheet(_BG_PRIMARY_9PT)
         
         # Play/Stop
         play_btn = QPushButton("▶", self.parent)
@@ -304,7 +365,7 @@ class AssemblerUIBuilder:
         # === SELECTOR DE AUDIO ===
         audio_frame = QFrame(self.parent)
         audio_frame.setGeometry(822, 455 + self.y_offset, 253, 156)
-        audio_frame.setStyleSheet("background-color: #2b2b2b; border: 2px solid #555; border-radius: 5px;")
+        audio_frame.setStyleSheet(_TRACK_FRAME_STYLE)
         
         audio_title = QLabel("🎵 Pista de Audio", self.parent)
         audio_title.setGeometry(822, 465 + self.y_offset, 253, 30)
@@ -323,7 +384,7 @@ class AssemblerUIBuilder:
         # === SELECTOR DE SUBTÍTULOS ===
         subtitle_frame = QFrame(self.parent)
         subtitle_frame.setGeometry(1101, 180 + self.y_offset, 766, 431)
-        subtitle_frame.setStyleSheet("background-color: #2b2b2b; border: 2px solid #555; border-radius: 5px;")
+        subtitle_frame.setStyleSheet(_TRACK_FRAME_STYLE)
         
         subtitle_title = QLabel("📝 Pista de Subtítulos", self.parent)
         subtitle_title.setGeometry(1101, 195 + self.y_offset, 766, 35)
@@ -332,7 +393,7 @@ class AssemblerUIBuilder:
         
         subtitle_track_label = QLabel("Seleccionar pista para preview:", self.parent)
         subtitle_track_label.setGeometry(1121, 250 + self.y_offset, 726, 30)
-        subtitle_track_label.setStyleSheet("color: white; font-size: 13pt; background: transparent;")
+        subtitle_track_label.setStyleSheet(_LABEL_13PT_STYLE)
         
         subtitle_track_combo = QComboBox(self.parent)
         subtitle_track_combo.setGeometry(1121, 290 + self.y_offset, 726, 35)
@@ -365,6 +426,7 @@ class AssemblerUIBuilder:
         progress_bar = QProgressBar(self.parent)
         progress_bar.setGeometry(47, 923 + self.y_offset, 738, 16)
         progress_bar.setValue(0)
+        progress_bar.setTextVisible(False)  # El porcentaje lo muestra progress_label
         
         progress_label = QLabel("0%", self.parent)
         progress_label.setGeometry(389, 944 + self.y_offset, 100, 40)
@@ -4,7 +4,7 @@ DualSync Layout Builder - Constructor de layouts para DualSyncTab
 Usa layouts profesionales con dual preview (JP y LAT lado a lado)
 para sincronización de audio y subtítulos.
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QComboBox, QPushButton
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QComboBox, QPushButton, QLabel
 from PyQt6.QtCore import Qt
 from dataclasses import dataclass
 
@@ -14,7 +14,7 @@ from ..widgets import FileInputGroup, SyncControls, ConsoleLog, ProgressPanel, D
 from ..widgets.simple_preview_panel import SimplePreviewPanel
 
 
-@dataclass
+@dataclass(slots=True)
 class DualSyncWidgets:
     """Contenedor de widgets del DualSyncTab"""
     # Selectores de archivos
@@ -111,7 +111,6 @@ class DualSyncLayoutBuilder(BaseLayoutBuilder):
         self.scan_btn.setMinimumHeight(35)
         scan_layout.addWidget(self.scan_btn)
         
-        from PyQt6.QtWidgets import QLabel
         ep_label = QLabel("Episodio:")
         ep_label.setStyleSheet(self.theme.get_label_style('primary'))
         scan_layout.addWidget(ep_label)
@@ -141,17 +140,13 @@ class DualSyncLayoutBuilder(BaseLayoutBuilder):
         self.load_preview_btn.setMinimumHeight(35)
         main_layout.addWidget(self.load_preview_btn)
         
-        # Dual preview (lado a lado)
-        preview_layout = QHBoxLayout()
-        preview_layout.setSpacing(self.theme.get_spacing('md'))
-        
+        # Dual preview (lado a lado) en un splitter redimensionable
         # Preview JP (sin controles)
         self.preview_jp = SimplePreviewPanel(
             title="🇯🇵 Preview Japonés",
             min_width=400,
             min_height=300
         )
-        preview_layout.addWidget(self.preview_jp, stretch=1)
         
         # Preview LAT (sin controles)
         self.preview_lat = SimplePreviewPanel(
@@ -159,9 +154,15 @@ class DualSyncLayoutBuilder(BaseLayoutBuilder):
             min_width=400,
             min_height=300
         )
-        preview_layout.addWidget(self.preview_lat, stretch=1)
         
-        main_layout.addLayout(preview_layout, stretch=1)
+        splitter = self.factory.create_splitter(
+            widgets=[self.preview_jp, self.preview_lat],
+            orientation=Qt.Orientation.Horizontal,
+            stretch_factors=[1, 1],
+            sizes=[1, 1]
+        )
+        splitter.setChildrenCollapsible(False)
+        main_layout.addWidget(splitter, stretch=1)
         
         # Controles centralizados (en medio)
         self.dual_controls = DualPreviewControls()
@@ -9,10 +9,64 @@ from PyQt6.QtWidgets import (QWidget, QLabel, QLineEdit, QPushButton, QFrame,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 from dataclasses import dataclass
+from typing import Optional
 from ..widgets import SyncControls, ConsoleLog
 
 
-@dataclass
+# Stylesheet único del tab: cada widget se asocia por objectName
+_DUALSYNC_QSS = """
+QPushButton#blueBtn { background-color: #0071bc; color: white; }
+QPushButton#blueBtn9 { background-color: #0071bc; color: white; font-size: 9pt; }
+QPushButton#blueBtn12 { background-color: #0071bc; color: white; font-size: 12pt; }
+QPushButton#blueBtn14 { background-color: #0071bc; color: white; font-size: 14pt; }
+QPushButton#greenBtn { background-color: #22b573; color: white; font-size: 20pt; }
+QPushButton#redBtn { background-color: red; color: white; font-size: 20pt; }
+QPushButton#processBtn { background-color: #22b573; color: white; font-size: 24pt; font-weight: bold; }
+QFrame#blackFrame { background-color: black; }
+QFrame#grayPanel { background-color: #666; }
+QLabel#whiteLabel { color: white; }
+QLabel#whiteLabel11 { color: white; font-size: 11pt; }
+QLabel#whiteLabel13 { color: white; font-size: 13pt; background: transparent; }
+QLabel#whiteLabel16 { color: white; font-size: 16pt; background: transparent; }
+"""
+
+# Fuentes compartidas (se crean una vez, tras existir la QApplication)
+_FONT_CONSOLAS_11 = None
+_FONT_SEGOE_18 = None
+
+
+def _init_fonts():
+    """Crea las fuentes compartidas la primera vez que se construye la UI"""
+    global _FONT_CONSOLAS_11, _FONT_SEGOE_18
+    if _FONT_CONSOLAS_11 is None:
+        _FONT_CONSOLAS_11 = QFont("Consolas", 11)
+        _FONT_SEGOE_18 = QFont("Segoe UI", 18)
+
+
+# Tablas de botones: (nombre, texto, geometría sin y_offset[, tooltip/objectName])
+_FILE_BUTTONS = (
+    ('jp_file_btn', "📄 Archivo", (580, 132, 80, 27), None),
+    ('jp_folder_btn', "📁 Carpeta", (670, 132, 80, 27), None),
+    ('es_file_btn', "📄 Archivo", (1190, 132, 80, 27), None),
+    ('es_folder_btn', "📁 Carpeta", (1280, 132, 80, 27), None),
+    ('output_file_btn', "📄", (1760, 132, 40, 27), "Guardar como archivo"),
+    ('output_folder_btn', "📁", (1810, 132, 40, 27), "Seleccionar carpeta"),
+)
+
+_NAV_BUTTONS = (
+    ('nav_btn_minus10', "◀◀ -10s", (819, 549, 60, 39)),
+    ('nav_btn_minus1', "◀ -1s", (890, 549, 65, 39)),
+    ('nav_btn_plus1', "+1s ▶", (965, 549, 60, 39)),
+    ('nav_btn_plus10', "+10s ▶▶", (1036, 550, 65, 39)),
+)
+
+_PLAYBACK_BUTTONS = (
+    ('play_btn', "▶", (841, 596, 94, 41), "greenBtn"),
+    ('stop_btn', "⏹", (985, 596, 94, 41), "redBtn"),
+)
+
+
+@dataclass(slots=True)
 class DualSyncWidgets:
     """Contenedor de todos los widgets del DualSync tab"""
     # Selectores
@@ -26,11 +80,6 @@ class DualSyncWidgets:
     output_file_btn: QPushButton
     output_folder_btn: QPushButton
     
-    # Escaneo y episodios
-    scan_btn: QPushButton
-    ep_label: QLabel
-    episode_combo: QComboBox
-    
     # Frames de preview
     preview_jp_frame: QFrame
     preview_lat_frame: QFrame
@@ -66,6 +115,11 @@ class DualSyncWidgets:
     # Progress
     progress_bar: QProgressBar
     progress_label: QLabel
+    
+    # Escaneo y episodios (se crean bajo demanda con ensure_scan_widgets)
+    scan_btn: Optional[QPushButton] = None
+    ep_label: Optional[QLabel] = None
+    episode_combo: Optional[QComboBox] = None
 
 
 class DualSyncUIBuilder:
@@ -84,6 +138,7 @@ class DualSyncUIBuilder:
         """
         self.parent = parent
         self.y_offset = -80  # Offset vertical para ajustar posiciones
+        self._scan_built = False
     
     def build(self) -> DualSyncWidgets:
         """
@@ -92,24 +147,30 @@ class DualSyncUIBuilder:
         Returns:
             DualSyncWidgets con referencias a todos los widgets
         """
-        self.parent.setMinimumSize(1920, 1080)
-        
-        # Construir secciones
-        selectors = self._build_file_selectors()
-        scan_widgets = self._build_scan_section()
-        preview_frames = self._build_preview_frames()
-        central_panel = self._build_central_panel()
-        
-        # Crear widgets reutilizables
-        sync_controls_widget = self._build_sync_controls_widget()
-        console_widget = self._build_console_widget()
-        
-        process_controls = self._build_process_controls()
+        # Sin repintados intermedios mientras se crean los widgets
+        self.parent.setUpdatesEnabled(False)
+        try:
+            self.parent.setMinimumSize(1920, 1080)
+            self.parent.setStyleSheet(_DUALSYNC_QSS)
+            _init_fonts()
+            
+            # Construir secciones
+            selectors = self._build_file_selectors()
+            preview_frames = self._build_preview_frames()
+            central_panel = self._build_central_panel()
+            
+            # Crear widgets reutilizables
+            sync_controls_widget = self._build_sync_controls_widget()
+            console_widget = self._build_console_widget()
+            
+            process_controls = self._build_process_controls()
+        finally:
+            self.parent.setUpdatesEnabled(True)
+            self.parent.update()
         
         # Retornar todos los widgets
         return DualSyncWidgets(
             **selectors,
-            **scan_widgets,
             **preview_frames,
             **central_panel,
             sync_controls=sync_controls_widget,
@@ -117,92 +178,105 @@ class DualSyncUIBuilder:
             **process_controls
         )
     
+    def _mk_button(self, text: str, geom: tuple, object_name: str = "blueBtn",
+                   tooltip: str = None) -> QPushButton:
+        """
+        Crea un botón aplicando geometría (con y_offset), estilo y tooltip.
+        
+        Args:
+            text: Texto del botón
+            geom: Tupla (x, y, ancho, alto) sin y_offset
+            object_name: objectName que selecciona su regla en _DUALSYNC_QSS
+            tooltip: Tooltip opcional
+            
+        Returns:
+            QPushButton configurado
+        """
+        x, y, w, h = geom
+        btn = QPushButton(text, self.parent)
+        btn.setGeometry(x, y + self.y_offset, w, h)
+        btn.setObjectName(object_name)
+        if tooltip:
+            btn.setToolTip(tooltip)
+        return btn
+    
     def _build_file_selectors(self) -> dict:
         """Construye selectores de archivos JP, ES y Salida"""
+        yo = self.y_offset
+        
         # === SELECTORES DUALES JP ===
-        QLabel("JP", self.parent).setGeometry(180, 132 + self.y_offset, 40, 28)
+        QLabel("JP", self.parent).setGeometry(180, 132 + yo, 40, 28)
         jp_entry = QLineEdit(self.parent)
-        jp_entry.setGeometry(230, 132 + self.y_offset, 340, 27)
-        
-        jp_file_btn = QPushButton("📄 Archivo", self.parent)
-        jp_file_btn.setGeometry(580, 132 + self.y_offset, 80, 27)
-        jp_file_btn.setStyleSheet("background-color: #0071bc; color: white;")
-        
-        jp_folder_btn = QPushButton("📁 Carpeta", self.parent)
-        jp_folder_btn.setGeometry(670, 132 + self.y_offset, 80, 27)
-        jp_folder_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        jp_entry.setGeometry(230, 132 + yo, 340, 27)
         
         # === SELECTORES DUALES ES ===
-        QLabel("ES", self.parent).setGeometry(790, 132 + self.y_offset, 40, 28)
+        QLabel("ES", self.parent).setGeometry(790, 132 + yo, 40, 28)
         es_entry = QLineEdit(self.parent)
-        es_entry.setGeometry(840, 132 + self.y_offset, 340, 27)
-        
-        es_file_btn = QPushButton("📄 Archivo", self.parent)
-        es_file_btn.setGeometry(1190, 132 + self.y_offset, 80, 27)
-        es_file_btn.setStyleSheet("background-color: #0071bc; color: white;")
-        
-        es_folder_btn = QPushButton("📁 Carpeta", self.parent)
-        es_folder_btn.setGeometry(1280, 132 + self.y_offset, 80, 27)
-        es_folder_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        es_entry.setGeometry(840, 132 + yo, 340, 27)
         
         # === SELECTOR DE SALIDA ===
-        QLabel("Salida", self.parent).setGeometry(1400, 132 + self.y_offset, 60, 28)
+        QLabel("Salida", self.parent).setGeometry(1400, 132 + yo, 60, 28)
         output_entry = QLineEdit(self.parent)
-        output_entry.setGeometry(1470, 132 + self.y_offset, 280, 27)
-        
-        output_file_btn = QPushButton("📄", self.parent)
-        output_file_btn.setGeometry(1760, 132 + self.y_offset, 40, 27)
-        output_file_btn.setStyleSheet("background-color: #0071bc; color: white;")
-        output_file_btn.setToolTip("Guardar como archivo")
+        output_entry.setGeometry(1470, 132 + yo, 280, 27)
         
-        output_folder_btn = QPushButton("📁", self.parent)
-        output_folder_btn.setGeometry(1810, 132 + self.y_offset, 40, 27)
-        output_folder_btn.setStyleSheet("background-color: #0071bc; color: white;")
-        output_folder_btn.setToolTip("Seleccionar carpeta")
-        
-        return {
-            'jp_entry': jp_entry,
-            'jp_file_btn': jp_file_btn,
-            'jp_folder_btn': jp_folder_btn,
-            'es_entry': es_entry,
-            'es_file_btn': es_file_btn,
-            'es_folder_btn': es_folder_btn,
-            'output_entry': output_entry,
-            'output_file_btn': output_file_btn,
-            'output_folder_btn': output_folder_btn,
+        # Botones 📄/📁 de los tres selectores
+        widgets = {
+            name: self._mk_button(text, geom, tooltip=tooltip)
+            for name, text, geom, tooltip in _FILE_BUTTONS
         }
+        widgets['jp_entry'] = jp_entry
+        widgets['es_entry'] = es_entry
+        widgets['output_entry'] = output_entry
+        return widgets
     
-    def _build_scan_section(self) -> dict:
-        """Construye sección de escaneo y selector de episodio"""
+    def ensure_scan_widgets(self, widgets: DualSyncWidgets) -> DualSyncWidgets:
+        """
+        Crea la sección de escaneo la primera vez que se necesita.
+        
+        Los widgets de escaneo solo se usan en modo carpetas, así que no se
+        construyen en build(). Llamadas posteriores no hacen nada.
+        
+        Args:
+            widgets: Contenedor retornado por build()
+            
+        Returns:
+            El mismo contenedor con scan_btn, ep_label y episode_combo asignados
+        """
+        if self._scan_built:
+            return widgets
+        
+        yo = self.y_offset
         scan_btn = QPushButton("🔍 Escanear", self.parent)
-        scan_btn.setGeometry(700, 170 + self.y_offset, 150, 35)
-        scan_btn.setStyleSheet("background-color: #0071bc; color: white; font-size: 12pt;")
-        scan_btn.hide()
+        scan_btn.setGeometry(700, 170 + yo, 150, 35)
+        scan_btn.setObjectName("blueBtn12")
         
         ep_label = QLabel("Episodio:", self.parent)
-        ep_label.setGeometry(920, 170 + self.y_offset, 100, 35)
-        ep_label.setStyleSheet("color: white; font-size: 11pt;")
-        ep_label.hide()
+        ep_label.setGeometry(920, 170 + yo, 100, 35)
+        ep_label.setObjectName("whiteLabel11")
         
         episode_combo = QComboBox(self.parent)
-        episode_combo.setGeometry(1020, 175 + self.y_offset, 120, 27)
-        episode_combo.hide()
+        episode_combo.setGeometry(1020, 175 + yo, 120, 27)
         
-        return {
-            'scan_btn': scan_btn,
-            'ep_label': ep_label,
-            'episode_combo': episode_combo,
-        }
+        for widget in (scan_btn, ep_label, episode_combo):
+            widget.show()
+        
+        widgets.scan_btn = scan_btn
+        widgets.ep_label = ep_label
+        widgets.episode_combo = episode_combo
+        self._scan_built = True
+        return widgets
     
     def _build_preview_frames(self) -> dict:
         """Construye frames de preview"""
+        yo = self.y_offset
+        
         preview_jp_frame = QFrame(self.parent)
-        preview_jp_frame.setGeometry(42, 206 + self.y_offset, 766, 431)
-        preview_jp_frame.setStyleSheet("background-color: black;")
+        preview_jp_frame.setGeometry(42, 206 + yo, 766, 431)
+        preview_jp_frame.setObjectName("blackFrame")
         
         preview_lat_frame = QFrame(self.parent)
-        preview_lat_frame.setGeometry(1113, 206 + self.y_offset, 766, 431)
-        preview_lat_frame.setStyleSheet("background-color: black;")
+        preview_lat_frame.setGeometry(1113, 206 + yo, 766, 431)
+        preview_lat_frame.setObjectName("blackFrame")
         
         return {
             'preview_jp_frame': preview_jp_frame,
@@ -211,90 +285,66 @@ class DualSyncUIBuilder:
     
     def _build_central_panel(self) -> dict:
         """Construye panel central con controles de video"""
+        yo = self.y_offset
+        align_center = Qt.AlignmentFlag.AlignCenter
+        
         # Botón cargar preview
         load_preview_btn = QPushButton("Cargar Preview", self.parent)
-        load_preview_btn.setGeometry(834, 210 + self.y_offset, 253, 43)
-        load_preview_btn.setStyleSheet("background-color: #0071bc; color: white; font-size: 14pt;")
+        load_preview_btn.setGeometry(834, 210 + yo, 253, 43)
+        load_preview_btn.setObjectName("blueBtn14")
         
         # Panel Video 1
         panel_video1 = QFrame(self.parent)
-        panel_video1.setGeometry(833, 264 + self.y_offset, 254, 127)
-        panel_video1.setStyleSheet("background-color: #666;")
+        panel_video1.setGeometry(833, 264 + yo, 254, 127)
+        panel_video1.setObjectName("grayPanel")
         
         label_video1 = QLabel("Video 1", self.parent)
-        label_video1.setGeometry(833, 280 + self.y_offset, 254, 30)
-        label_video1.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label_video1.setStyleSheet("color: white; font-size: 16pt; background: transparent;")
+        label_video1.setGeometry(833, 280 + yo, 254, 30)
+        label_video1.setAlignment(align_center)
+        label_video1.setObjectName("whiteLabel16")
         
         time_label_jp = QLabel("Time: 0:00:00/0:00:00", self.parent)
-        time_label_jp.setGeometry(846, 318 + self.y_offset, 228, 30)
-        time_label_jp.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        time_label_jp.setStyleSheet("color: white; font-size: 13pt; background: transparent;")
-        time_label_jp.setFont(QFont("Consolas", 11))
+        time_label_jp.setGeometry(846, 318 + yo, 228, 30)
+        time_label_jp.setAlignment(align_center)
+        time_label_jp.setObjectName("whiteLabel13")
+        time_label_jp.setFont(_FONT_CONSOLAS_11)
         
-        mute_jp_btn = QPushButton("Mute", self.parent)
-        mute_jp_btn.setGeometry(922, 347 + self.y_offset, 81, 32)
-        mute_jp_btn.setStyleSheet("background-color: #0071bc; color: white;")
+        mute_jp_btn = self._mk_button("Mute", (922, 347, 81, 32))
         
         # Panel Video 2
         panel_video2 = QFrame(self.parent)
-        panel_video2.setGeometry(833, 399 + self.y_offset, 254, 128)
-        panel_video2.setStyleSheet("background-color: #666;")
+        panel_video2.setGeometry(833, 399 + yo, 254, 128)
+        panel_video2.setObjectName("grayPanel")
         
         label_video2 = QLabel("Video 2", self.parent)
-        label_video2.setGeometry(833, 415 + self.y_offset, 254, 30)
-        label_video2.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label_video2.setStyleSheet("color: white; font-size: 16pt; background: transparent;")
+        label_video2.setGeometry(833, 415 + yo, 254, 30)
+        label_video2.setAlignment(align_center)
+        label_video2.setObjectName("whiteLabel16")
         
         time_label_lat = QLabel("Time: 0:00:00/0:00:00", self.parent)
-        time_label_lat.setGeometry(846, 453 + self.y_offset, 228, 30)
-        time_label_lat.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        time_label_lat.setStyleSheet("color: white; font-size: 13pt; background: transparent;")
-        time_label_lat.setFont(QFont("Consolas", 11))
-        
-        mute_lat_btn = QPushButton("Mute", self.parent)
-        mute_lat_btn.setGeometry(919, 484 + self.y_offset, 81, 32)
-        mute_lat_btn.setStyleSheet("background-color: #0071bc; color: white;")
-        
-        # Navegación
-        nav_btn_minus10 = QPushButton("◀◀ -10s", self.parent)
-        nav_btn_minus10.setGeometry(819, 549 + self.y_offset, 60, 39)
-        nav_btn_minus10.setStyleSheet("background-color: #0071bc; color: white; font-size: 9pt;")
-        
-        nav_btn_minus1 = QPushButton("◀ -1s", self.parent)
-        nav_btn_minus1.setGeometry(890, 549 + self.y_offset, 65, 39)
-        nav_btn_minus1.setStyleSheet("background-color: #0071bc; color: white; font-size: 9pt;")
+        time_label_lat.setGeometry(846, 453 + yo, 228, 30)
+        time_label_lat.setAlignment(align_center)
+        time_label_lat.setObjectName("whiteLabel13")
+        time_label_lat.setFont(_FONT_CONSOLAS_11)
         
-        nav_btn_plus1 = QPushButton("+1s ▶", self.parent)
-        nav_btn_plus1.setGeometry(965, 549 + self.y_offset, 60, 39)
-        nav_btn_plus1.setStyleSheet("background-color: #0071bc; color: white; font-size: 9pt;")
+        mute_lat_btn = self._mk_button("Mute", (919, 484, 81, 32))
         
-        nav_btn_plus10 = QPushButton("+10s ▶▶", self.parent)
-        nav_btn_plus10.setGeometry(1036, 550 + self.y_offset, 65, 39)
-        nav_btn_plus10.setStyleSheet("background-color: #0071bc; color: white; font-size: 9pt;")
-        
-        # Play/Stop
-        play_btn = QPushButton("▶", self.parent)
-        play_btn.setGeometry(841, 596 + self.y_offset, 94, 41)
-        play_btn.setStyleSheet("background-color: #22b573; color: white; font-size: 20pt;")
-        
-        stop_btn = QPushButton("⏹", self.parent)
-        stop_btn.setGeometry(985, 596 + self.y_offset, 94, 41)
-        stop_btn.setStyleSheet("background-color: red; color: white; font-size: 20pt;")
-        
-        return {
-            'load_preview_btn': load_preview_btn,
-            'time_label_jp': time_label_jp,
-            'time_label_lat': time_label_lat,
-            'mute_jp_btn': mute_jp_btn,
-            'mute_lat_btn': mute_lat_btn,
-            'nav_btn_minus10': nav_btn_minus10,
-            'nav_btn_minus1': nav_btn_minus1,
-            'nav_btn_plus1': nav_btn_plus1,
-            'nav_btn_plus10': nav_btn_plus10,
-            'play_btn': play_btn,
-            'stop_btn': stop_btn,
+        # Navegación y Play/Stop
+        widgets = {
+            name: self._mk_button(text, geom, "blueBtn9")
+            for name, text, geom in _NAV_BUTTONS
         }
+        for name, text, geom, object_name in _PLAYBACK_BUTTONS:
+            widgets[name] = self._mk_button(text, geom, object_name)
+        
+        widgets.update(
+            load_preview_btn=load_preview_btn,
+            time_label_jp=time_label_jp,
+            time_label_lat=time_label_lat,
+            mute_jp_btn=mute_jp_btn,
+            mute_lat_btn=mute_lat_btn,
+        )
+        return widgets
     
     def _build_sync_controls_widget(self) -> SyncControls:
         """Crea el widget SyncControls"""
@@ -310,19 +360,22 @@ class DualSyncUIBuilder:
     
     def _build_process_controls(self) -> dict:
         """Construye botón de procesamiento y barra de progreso"""
+        yo = self.y_offset
+        align_center = Qt.AlignmentFlag.AlignCenter
+        
         batch_btn = QPushButton("Remuxear", self.parent)
-        batch_btn.setGeometry(245, 879 + self.y_offset, 342, 60)
-        batch_btn.setStyleSheet("background-color: #22b573; color: white; font-size: 24pt; font-weight: bold;")
+        batch_btn.setGeometry(245, 879 + yo, 342, 60)
+        batch_btn.setObjectName("processBtn")
         
         progress_bar = QProgressBar(self.parent)
-        progress_bar.setGeometry(47, 1003 + self.y_offset, 738, 16)
+        progress_bar.setGeometry(47, 1003 + yo, 738, 16)
         progress_bar.setValue(0)
         
         progress_label = QLabel("0%", self.parent)
-        progress_label.setGeometry(389, 1024 + self.y_offset, 100, 40)
-        progress_label.setFont(QFont("Segoe UI", 18))
-        progress_label.setStyleSheet("color: white;")
-        progress_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        progress_label.setGeometry(389, 1024 + yo, 100, 40)
+        progress_label.setFont(_FONT_SEGOE_18)
+        progress_label.setObjectName("whiteLabel")
+        progress_label.setAlignment(align_center)
         
         return {
             'batch_btn': batch_btn,
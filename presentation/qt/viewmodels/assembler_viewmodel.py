@@ -3,15 +3,36 @@ Assembler ViewModel - ViewModel para Assembler Tab
 
 Maneja la lógica de ensamblado de video con pistas externas.
 """
+import threading
+from collections import deque
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from .base_viewmodel import BaseViewModel
-from ..workers import RemuxWorker
+from ..workers import Worker, remux_task, EpisodeRemuxRunnable, EpisodeRemuxSignals, start_worker, max_parallel_remux
 from core.domain.models import RemuxJob, Track
 from core.domain.enums import TrackType, LanguageCode
 
 
+# Pistas prototipo: cada remuxeo solo cambia archivo, offset e id con replace()
+_AUDIO_ES_LAT_PROTO = Track(
+    id=0,
+    type=TrackType.AUDIO,
+    codec="copy",
+    language=LanguageCode.SPANISH_LATIN,
+    title="Español Latino",
+    is_default=True
+)
+_SUBTITLE_ES_LAT_PROTO = replace(_AUDIO_ES_LAT_PROTO, type=TrackType.SUBTITLE)
+_FORCED_ES_LAT_PROTO = replace(
+    _SUBTITLE_ES_LAT_PROTO,
+    title="Letreros",  # Título descriptivo para forzados
+    is_forced=True,
+    is_default=False  # Los letreros no son default
+)
+
+
 class AssemblerViewModel(BaseViewModel):
     """
     ViewModel para el tab Assembler.
@@ -22,7 +43,20 @@ class AssemblerViewModel(BaseViewModel):
     
     def __init__(self, remux_service):
         super().__init__(remux_service)
-        self.current_worker: Optional[RemuxWorker] = None
+        self.current_worker: Optional[Worker] = None
+        # (huella de episodios, Episode convertidos) del último lote
+        self._episodes_cache: tuple[Any, dict] = (None, {})
+        
+        # Episodios del lote en paralelo sobre el pool global, con envío acotado
+        self._batch_max_running = max_parallel_remux()
+        self._batch_queue: deque = deque()
+        self._batch_running = 0
+        self._batch_signals: Optional[EpisodeRemuxSignals] = None
+        self._batch_cancel = threading.Event()
+        self._batch_progress: dict = {}
+        self._batch_pending = 0
+        self._batch_successful = 0
+        self._batch_failed = 0
     
     def start_remux(
         self,
@@ -59,46 +93,28 @@ class AssemblerViewModel(BaseViewModel):
             # Crear tracks
             audio_tracks = []
             if audio_path:
-                audio_track = Track(
-                    id=0,
-                    type=TrackType.AUDIO,
-                    codec="copy",
-                    language=LanguageCode.SPANISH_LATIN,
-                    title="Español Latino",  # Título descriptivo
-                    file_path=Path(audio_path),  # Ruta del archivo
-                    offset_ms=audio_offset_ms,
-                    is_default=True
-                )
-                audio_tracks.append(audio_track)
+                audio_tracks.append(replace(
+                    _AUDIO_ES_LAT_PROTO,
+                    file_path=Path(audio_path),
+                    offset_ms=audio_offset_ms
+                ))
             
             subtitle_tracks = []
             if subtitle_path:
-                subtitle_track = Track(
-                    id=0,
-                    type=TrackType.SUBTITLE,
-                    codec="copy",
-                    language=LanguageCode.SPANISH_LATIN,
-                    title="Español Latino",  # Título descriptivo
-                    file_path=Path(subtitle_path),  # Ruta del archivo
-                    offset_ms=subtitle_offset_ms,
-                    is_default=True
-                )
-                subtitle_tracks.append(subtitle_track)
+                subtitle_tracks.append(replace(
+                    _SUBTITLE_ES_LAT_PROTO,
+                    file_path=Path(subtitle_path),
+                    offset_ms=subtitle_offset_ms
+                ))
             
             # Agregar letreros (forced subtitles) si existen
             if forced_path:
-                forced_track = Track(
+                subtitle_tracks.append(replace(
+                    _FORCED_ES_LAT_PROTO,
                     id=len(subtitle_tracks),
-                    type=TrackType.SUBTITLE,
-                    codec="copy",
-                    language=LanguageCode.SPANISH_LATIN,
-                    title="Letreros",  # Título descriptivo para forzados
-                    file_path=Path(forced_path),  # Ruta del archivo
-                    offset_ms=subtitle_offset_ms,
-                    is_forced=True,
-                    is_default=False  # Los letreros no son default
-                )
-                subtitle_tracks.append(forced_track)
+                    file_path=Path(forced_path),
+                    offset_ms=subtitle_offset_ms
+                ))
             
             # Crear job
             job = RemuxJob(
@@ -111,18 +127,19 @@ class AssemblerViewModel(BaseViewModel):
             )
             
             # Crear y configurar worker
-            self.current_worker = RemuxWorker(job, self.remux_service)
+            self.current_worker = Worker(remux_task, job, self.remux_service)
             
             # Conectar signals
-            self.current_worker.progress.connect(self.emit_progress)
-            self.current_worker.status.connect(self.emit_status)
-            self.current_worker.log.connect(self.log)
-            self.current_worker.finished.connect(self._on_remux_finished)
+            signals = self.current_worker.signals
+            signals.progress.connect(self.emit_progress)
+            signals.status.connect(self.emit_status)
+            signals.log.connect(self.log)
+            signals.finished.connect(self._on_remux_finished)
             
             # Iniciar
             self._set_busy(True)
             self.log("🎬 Iniciando remuxeo...", "info")
-            self.current_worker.start()
+            start_worker(self.current_worker)
         
         except Exception as e:
             self.emit_error(f"Error iniciando remuxeo: {str(e)}")
@@ -153,58 +170,141 @@ class AssemblerViewModel(BaseViewModel):
             from core.domain.models import Episode
             
             # Convertir el diccionario de episodios al formato Episode
-            episode_objects = {}
-            for ep_num, ep_data in episodes.items():
-                episode = Episode(
-                    number=ep_num,
-                    video_file=Path(ep_data['video']) if ep_data.get('video') else None,
-                    audio_files=[Path(ep_data['audio'])] if ep_data.get('audio') else [],
-                    subtitle_files=[Path(ep_data['subtitle'])] if ep_data.get('subtitle') else [],
-                    forced_subtitle_files=[Path(ep_data['forced'])] if ep_data.get('forced') else []
-                )
-                episode_objects[ep_num] = episode
+            # (se reutiliza la conversión si los episodios no cambiaron)
+            key = tuple(sorted(
+                (n, d.get('video'), d.get('audio'), d.get('subtitle'), d.get('forced'))
+                for n, d in episodes.items()
+            ))
+            if key == self._episodes_cache[0]:
+                episode_objects = self._episodes_cache[1]
+            else:
+                # Una sola lectura por clave: se reutilizan las filas de la huella
+                episode_objects = {}
+                for ep_num, v, a, sub, f in key:
+                    episode_objects[ep_num] = Episode(
+                        number=ep_num,
+                        video_file=Path(v) if v else None,
+                        audio_files=[Path(a)] if a else [],
+                        subtitle_files=[Path(sub)] if sub else [],
+                        forced_subtitle_files=[Path(f)] if f else []
+                    )
+                self._episodes_cache = (key, episode_objects)
             
-            # Crear BatchService
+            # Crear BatchService y los jobs de cada episodio
             batch_service = BatchService(self.remux_service)
-            
-            # Callback de progreso por episodio
-            def episode_progress(ep_num: int, progress: int, message: str):
-                overall_message = f"Episodio {ep_num}: {message}"
-                self.emit_progress(progress, overall_message)
-                self.log(overall_message, "info")
-            
-            self._set_busy(True)
-            self.log("🎬 Iniciando remuxeo por lotes...", "info")
-            
-            # Procesar episodios
-            result = batch_service.process_episodes(
+            jobs = batch_service.create_jobs(
                 episodes=episode_objects,
                 output_directory=output_directory,
                 output_pattern="Episode_{ep:02d}_REMUX.mkv",
                 audio_offset_ms=audio_offset_ms,
-                subtitle_offset_ms=subtitle_offset_ms,
-                progress_callback=episode_progress
+                subtitle_offset_ms=subtitle_offset_ms
             )
             
-            # Reportar resultados
-            self._set_busy(False)
+            if not jobs:
+                self.log("⚠️ No hay episodios completos para procesar", "warning")
+                return
+            
+            # Signals compartidos por los runnables del lote
+            self._batch_signals = EpisodeRemuxSignals()
+            self._batch_signals.progress.connect(self._on_episode_progress)
+            self._batch_signals.finished.connect(self._on_episode_finished)
+            self._batch_cancel = threading.Event()
+            
+            self._batch_progress = dict.fromkeys(jobs, 0)
+            self._batch_pending = len(jobs)
+            self._batch_successful = 0
+            self._batch_failed = 0
             
-            if result.successful > 0:
-                self.log(f"✅ {result.successful}/{result.total_episodes} episodios completados", "success")
-                self.emit_completed(True)
+            self._set_busy(True)
+            self.log("🎬 Iniciando remuxeo por lotes...", "info")
             
-            if result.failed > 0:
-                self.log(f"❌ {result.failed} episodios fallaron", "error")
-                if result.successful == 0:
-                    self.emit_completed(False)
+            # Encolar episodios (se procesan en paralelo en el pool global)
+            self._batch_queue = deque(jobs.items())
+            self._batch_running = 0
+            self._submit_episodes()
         
         except Exception as e:
             self.emit_error(f"Error en remuxeo por lotes: {str(e)}")
             self._set_busy(False)
     
+    def _submit_episodes(self):
+        """Envía episodios al pool global sin superar _batch_max_running a la vez"""
+        while self._batch_queue and self._batch_running < self._batch_max_running:
+            ep_num, job = self._batch_queue.popleft()
+            self._batch_running += 1
+            start_worker(
+                EpisodeRemuxRunnable(
+                    ep_num, job, self.remux_service.remux, self._batch_signals, self._batch_cancel
+                )
+            )
+    
+    def _on_episode_progress(self, ep_num: int, progress: int, message: str):
+        """
+        Callback de progreso de un episodio del lote.
+        
+        Args:
+            ep_num: Número de episodio
+            progress: Progreso del episodio 0-100
+            message: Mensaje de progreso
+        """
+        self._batch_progress[ep_num] = progress
+        self._emit_batch_progress()
+        self.log(f"Episodio {ep_num}: {message}", "info")
+    
+    def _emit_batch_progress(self):
+        """Emite el progreso global del lote (promedio de los episodios)"""
+        self.emit_progress(sum(self._batch_progress.values()) // len(self._batch_progress))
+    
+    def _on_episode_finished(self, ep_num: int, success: bool, message: str):
+        """
+        Callback cuando termina un episodio del lote.
+        
+        Los signals llegan encolados al thread de la UI, así que los
+        contadores no necesitan sincronización.
+        
+        Args:
+            ep_num: Número de episodio
+            success: True si fue exitoso
+            message: Archivo de salida o mensaje de error
+        """
+        self._batch_progress[ep_num] = 100
+        self._emit_batch_progress()
+        if success:
+            self._batch_successful += 1
+            self.log(f"✅ Episodio {ep_num} completado: {message}", "success")
+        else:
+            self._batch_failed += 1
+            self.log(f"❌ Episodio {ep_num} falló: {message}", "error")
+        
+        self._batch_running -= 1
+        self._batch_pending -= 1
+        if self._batch_pending > 0:
+            self._submit_episodes()
+            return
+        
+        # Reportar resultados
+        total = self._batch_successful + self._batch_failed
+        self._batch_signals = None
+        self._set_busy(False)
+        
+        if self._batch_successful > 0:
+            self.log(f"✅ {self._batch_successful}/{total} episodios completados", "success")
+            self.emit_completed(True)
+        
+        if self._batch_failed > 0:
+            self.log(f"❌ {self._batch_failed} episodios fallaron", "error")
+            if self._batch_successful == 0:
+                self.emit_completed(False)
+    
     def cancel_remux(self):
         """Cancela el remuxeo actual"""
-        if self.current_worker and self.current_worker.isRunning():
+        if not self.is_busy:
+            return
+        if self._batch_signals is not None:
+            # Lote: los episodios en curso se detienen y los encolados no arrancan
+            self._batch_cancel.set()
+            self.log("⏹️ Cancelando remuxeo...", "warning")
+        elif self.current_worker:
             self.current_worker.cancel()
             self.log("⏹️ Cancelando remuxeo...", "warning")
     
@@ -225,4 +325,19 @@ class AssemblerViewModel(BaseViewModel):
             self.log(f"❌ Remuxeo fallido: {message}", "error")
             self.emit_completed(False)
         
+        self._disconnect_worker()
         self.current_worker = None
+    
+    def _disconnect_worker(self):
+        """Desconecta los signals del worker actual antes de soltarlo"""
+        worker = self.current_worker
+        if worker is None:
+            return
+        signals = worker.signals
+        try:
+            signals.progress.disconnect(self.emit_progress)
+            signals.status.disconnect(self.emit_status)
+            signals.log.disconnect(self.log)
+            signals.finished.disconnect(self._on_remux_finished)
+        except (TypeError, RuntimeError):
+            pass
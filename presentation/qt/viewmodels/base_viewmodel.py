@@ -34,6 +34,7 @@ class BaseViewModel(QObject):
         super().__init__()
         self.remux_service = remux_service
         self._is_busy = False
+        self._last_progress = -1  # Último progreso emitido (evita emisiones repetidas)
     
     @property
     def is_busy(self) -> bool:
@@ -48,10 +49,16 @@ class BaseViewModel(QObject):
         """
         Emite cambio de progreso.
         
+        No emite si el valor (acotado a 0-100) es igual al último emitido.
+        
         Args:
             value: Progreso 0-100
         """
-        self.progress_changed.emit(max(0, min(100, value)))
+        v = 0 if value < 0 else 100 if value > 100 else value
+        if v == self._last_progress:
+            return
+        self._last_progress = v
+        self.progress_changed.emit(v)
     
     def emit_status(self, message: str):
         """
@@ -95,6 +102,7 @@ class BaseViewModel(QObject):
     def reset(self):
         """Resetea el estado del ViewModel"""
         self._set_busy(False)
+        self._last_progress = -1
         self.emit_progress(0)
         self.emit_status("")
     
@@ -3,7 +3,10 @@ DualSync ViewModel - Lógica de presentación para DualSync Tab
 
 Separa completamente la lógica de la UI.
 """
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import os
 from typing import Dict, Optional, Tuple
 import re
 
@@ -13,6 +16,71 @@ from .base_viewmodel import BaseViewModel
 from core.services import EpisodeMatcher, DualVideoService
 
 
+# Patrones de número de episodio fusionados en una sola regex.
+# re.match + alternación anclada conserva la prioridad original:
+# "E05"/"Ep 05"/"Episode 05" > " 05 " entre separadores > "05 " al inicio.
+# Solo participa un grupo por match; se lee con m.lastindex.
+_EP_RE = re.compile(
+    r'.*?[Ee](?:p|pisode)?[\s_-]?(\d{1,3})'
+    r'|.*?[\s_-](\d{2,3})[\s_-]'
+    r'|(\d{2,3})[\s_-]'
+)
+
+# Prefiltro barato: sin dígitos no hay número de episodio (OP.mkv, poster.mkv...)
+_HAS_DIGIT = re.compile(r'\d').search
+
+
+@lru_cache(maxsize=4096)
+def _extract_episode_number(filename: str) -> Optional[int]:
+    """
+    Extrae número de episodio del nombre de archivo.
+    
+    Función pura: se memoiza para que re-escanear las mismas carpetas
+    no repita el trabajo de regex.
+    
+    Args:
+        filename: Nombre del archivo
+        
+    Returns:
+        Número de episodio o None
+    """
+    if not _HAS_DIGIT(filename):
+        return None
+    match = _EP_RE.match(filename)
+    return int(match.group(match.lastindex)) if match else None
+
+
+def _scan_mkv(folder: str) -> list:
+    """
+    Lista los .mkv de una carpeta (sin recursión).
+    
+    Usa os.scandir: nombre y ruta vienen en el DirEntry sin crear Path.
+    
+    Args:
+        folder: Carpeta a escanear
+        
+    Returns:
+        Lista de os.DirEntry de archivos .mkv
+    """
+    with os.scandir(folder) as it:
+        return [e for e in it if e.name.lower().endswith('.mkv') and e.is_file()]
+
+
+def _scan_episode_map(folder: str) -> Tuple[int, Dict[int, str]]:
+    """
+    Escanea una carpeta y mapea número de episodio -> ruta.
+    
+    Args:
+        folder: Carpeta a escanear
+        
+    Returns:
+        (cantidad de .mkv encontrados, {ep_num: ruta})
+    """
+    entries = _scan_mkv(folder)
+    episode_map = {n: e.path for e in entries if (n := _extract_episode_number(e.name))}
+    return len(entries), episode_map
+
+
 class DualSyncViewModel(BaseViewModel):
     """
     ViewModel para DualSync Tab.
@@ -31,6 +99,7 @@ class DualSyncViewModel(BaseViewModel):
         super().__init__(remux_service)
         self.episode_matcher = episode_matcher
         self.matched_episodes: Dict[int, Dict[str, str]] = {}
+        self._sorted_eps: Optional[tuple] = None  # Cache de get_sorted_episode_numbers
         self.current_mode = 'single'
         
         # Crear servicio de video dual
@@ -65,37 +134,24 @@ class DualSyncViewModel(BaseViewModel):
                 self.emit_error(f"Carpeta LAT no existe: {lat_folder}")
                 return 0
             
-            # Buscar archivos
-            jp_files = list(jp_path.glob("*.mkv"))
-            lat_files = list(lat_path.glob("*.mkv"))
-            
-            self.log(f"Encontrados {len(jp_files)} videos JP", "info")
-            self.log(f"Encontrados {len(lat_files)} videos LAT", "info")
-            
-            # Emparejar episodios
-            self.matched_episodes = {}
-            
-            for jp_file in jp_files:
-                ep_num = self._extract_episode_number(jp_file.name)
-                if ep_num:
-                    if ep_num not in self.matched_episodes:
-                        self.matched_episodes[ep_num] = {}
-                    self.matched_episodes[ep_num]['jp'] = str(jp_file)
+            # Buscar archivos y extraer episodios (JP y LAT en paralelo)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                jp_future = executor.submit(_scan_episode_map, jp_folder)
+                lat_future = executor.submit(_scan_episode_map, lat_folder)
+                jp_count, jp_map = jp_future.result()
+                lat_count, lat_map = lat_future.result()
             
-            for lat_file in lat_files:
-                ep_num = self._extract_episode_number(lat_file.name)
-                if ep_num:
-                    if ep_num not in self.matched_episodes:
-                        self.matched_episodes[ep_num] = {}
-                    self.matched_episodes[ep_num]['lat'] = str(lat_file)
+            self.log(f"Encontrados {jp_count} videos JP", "info")
+            self.log(f"Encontrados {lat_count} videos LAT", "info")
             
-            # Filtrar solo episodios completos
+            # Emparejar episodios: solo los presentes en ambas carpetas
             complete_episodes = {
-                ep: data for ep, data in self.matched_episodes.items()
-                if 'jp' in data and 'lat' in data
+                n: {'jp': jp, 'lat': lat_map[n]}
+                for n, jp in jp_map.items() if n in lat_map
             }
             
             self.matched_episodes = complete_episodes
+            self._sorted_eps = tuple(sorted(complete_episodes))
             
             # Emitir resultados
             self.episodes_found.emit(self.matched_episodes)
@@ -111,28 +167,6 @@ class DualSyncViewModel(BaseViewModel):
             self.emit_error(f"Error escaneando carpetas: {str(e)}")
             return 0
     
-    def _extract_episode_number(self, filename: str) -> Optional[int]:
-        """
-        Extrae número de episodio del nombre de archivo.
-        
-        Args:
-            filename: Nombre del archivo
-            
-        Returns:
-            Número de episodio o None
-        """
-        patterns = [
-            r'[Ee](?:p|pisode)?[\s_-]?(\d{1,3})',
-            r'[\s_-](\d{2,3})[\s_-]',
-            r'^(\d{2,3})[\s_-]',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, filename)
-            if match:
-                return int(match.group(1))
-        return None
-    
     def get_episode_data(self, ep_num: int) -> Optional[Dict[str, str]]:
         """
         Obtiene datos de un episodio específico.
@@ -171,12 +205,9 @@ class DualSyncViewModel(BaseViewModel):
         if not output_path:
             return False, "Falta ruta de salida"
         
-        jp_file = Path(jp_path)
-        lat_file = Path(lat_path)
-        
-        if not jp_file.exists():
+        if not os.path.exists(jp_path):
             return False, f"Video JP no existe: {jp_path}"
-        if not lat_file.exists():
+        if not os.path.exists(lat_path):
             return False, f"Video LAT no existe: {lat_path}"
         
         return True, ""
@@ -204,9 +235,11 @@ class DualSyncViewModel(BaseViewModel):
         """Obtiene número de episodios emparejados"""
         return len(self.matched_episodes)
     
-    def get_sorted_episode_numbers(self) -> list:
-        """Obtiene lista ordenada de números de episodio"""
-        return sorted(self.matched_episodes.keys())
+    def get_sorted_episode_numbers(self) -> tuple:
+        """Obtiene los números de episodio ordenados (tupla inmutable, cacheada por escaneo)"""
+        if self._sorted_eps is None:
+            self._sorted_eps = tuple(sorted(self.matched_episodes))
+        return self._sorted_eps
     
     # === LÓGICA DE SINCRONIZACIÓN ===
     
@@ -10,7 +10,7 @@ from .console_log import ConsoleLog
 from .mpv_dual_preview import MPVDualPreviewWidget
 from .mpv_preview import MPVPreviewWidget
 from .track_list import TrackListWidget
-from .file_input_group import FileInputGroup
+from .file_input_group import FileInputGroup, FileInputConfig
 from .preview_panel import PreviewPanel
 from .progress_panel import ProgressPanel
 from .dual_preview_controls import DualPreviewControls
@@ -26,6 +26,7 @@ __all__ = [
     'MPVPreviewWidget',
     'TrackListWidget',
     'FileInputGroup',
+    'FileInputConfig',
     'PreviewPanel',
     'ProgressPanel',
     'DualPreviewControls',
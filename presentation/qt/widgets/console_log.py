@@ -5,9 +5,9 @@ Widget profesional de consola para mostrar logs con formato,
 timestamps automáticos e iconos por nivel de severidad.
 """
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QSizePolicy
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-from datetime import datetime
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont, QTextCursor
+import time
 
 
 class ConsoleLog(QWidget):
@@ -21,8 +21,19 @@ class ConsoleLog(QWidget):
     - Formato consistente
     """
     
+    # Prefijo (icono + espacio) por nivel
+    _LEVEL_PREFIX = {
+        "info": "ℹ️ ",
+        "success": "✅ ",
+        "error": "❌ ",
+        "warning": "⚠️ ",
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Mensajes pendientes de volcar al QTextEdit (un solo repintado por lote)
+        self._pending: list[str] = []
+        self._flush_pending = False
         self._build_ui()
         self._apply_theme()
     
@@ -42,6 +53,8 @@ class ConsoleLog(QWidget):
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
         self.text_edit.setFont(QFont("Consolas", 9))
+        # Limitar historial: las líneas antiguas se descartan en O(1)
+        self.text_edit.document().setMaximumBlockCount(2000)
         layout.addWidget(self.text_edit)
         
         # Log inicial
@@ -55,18 +68,49 @@ class ConsoleLog(QWidget):
             message: Mensaje a mostrar
             level: Nivel (info, success, error, warning)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        prefix = self._LEVEL_PREFIX.get(level, "ℹ️ ")
+        self._pending.append(f"[{time.strftime('%H:%M:%S')}] {prefix}{message}")
+        
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(30, self._flush)
+    
+    def log_batch(self, entries: list):
+        """
+        Agrega varios mensajes de una vez (un solo volcado).
         
-        icons = {
-            "info": "ℹ️",
-            "success": "✅",
-            "error": "❌",
-            "warning": "⚠️"
-        }
-        icon = icons.get(level, "ℹ️")
+        Args:
+            entries: Lista de (mensaje, nivel)
+        """
+        stamp = time.strftime('%H:%M:%S')
+        prefixes = self._LEVEL_PREFIX
+        self._pending.extend(
+            f"[{stamp}] {prefixes.get(level, 'ℹ️ ')}{message}" for message, level in entries
+        )
+        
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(30, self._flush)
+    
+    def _flush(self):
+        """Vuelca los mensajes pendientes en un solo bloque de edición + auto-scroll"""
+        self._flush_pending = False
+        if not self._pending:
+            return
         
-        formatted = f"[{timestamp}] {icon} {message}"
-        self.text_edit.append(formatted)
+        # Un bloque por línea y como texto plano: sin autodetección de HTML sobre el lote
+        document = self.text_edit.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        first = document.isEmpty()
+        for line in self._pending:
+            if not first:
+                cursor.insertBlock()
+            first = False
+            cursor.insertText(line)
+        cursor.endEditBlock()
+        self._pending.clear()
         
         # Auto-scroll
         scrollbar = self.text_edit.verticalScrollBar()
@@ -74,6 +118,7 @@ class ConsoleLog(QWidget):
     
     def clear(self):
         """Limpia la consola"""
+        self._pending.clear()
         self.text_edit.clear()
         self.log("✅ Consola limpiada", "info")
     
@@ -7,9 +7,49 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                               QLabel, QPushButton, QFrame)
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
+from functools import lru_cache
 import platform
 import sys
 
+try:
+    import mpv
+    _MPV_AVAILABLE = True
+    # Errores esperables al leer propiedades durante el cierre del reproductor
+    _MPV_READ_ERRORS = (mpv.ShutdownError, AttributeError)
+except (ImportError, OSError):
+    _MPV_AVAILABLE = False
+    _MPV_READ_ERRORS = (AttributeError,)
+
+# Plataforma resuelta una sola vez al cargar el módulo
+_IS_LINUX = platform.system() == 'Linux'
+
+# Opciones de MPV: decodificación por hardware (con fallback) y caché amplia
+_MPV_KWARGS = dict(
+    keep_open='yes',
+    idle=True,
+    hwdec='auto-safe',
+    cache='yes',
+    demuxer_max_bytes='256MiB',
+    demuxer_readahead_secs=10
+)
+
+# Botones de navegación: (texto, segundos)
+_NAV_BUTTONS = (
+    ("◀◀-10s", -10),
+    ("◀-1s", -1),
+    ("+1s▶", 1),
+    ("+10s▶▶", 10),
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_time(seconds: int) -> str:
+    """Formatea segundos enteros a H:MM:SS (memoizado: cambia 1 vez/seg)"""
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
 
 class DualPreview(QWidget):
     """Widget de dual preview con MPV"""
@@ -27,7 +67,15 @@ class DualPreview(QWidget):
         self.current_video_lat = None
         self.is_playing = False
         
-        # Timer para actualizar timestamps
+        # Último texto mostrado (evita setText con el mismo valor)
+        self._last_time_str_jp = None
+        self._last_time_str_lat = None
+        
+        # Duración formateada (constante por video, se calcula una vez)
+        self._dur_str_jp = None
+        self._dur_str_lat = None
+        
+        # Timer para actualizar timestamps (solo corre durante reproducción)
         self.timer = QTimer()
         self.timer.timeout.connect(self._update_timestamps)
         
@@ -40,7 +88,7 @@ class DualPreview(QWidget):
         layout.setSpacing(5)
         
         # Preview izquierdo (JP)
-        left_widget = self._create_preview_widget("Video 1 (JP)")
+        left_widget = self._create_preview_widget("Video 1 (JP)", 'jp')
         layout.addWidget(left_widget, stretch=1)
         
         # Controles centrales
@@ -48,11 +96,17 @@ class DualPreview(QWidget):
         layout.addWidget(center_widget)
         
         # Preview derecho (ES)
-        right_widget = self._create_preview_widget("Video 2 (ES)")
+        right_widget = self._create_preview_widget("Video 2 (ES)", 'lat')
         layout.addWidget(right_widget, stretch=1)
     
-    def _create_preview_widget(self, title: str):
-        """Crea un widget de preview - 16:9 aspect ratio"""
+    def _create_preview_widget(self, title: str, side: str):
+        """
+        Crea un widget de preview - 16:9 aspect ratio
+        
+        Args:
+            title: Texto del título
+            side: 'jp' o 'lat' (sufijo de los atributos video_frame_*/placeholder_*)
+        """
         widget = QFrame()
         widget.setFrameShape(QFrame.Shape.StyledPanel)
         
@@ -89,12 +143,8 @@ class DualPreview(QWidget):
         placeholder_layout.addWidget(placeholder)
         
         # Guardar referencias
-        if "JP" in title:
-            self.video_frame_jp = video_frame
-            self.placeholder_jp = placeholder
-        else:
-            self.video_frame_lat = video_frame
-            self.placeholder_lat = placeholder
+        setattr(self, f'video_frame_{side}', video_frame)
+        setattr(self, f'placeholder_{side}', placeholder)
         
         return widget
     
@@ -157,18 +207,12 @@ class DualPreview(QWidget):
         nav_layout = QHBoxLayout()
         nav_layout.setSpacing(1)
         
-        nav_buttons = [
-            ("◀◀-10s", -10),
-            ("◀-1s", -1),
-            ("+1s▶", 1),
-            ("+10s▶▶", 10)
-        ]
-        
-        for text, seconds in nav_buttons:
+        for text, seconds in _NAV_BUTTONS:
             btn = QPushButton(text)
             btn.setFixedSize(38, 24)
             btn.setFont(QFont("Segoe UI", 6))
-            btn.clicked.connect(lambda checked, s=seconds: self.seek(s))
+            btn.setProperty("seek", seconds)
+            btn.clicked.connect(self._on_nav_clicked)
             nav_layout.addWidget(btn)
         
         layout.addLayout(nav_layout)
@@ -205,9 +249,9 @@ class DualPreview(QWidget):
             
             # Inicializar MPV si es necesario
             if not self.mpv_jp:
-                self._init_mpv_jp()
+                self.mpv_jp = self._init_mpv(self.video_frame_jp)
             if not self.mpv_lat:
-                self._init_mpv_lat()
+                self.mpv_lat = self._init_mpv(self.video_frame_lat)
             
             # Ocultar placeholders
             self.placeholder_jp.hide()
@@ -228,9 +272,11 @@ class DualPreview(QWidget):
             
             self.current_video_jp = video_jp_path
             self.current_video_lat = video_lat_path
+            self._dur_str_jp = None
+            self._dur_str_lat = None
             
-            # Iniciar timer de timestamps
-            self.timer.start(500)  # Actualizar cada 0.5s
+            # Pintar timestamps iniciales (el timer arranca con play)
+            QTimer.singleShot(500, self._refresh_timestamps)
             
             self.log_signal.emit("✅ Previews cargados", "success")
             
@@ -238,59 +284,58 @@ class DualPreview(QWidget):
             self.log_signal.emit(f"Error: {str(e)}", "error")
             raise
     
-    def _init_mpv_jp(self):
-        """Inicializa MPV para video japonés"""
-        try:
-            import mpv
-            
-            if platform.system() == 'Linux':
-                self.mpv_jp = mpv.MPV(keep_open='yes', idle=True)
-            else:
-                # Windows - embedding
-                wid = int(self.video_frame_jp.winId())
-                self.mpv_jp = mpv.MPV(wid=str(wid), keep_open='yes', idle=True)
-        except Exception as e:
-            print(f"❌ Error inicializando MPV JP: {e}")
-            raise
-    
-    def _init_mpv_lat(self):
-        """Inicializa MPV para video español"""
+    def _init_mpv(self, frame: QFrame) -> "mpv.MPV":
+        """Crea una instancia MPV embebida en el frame dado"""
+        if not _MPV_AVAILABLE:
+            raise RuntimeError("MPV no disponible")
+        
         try:
-            import mpv
-            
-            if platform.system() == 'Linux':
-                self.mpv_lat = mpv.MPV(keep_open='yes', idle=True)
-            else:
-                # Windows - embedding
-                wid = int(self.video_frame_lat.winId())
-                self.mpv_lat = mpv.MPV(wid=str(wid), keep_open='yes', idle=True)
+            if _IS_LINUX:
+                return mpv.MPV(**_MPV_KWARGS)
+            # Windows - embedding
+            wid = int(frame.winId())
+            return mpv.MPV(wid=str(wid), **_MPV_KWARGS)
         except Exception as e:
-            print(f"❌ Error inicializando MPV LAT: {e}")
+            print(f"❌ Error inicializando MPV: {e}")
             raise
     
     def _update_timestamps(self):
-        """Actualiza timestamps"""
-        try:
-            if self.mpv_jp and self.current_video_jp:
+        """Actualiza timestamps (tick del timer, solo en reproducción)"""
+        if not self.is_playing:
+            return
+        self._refresh_timestamps()
+    
+    def _refresh_timestamps(self):
+        """Lee posición/duración y actualiza labels si el texto cambió"""
+        if self.mpv_jp and self.current_video_jp:
+            try:
+                if self._dur_str_jp is None:
+                    dur_jp = self.mpv_jp.duration
+                    if dur_jp:
+                        self._dur_str_jp = _format_time(int(dur_jp))
                 pos_jp = self.mpv_jp.time_pos or 0
-                dur_jp = self.mpv_jp.duration or 0
-                time_str_jp = f"Time: {self._format_time(pos_jp)}/{self._format_time(dur_jp)}"
-                self.time_label_jp.setText(time_str_jp)
-            
-            if self.mpv_lat and self.current_video_lat:
+            except _MPV_READ_ERRORS:
+                pass  # Lectura fallida: se omite este lado y se sigue con LAT
+            else:
+                time_str_jp = f"Time: {_format_time(int(pos_jp))}/{self._dur_str_jp or _format_time(0)}"
+                if time_str_jp != self._last_time_str_jp:
+                    self._last_time_str_jp = time_str_jp
+                    self.time_label_jp.setText(time_str_jp)
+        
+        if self.mpv_lat and self.current_video_lat:
+            try:
+                if self._dur_str_lat is None:
+                    dur_lat = self.mpv_lat.duration
+                    if dur_lat:
+                        self._dur_str_lat = _format_time(int(dur_lat))
                 pos_lat = self.mpv_lat.time_pos or 0
-                dur_lat = self.mpv_lat.duration or 0
-                time_str_lat = f"Time: {self._format_time(pos_lat)}/{self._format_time(dur_lat)}"
-                self.time_label_lat.setText(time_str_lat)
-        except:
-            pass
-    
-    def _format_time(self, seconds: float) -> str:
-        """Formatea segundos a H:MM:SS"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        return f"{hours}:{minutes:02d}:{secs:02d}"
+            except _MPV_READ_ERRORS:
+                pass  # Lectura fallida: se omite este lado
+            else:
+                time_str_lat = f"Time: {_format_time(int(pos_lat))}/{self._dur_str_lat or _format_time(0)}"
+                if time_str_lat != self._last_time_str_lat:
+                    self._last_time_str_lat = time_str_lat
+                    self.time_label_lat.setText(time_str_lat)
     
     def toggle_play(self):
         """Toggle play/pause"""
@@ -301,6 +346,11 @@ class DualPreview(QWidget):
         self.mpv_jp.pause = not self.is_playing
         self.mpv_lat.pause = not self.is_playing
         
+        if self.is_playing:
+            self.timer.start(500)  # Actualizar cada 0.5s
+        else:
+            self.timer.stop()
+        
         self.play_btn.setText("⏸️" if self.is_playing else "▶️")
     
     def stop(self):
@@ -313,8 +363,14 @@ class DualPreview(QWidget):
         self.mpv_jp.pause = True
         self.mpv_lat.pause = True
         self.is_playing = False
+        self.timer.stop()
+        self._refresh_timestamps()
         self.play_btn.setText("▶️")
     
+    def _on_nav_clicked(self):
+        """Slot compartido de los botones de navegación"""
+        self.seek(self.sender().property("seek"))
+    
     def seek(self, seconds: int):
         """Navega en ambos videos"""
         if not self.mpv_jp or not self.mpv_lat:
@@ -322,6 +378,10 @@ class DualPreview(QWidget):
         
         self.mpv_jp.seek(seconds, reference='relative')
         self.mpv_lat.seek(seconds, reference='relative')
+        
+        # En pausa el timer no corre: refrescar una vez tras el seek
+        if not self.is_playing:
+            self._refresh_timestamps()
     
     def toggle_mute_jp(self):
         """Toggle mute JP"""
@@ -4,9 +4,71 @@ Dual Preview Controls - Controles centralizados para dual preview
 Widget con controles de playback compartidos entre dos previews,
 con labels de tiempo para ambos videos.
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame
+from PyQt6.QtWidgets import QWidget, QGridLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QStyle
 from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QFont, QIcon
+from typing import NamedTuple
+
+from ..layouts.theme_manager import ThemeManager, register_style_cache
+
+
+class _ControlStyles(NamedTuple):
+    """Hojas de estilo ya ensambladas para DualPreviewControls"""
+    frame_qss: str
+    time_label_qss: str
+    nav_qss: str
+    play_qss: str
+    stop_qss: str
+    root_qss: str  # Todo lo anterior combinado (un solo setStyleSheet)
+
+
+# Glifos de playback -> iconos estándar de Qt (pixmaps cacheados, sin emoji)
+_GLYPH_PIXMAPS = {
+    "▶": QStyle.StandardPixmap.SP_MediaPlay,
+    "⏸": QStyle.StandardPixmap.SP_MediaPause,
+    "⏹": QStyle.StandardPixmap.SP_MediaStop,
+}
+_GLYPH_ICONS: dict = {}
+
+
+def _set_glyph(button: QPushButton, glyph: str):
+    """Muestra el glifo como icono estándar (o como texto si no hay equivalente)"""
+    pixmap = _GLYPH_PIXMAPS.get(glyph)
+    if pixmap is None:
+        button.setIcon(QIcon())
+        button.setText(glyph)
+        return
+    icon = _GLYPH_ICONS.get(glyph)
+    if icon is None:
+        icon = _GLYPH_ICONS[glyph] = button.style().standardIcon(pixmap)
+    button.setText("")
+    button.setIcon(icon)
+
+
+# Plantillas QSS (se formatean una vez por tema)
+_FRAME_TMPL = """
+    QWidget {{
+        background-color: {bg};
+        border: 1px solid {border};
+        border-radius: {radius_md}px;
+    }}
+"""
+
+_TIME_LABEL_TMPL = """
+    QLabel#dpcTimeLabel {{
+        color: {text};
+        background-color: {bg_input};
+        padding: {padding}px;
+        border: 1px solid {border};
+        border-radius: {radius_sm}px;
+        font-weight: bold;
+    }}
+"""
+
+
+def _scope_buttons(qss: str, object_name: str) -> str:
+    """Restringe un estilo de QPushButton a un objectName concreto"""
+    return qss.replace("QPushButton", f"QPushButton#{object_name}")
 
 
 class DualPreviewControls(QWidget):
@@ -30,157 +92,177 @@ class DualPreviewControls(QWidget):
     stop_clicked = pyqtSignal()
     seek_requested = pyqtSignal(int)
     
+    # QSS compartido entre instancias, indexado por tema
+    _stylesheet_cache: dict = {}
+    
+    # Fuente mono compartida por ambos labels de tiempo (y entre instancias)
+    _mono_font: QFont = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._theme_applied = False  # El tema se aplica en el primer showEvent
         self._setup_ui()
-        self._apply_theme()
     
     def _setup_ui(self):
         """Configura la UI del widget"""
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(8, 8, 8, 8)
-        main_layout.setSpacing(8)
-        
-        # === LABELS DE TIEMPO ===
-        time_layout = QHBoxLayout()
-        time_layout.setSpacing(16)
-        
-        # Tiempo JP
-        jp_time_layout = QVBoxLayout()
-        jp_time_layout.setSpacing(2)
-        
-        jp_label = QLabel("🇯🇵 Japonés")
-        jp_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        jp_time_layout.addWidget(jp_label)
-        
-        self.time_label_jp = QLabel("00:00:00 / 00:00:00")
-        self.time_label_jp.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        jp_time_layout.addWidget(self.time_label_jp)
-        
-        time_layout.addLayout(jp_time_layout, stretch=1)
-        
-        # Tiempo LAT
-        lat_time_layout = QVBoxLayout()
-        lat_time_layout.setSpacing(2)
-        
-        lat_label = QLabel("🌎 Latino")
-        lat_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lat_time_layout.addWidget(lat_label)
-        
-        self.time_label_lat = QLabel("00:00:00 / 00:00:00")
-        self.time_label_lat.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lat_time_layout.addWidget(self.time_label_lat)
-        
-        time_layout.addLayout(lat_time_layout, stretch=1)
-        
-        main_layout.addLayout(time_layout)
-        
-        # Separador
-        separator = QFrame()
-        separator.setFrameShape(QFrame.Shape.HLine)
-        separator.setFrameShadow(QFrame.Shadow.Sunken)
-        main_layout.addWidget(separator)
-        
-        # === CONTROLES DE NAVEGACIÓN ===
-        nav_layout = QHBoxLayout()
-        nav_layout.setSpacing(4)
-        
-        # Botones de navegación
-        self.nav_btn_minus10 = QPushButton("-10s")
-        self.nav_btn_minus10.setMinimumWidth(60)
-        self.nav_btn_minus10.clicked.connect(lambda: self.seek_requested.emit(-10))
-        nav_layout.addWidget(self.nav_btn_minus10)
-        
-        self.nav_btn_minus1 = QPushButton("-1s")
-        self.nav_btn_minus1.setMinimumWidth(50)
-        self.nav_btn_minus1.clicked.connect(lambda: self.seek_requested.emit(-1))
-        nav_layout.addWidget(self.nav_btn_minus1)
-        
-        nav_layout.addStretch()
-        
-        self.nav_btn_plus1 = QPushButton("+1s")
-        self.nav_btn_plus1.setMinimumWidth(50)
-        self.nav_btn_plus1.clicked.connect(lambda: self.seek_requested.emit(1))
-        nav_layout.addWidget(self.nav_btn_plus1)
-        
-        self.nav_btn_plus10 = QPushButton("+10s")
-        self.nav_btn_plus10.setMinimumWidth(60)
-        self.nav_btn_plus10.clicked.connect(lambda: self.seek_requested.emit(10))
-        nav_layout.addWidget(self.nav_btn_plus10)
-        
-        main_layout.addLayout(nav_layout)
-        
-        # === CONTROLES DE PLAYBACK ===
-        playback_layout = QHBoxLayout()
-        playback_layout.setSpacing(8)
-        
-        playback_layout.addStretch()
-        
-        self.play_btn = QPushButton("▶")
-        self.play_btn.setMinimumSize(80, 40)
-        self.play_btn.clicked.connect(self.play_clicked.emit)
-        playback_layout.addWidget(self.play_btn)
-        
-        self.stop_btn = QPushButton("⏹")
-        self.stop_btn.setMinimumSize(80, 40)
-        self.stop_btn.clicked.connect(self.stop_clicked.emit)
-        playback_layout.addWidget(self.stop_btn)
-        
-        playback_layout.addStretch()
+        self.setUpdatesEnabled(False)
+        try:
+            # Grid único: cabeceras / tiempos / separador / navegación / playback
+            grid = QGridLayout(self)
+            grid.setContentsMargins(8, 8, 8, 8)
+            grid.setHorizontalSpacing(16)
+            grid.setVerticalSpacing(8)
+            grid.setColumnStretch(0, 1)
+            grid.setColumnStretch(1, 1)
+            
+            # === LABELS DE TIEMPO ===
+            jp_label = QLabel("🇯🇵 Japonés")
+            jp_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            grid.addWidget(jp_label, 0, 0)
+            
+            lat_label = QLabel("🌎 Latino")
+            lat_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            grid.addWidget(lat_label, 0, 1)
+            
+            self.time_label_jp = QLabel("00:00:00 / 00:00:00")
+            self.time_label_jp.setObjectName("dpcTimeLabel")
+            self.time_label_jp.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            grid.addWidget(self.time_label_jp, 1, 0)
+            
+            self.time_label_lat = QLabel("00:00:00 / 00:00:00")
+            self.time_label_lat.setObjectName("dpcTimeLabel")
+            self.time_label_lat.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            grid.addWidget(self.time_label_lat, 1, 1)
+            
+            # Separador
+            separator = QFrame()
+            separator.setFrameShape(QFrame.Shape.HLine)
+            separator.setFrameShadow(QFrame.Shadow.Sunken)
+            grid.addWidget(separator, 2, 0, 1, 2)
+            
+            # === CONTROLES DE NAVEGACIÓN ===
+            nav_layout = QHBoxLayout()
+            nav_layout.setSpacing(4)
+            
+            # Botones de navegación
+            self.nav_btn_minus10 = QPushButton("-10s")
+            self.nav_btn_minus10.setObjectName("dpcNavBtn")
+            self.nav_btn_minus10.setMinimumWidth(60)
+            self.nav_btn_minus10.setProperty("seekDelta", -10)
+            self.nav_btn_minus10.clicked.connect(self._on_nav_clicked, Qt.ConnectionType.DirectConnection)
+            nav_layout.addWidget(self.nav_btn_minus10)
+            
+            self.nav_btn_minus1 = QPushButton("-1s")
+            self.nav_btn_minus1.setObjectName("dpcNavBtn")
+            self.nav_btn_minus1.setMinimumWidth(50)
+            self.nav_btn_minus1.setProperty("seekDelta", -1)
+            self.nav_btn_minus1.clicked.connect(self._on_nav_clicked, Qt.ConnectionType.DirectConnection)
+            nav_layout.addWidget(self.nav_btn_minus1)
+            
+            nav_layout.addStretch()
+            
+            self.nav_btn_plus1 = QPushButton("+1s")
+            self.nav_btn_plus1.setObjectName("dpcNavBtn")
+            self.nav_btn_plus1.setMinimumWidth(50)
+            self.nav_btn_plus1.setProperty("seekDelta", 1)
+            self.nav_btn_plus1.clicked.connect(self._on_nav_clicked, Qt.ConnectionType.DirectConnection)
+            nav_layout.addWidget(self.nav_btn_plus1)
+            
+            self.nav_btn_plus10 = QPushButton("+10s")
+            self.nav_btn_plus10.setObjectName("dpcNavBtn")
+            self.nav_btn_plus10.setMinimumWidth(60)
+            self.nav_btn_plus10.setProperty("seekDelta", 10)
+            self.nav_btn_plus10.clicked.connect(self._on_nav_clicked, Qt.ConnectionType.DirectConnection)
+            nav_layout.addWidget(self.nav_btn_plus10)
+            
+            grid.addLayout(nav_layout, 3, 0, 1, 2)
+            
+            # === CONTROLES DE PLAYBACK ===
+            playback_layout = QHBoxLayout()
+            playback_layout.setSpacing(8)
+            
+            playback_layout.addStretch()
+            
+            self.play_btn = QPushButton()
+            _set_glyph(self.play_btn, "▶")
+            self.play_btn.setObjectName("dpcPlayBtn")
+            self.play_btn.setMinimumSize(80, 40)
+            self.play_btn.clicked.connect(self.play_clicked.emit, Qt.ConnectionType.DirectConnection)
+            playback_layout.addWidget(self.play_btn)
+            
+            self.stop_btn = QPushButton()
+            _set_glyph(self.stop_btn, "⏹")
+            self.stop_btn.setObjectName("dpcStopBtn")
+            self.stop_btn.setMinimumSize(80, 40)
+            self.stop_btn.clicked.connect(self.stop_clicked.emit, Qt.ConnectionType.DirectConnection)
+            playback_layout.addWidget(self.stop_btn)
+            
+            playback_layout.addStretch()
+            
+            grid.addLayout(playback_layout, 4, 0, 1, 2)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def showEvent(self, event):
+        """Aplica el tema de forma diferida, solo cuando el widget se muestra"""
+        if not self._theme_applied:
+            self._theme_applied = True
+            self._apply_theme()
+        super().showEvent(event)
+    
+    def _on_nav_clicked(self):
+        """Slot compartido de navegación: lee el delta del botón emisor"""
+        self.seek_requested.emit(self.sender().property("seekDelta"))
+    
+    @classmethod
+    def _build_stylesheets(cls, theme) -> _ControlStyles:
+        """
+        Ensambla (una sola vez por tema) las hojas de estilo de los controles.
         
-        main_layout.addLayout(playback_layout)
+        Args:
+            theme: Instancia de ThemeManager
+            
+        Returns:
+            _ControlStyles con los QSS listos para aplicar
+        """
+        key = id(theme)
+        styles = cls._stylesheet_cache.get(key)
+        if styles is None:
+            values = dict(
+                bg=theme.get_color('bg_secondary'),
+                border=theme.get_color('border'),
+                radius_md=theme.RADIUS['md'],
+                text=theme.get_color('text_primary'),
+                bg_input=theme.get_color('bg_input'),
+                padding=theme.get_spacing('sm'),
+                radius_sm=theme.RADIUS['sm'],
+            )
+            parts = dict(
+                frame_qss=_FRAME_TMPL.format(**values),
+                time_label_qss=_TIME_LABEL_TMPL.format(**values),
+                nav_qss=_scope_buttons(theme.get_button_style('secondary'), "dpcNavBtn"),
+                play_qss=_scope_buttons(theme.get_button_style('success'), "dpcPlayBtn"),
+                stop_qss=_scope_buttons(theme.get_button_style('error'), "dpcStopBtn"),
+            )
+            styles = _ControlStyles(root_qss="".join(parts.values()), **parts)
+            cls._stylesheet_cache[key] = styles
+        return styles
     
     def _apply_theme(self):
         """Aplica el tema visual"""
         try:
-            from ..layouts.theme_manager import ThemeManager
             theme = ThemeManager()
+            ss = self._build_stylesheets(theme)
             
-            # Frame principal
-            self.setStyleSheet(f"""
-                QWidget {{
-                    background-color: {theme.get_color('bg_secondary')};
-                    border: 1px solid {theme.get_color('border')};
-                    border-radius: {theme.RADIUS['md']}px;
-                }}
-            """)
+            # Una sola hoja de estilo en la raíz (selectores por objectName)
+            self.setStyleSheet(ss.root_qss)
             
             # Labels de tiempo
-            self.time_label_jp.setFont(theme.get_font('mono'))
-            self.time_label_lat.setFont(theme.get_font('mono'))
-            
-            self.time_label_jp.setStyleSheet(f"""
-                QLabel {{
-                    color: {theme.get_color('text_primary')};
-                    background-color: {theme.get_color('bg_input')};
-                    padding: {theme.get_spacing('sm')}px;
-                    border: 1px solid {theme.get_color('border')};
-                    border-radius: {theme.RADIUS['sm']}px;
-                    font-weight: bold;
-                }}
-            """)
-            
-            self.time_label_lat.setStyleSheet(f"""
-                QLabel {{
-                    color: {theme.get_color('text_primary')};
-                    background-color: {theme.get_color('bg_input')};
-                    padding: {theme.get_spacing('sm')}px;
-                    border: 1px solid {theme.get_color('border')};
-                    border-radius: {theme.RADIUS['sm']}px;
-                    font-weight: bold;
-                }}
-            """)
-            
-            # Botones de navegación
-            nav_style = theme.get_button_style('secondary')
-            self.nav_btn_minus10.setStyleSheet(nav_style)
-            self.nav_btn_minus1.setStyleSheet(nav_style)
-            self.nav_btn_plus1.setStyleSheet(nav_style)
-            self.nav_btn_plus10.setStyleSheet(nav_style)
-            
-            # Botones de playback
-            self.play_btn.setStyleSheet(theme.get_button_style('success'))
-            self.stop_btn.setStyleSheet(theme.get_button_style('error'))
+            mono = DualPreviewControls._mono_font
+            if mono is None:
+                mono = DualPreviewControls._mono_font = theme.get_font('mono')
+            self.time_label_jp.setFont(mono)
+            self.time_label_lat.setFont(mono)
             
         except ImportError:
             pass
@@ -210,6 +292,9 @@ class DualPreviewControls(QWidget):
         Actualiza el texto del botón de play.
         
         Args:
-            text: Texto a mostrar (▶ o ⏸)
+            text: Texto a mostrar (▶ o ⏸; se muestran como icono estándar)
         """
-        self.play_btn.setText(text)
+        _set_glyph(self.play_btn, text)
+
+
+register_style_cache(DualPreviewControls._stylesheet_cache.clear)
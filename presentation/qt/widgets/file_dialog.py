@@ -0,0 +1,70 @@
+"""
+File Dialog - QFileDialog reutilizable para los selectores de rutas
+
+Comparte un único diálogo por widget (se crea en el primer uso) y recuerda
+la última carpeta elegida entre aperturas.
+"""
+from PyQt6.QtWidgets import QWidget, QFileDialog
+from typing import Optional
+import os
+
+
+class ReusableFileDialog:
+    """
+    QFileDialog perezoso y reutilizable asociado a un widget.
+    
+    Reconfigura el mismo diálogo en cada apertura en vez de crear uno nuevo.
+    """
+    
+    def __init__(self, parent: QWidget):
+        """
+        Args:
+            parent: Widget dueño del diálogo
+        """
+        self._parent = parent
+        self._dialog: Optional[QFileDialog] = None
+        self._last_dir = ""
+    
+    def run(self, title: str, file_mode, accept_mode, name_filter: str = "",
+            current: str = "") -> str:
+        """
+        Muestra el diálogo y devuelve la ruta elegida.
+        
+        Args:
+            title: Título del diálogo
+            file_mode: QFileDialog.FileMode
+            accept_mode: QFileDialog.AcceptMode
+            name_filter: Filtros separados por ';;' (vacío para carpetas)
+            current: Ruta actual del widget (se preselecciona si no está vacía)
+        
+        Returns:
+            Ruta elegida, o '' si se canceló
+        """
+        if self._dialog is None:
+            self._dialog = QFileDialog(self._parent)
+        dialog = self._dialog
+        
+        dialog.setWindowTitle(title)
+        dialog.setFileMode(file_mode)
+        dialog.setAcceptMode(accept_mode)
+        dialog.setOption(
+            QFileDialog.Option.ShowDirsOnly,
+            file_mode == QFileDialog.FileMode.Directory
+        )
+        dialog.setNameFilters(name_filter.split(';;') if name_filter else [])
+        
+        # Reanudar desde la ruta actual o la última carpeta usada
+        if current:
+            dialog.selectFile(current)
+        elif self._last_dir:
+            dialog.setDirectory(self._last_dir)
+        
+        if not dialog.exec():
+            return ""
+        selected = dialog.selectedFiles()
+        if not selected:
+            return ""
+        
+        path = selected[0]
+        self._last_dir = path if file_mode == QFileDialog.FileMode.Directory else os.path.dirname(path)
+        return path
@@ -5,10 +5,56 @@ Widget reutilizable que combina label, input y botones de selección
 en un componente cohesivo siguiendo principios de diseño profesional.
 """
 from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QLabel, QLineEdit, 
-                              QPushButton, QFileDialog, QSizePolicy)
-from PyQt6.QtCore import pyqtSignal
-from pathlib import Path
+                              QPushButton, QFileDialog, QSizePolicy, QStyle)
+from PyQt6.QtCore import pyqtSignal, Qt
+from dataclasses import dataclass
 from typing import Optional
+import os
+import stat
+import time
+
+from ..layouts.theme_manager import ThemeManager, register_style_cache
+from .file_dialog import ReusableFileDialog
+
+
+@dataclass(frozen=True, slots=True)
+class FileInputConfig:
+    """Configuración inmutable de un FileInputGroup"""
+    file_filter: str = "Todos (*.*)"
+    placeholder: str = ""
+    show_file_button: bool = True
+    show_folder_button: bool = True
+    is_save_dialog: bool = False
+
+
+# Vigencia (s) del stat cacheado: cubre una pasada de validación, no la vida del texto
+_STAT_TTL = 0.5
+
+# Estilos derivados del tema, resueltos una sola vez (primer uso)
+_CACHED: Optional[dict] = None
+
+
+def _get_cached_styles() -> dict:
+    """Estilos/fuentes de FileInputGroup precalculados a partir del tema"""
+    global _CACHED
+    if _CACHED is None:
+        theme = ThemeManager()
+        _CACHED = {
+            "label_qss": theme.get_label_style('primary'),
+            "label_font": theme.get_font('body'),
+            "input_qss": theme.get_input_style(),
+            "button_qss": theme.get_button_style('primary'),
+        }
+    return _CACHED
+
+
+def _clear_cached_styles():
+    """Descarta los estilos precalculados (cambio de tema)"""
+    global _CACHED
+    _CACHED = None
+
+
+register_style_cache(_clear_cached_styles)
 
 
 class FileInputGroup(QWidget):
@@ -56,97 +102,152 @@ class FileInputGroup(QWidget):
         """
         super().__init__(parent)
         
-        self.file_filter = file_filter
-        self.placeholder = placeholder
-        self.show_file_button = show_file_button
-        self.show_folder_button = show_folder_button
-        self.is_save_dialog = is_save_dialog
+        self._cfg = FileInputConfig(
+            file_filter=file_filter,
+            placeholder=placeholder,
+            show_file_button=show_file_button,
+            show_folder_button=show_folder_button,
+            is_save_dialog=is_save_dialog,
+        )
+        self._theme_applied = False  # El tema se aplica en el primer showEvent
+        self._file_dialog = ReusableFileDialog(self)
+        self._last_emitted: Optional[str] = None  # Dedupe de path_changed
+        # (ruta, stat, instante) del último os.stat; None = invalidado
+        self._stat_cache: Optional[tuple[str, Optional[os.stat_result], float]] = None
         
         self._build_ui(label_text)
         self._connect_signals()
-        self._apply_theme()
     
     def _build_ui(self, label_text: str):
         """Construye la interfaz del widget"""
-        # Layout principal horizontal
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
-        
-        # Label
-        self.label = QLabel(label_text)
-        self.label.setMinimumWidth(80)
-        layout.addWidget(self.label)
-        
-        # Input de texto
-        self.line_edit = QLineEdit()
-        self.line_edit.setPlaceholderText(self.placeholder)
-        self.line_edit.setSizePolicy(
-            QSizePolicy.Policy.Expanding,
-            QSizePolicy.Policy.Preferred
-        )
-        layout.addWidget(self.line_edit)
-        
-        # Botón de archivo
-        if self.show_file_button:
-            self.file_button = QPushButton("📄 Archivo")
-            self.file_button.setFixedWidth(90)
-            layout.addWidget(self.file_button)
-        
-        # Botón de carpeta
-        if self.show_folder_button:
-            self.folder_button = QPushButton("📁 Carpeta")
-            self.folder_button.setFixedWidth(90)
-            layout.addWidget(self.folder_button)
+        self.setUpdatesEnabled(False)
+        try:
+            # Layout principal horizontal
+            layout = QHBoxLayout(self)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(8)
+            
+            # Label
+            self.label = QLabel(label_text)
+            self.label.setMinimumWidth(80)
+            layout.addWidget(self.label)
+            
+            # Input de texto
+            self.line_edit = QLineEdit()
+            self.line_edit.setPlaceholderText(self._cfg.placeholder)
+            self.line_edit.setSizePolicy(
+                QSizePolicy.Policy.Expanding,
+                QSizePolicy.Policy.Preferred
+            )
+            layout.addWidget(self.line_edit)
+            
+            # Botón de archivo
+            if self._cfg.show_file_button:
+                self.file_button = QPushButton("Archivo")
+                self.file_button.setIcon(
+                    self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon))
+                self.file_button.setFixedWidth(90)
+                layout.addWidget(self.file_button)
+            
+            # Botón de carpeta
+            if self._cfg.show_folder_button:
+                self.folder_button = QPushButton("Carpeta")
+                self.folder_button.setIcon(
+                    self.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon))
+                self.folder_button.setFixedWidth(90)
+                layout.addWidget(self.folder_button)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _connect_signals(self):
         """Conecta los signals internos"""
-        # Conectar cambios en el input
-        self.line_edit.textChanged.connect(self.path_changed.emit)
+        # Conectar cambios en el input (al terminar de editar, no por tecla)
+        self.line_edit.editingFinished.connect(self._emit_path_changed, Qt.ConnectionType.DirectConnection)
+        
+        # Cache de stat: invalidar al cambiar el texto, refrescar al terminar
+        self.line_edit.textChanged.connect(self._invalidate_stat, Qt.ConnectionType.DirectConnection)
+        self.line_edit.editingFinished.connect(self._refresh_stat, Qt.ConnectionType.DirectConnection)
         
         # Conectar botones
-        if self.show_file_button:
-            self.file_button.clicked.connect(self._on_file_button_clicked)
+        if self._cfg.show_file_button:
+            self.file_button.clicked.connect(self._on_file_button_clicked, Qt.ConnectionType.DirectConnection)
         
-        if self.show_folder_button:
-            self.folder_button.clicked.connect(self._on_folder_button_clicked)
+        if self._cfg.show_folder_button:
+            self.folder_button.clicked.connect(self._on_folder_button_clicked, Qt.ConnectionType.DirectConnection)
+    
+    def showEvent(self, event):
+        """Aplica el tema de forma diferida, solo cuando el widget se muestra"""
+        if not self._theme_applied:
+            self._theme_applied = True
+            self._apply_theme()
+        super().showEvent(event)
     
     def _apply_theme(self):
         """Aplica el tema visual"""
-        from ..layouts.theme_manager import ThemeManager
-        theme = ThemeManager()
+        cached = _get_cached_styles()
         
         # Estilo del label
-        self.label.setStyleSheet(theme.get_label_style('primary'))
-        self.label.setFont(theme.get_font('body'))
+        self.label.setStyleSheet(cached["label_qss"])
+        self.label.setFont(cached["label_font"])
         
         # Estilo del input
-        self.line_edit.setStyleSheet(theme.get_input_style())
+        self.line_edit.setStyleSheet(cached["input_qss"])
         
         # Estilo de los botones
-        button_style = theme.get_button_style('primary')
-        if self.show_file_button:
+        button_style = cached["button_qss"]
+        if self._cfg.show_file_button:
             self.file_button.setStyleSheet(button_style)
-        if self.show_folder_button:
+        if self._cfg.show_folder_button:
             self.folder_button.setStyleSheet(button_style)
     
+    def _emit_path_changed(self):
+        """Emite path_changed solo si la ruta cambió desde la última emisión"""
+        path = self.line_edit.text()
+        if path != self._last_emitted:
+            self._last_emitted = path
+            self.path_changed.emit(path)
+    
+    def _invalidate_stat(self):
+        """Descarta el stat cacheado (la ruta cambió)"""
+        self._stat_cache = None
+    
+    def _refresh_stat(self) -> Optional[os.stat_result]:
+        """Hace un único os.stat de la ruta actual y lo cachea"""
+        path = self.get_path()
+        try:
+            st = os.stat(path) if path else None
+        except OSError:
+            st = None
+        self._stat_cache = (path, st, time.monotonic())
+        return st
+    
+    def _get_stat(self) -> Optional[os.stat_result]:
+        """Devuelve el stat cacheado de la ruta actual (refresca si cambió o expiró)"""
+        cache = self._stat_cache
+        if (cache is None or cache[0] != self.get_path()
+                or time.monotonic() - cache[2] >= _STAT_TTL):
+            return self._refresh_stat()
+        return cache[1]
+    
     def _on_file_button_clicked(self):
         """Callback del botón de archivo"""
-        if self.is_save_dialog:
+        if self._cfg.is_save_dialog:
             # Diálogo de guardar archivo
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
+            file_path = self._file_dialog.run(
                 f"Guardar {self.label.text()}",
-                "",
-                self.file_filter
+                QFileDialog.FileMode.AnyFile,
+                QFileDialog.AcceptMode.AcceptSave,
+                self._cfg.file_filter,
+                self.get_path()
             )
         else:
             # Diálogo de abrir archivo
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
+            file_path = self._file_dialog.run(
                 f"Seleccionar {self.label.text()}",
-                "",
-                self.file_filter
+                QFileDialog.FileMode.ExistingFile,
+                QFileDialog.AcceptMode.AcceptOpen,
+                self._cfg.file_filter,
+                self.get_path()
             )
         
         if file_path:
@@ -155,9 +256,11 @@ class FileInputGroup(QWidget):
     
     def _on_folder_button_clicked(self):
         """Callback del botón de carpeta"""
-        folder_path = QFileDialog.getExistingDirectory(
-            self,
-            f"Seleccionar Carpeta - {self.label.text()}"
+        folder_path = self._file_dialog.run(
+            f"Seleccionar Carpeta - {self.label.text()}",
+            QFileDialog.FileMode.Directory,
+            QFileDialog.AcceptMode.AcceptOpen,
+            current=self.get_path()
         )
         
         if folder_path:
@@ -183,10 +286,12 @@ class FileInputGroup(QWidget):
             path: Ruta a establecer
         """
         self.line_edit.setText(path)
+        self._emit_path_changed()
     
     def clear(self):
         """Limpia el input"""
         self.line_edit.clear()
+        self._emit_path_changed()
     
     def is_empty(self) -> bool:
         """
@@ -204,8 +309,8 @@ class FileInputGroup(QWidget):
         Returns:
             True si es un archivo
         """
-        path = Path(self.get_path())
-        return path.is_file()
+        st = self._get_stat()
+        return st is not None and stat.S_ISREG(st.st_mode)
     
     def is_folder(self) -> bool:
         """
@@ -214,8 +319,8 @@ class FileInputGroup(QWidget):
         Returns:
             True si es una carpeta
         """
-        path = Path(self.get_path())
-        return path.is_dir()
+        st = self._get_stat()
+        return st is not None and stat.S_ISDIR(st.st_mode)
     
     def exists(self) -> bool:
         """
@@ -226,8 +331,7 @@ class FileInputGroup(QWidget):
         """
         if self.is_empty():
             return False
-        path = Path(self.get_path())
-        return path.exists()
+        return self._get_stat() is not None
     
     def set_enabled(self, enabled: bool):
         """
@@ -237,9 +341,9 @@ class FileInputGroup(QWidget):
             enabled: True para habilitar
         """
         self.line_edit.setEnabled(enabled)
-        if self.show_file_button:
+        if self._cfg.show_file_button:
             self.file_button.setEnabled(enabled)
-        if self.show_folder_button:
+        if self._cfg.show_folder_button:
             self.folder_button.setEnabled(enabled)
     
     def set_read_only(self, read_only: bool):
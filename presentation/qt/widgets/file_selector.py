@@ -2,107 +2,72 @@
 File Selector Widget - PyQt6
 """
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QLineEdit, QPushButton, QFileDialog
-from PyQt6.QtCore import Qt
 
+from .file_dialog import ReusableFileDialog
 
-class FileSelector(QWidget):
-    """Widget para seleccionar archivos"""
-    
-    def __init__(self, label_text: str, file_type: str = "Video", parent=None):
-        super().__init__(parent)
-        self.file_type = file_type
-        self._build_ui(label_text)
-    
-    def _build_ui(self, label_text: str):
-        """Construye la interfaz"""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-        
-        # Label
-        if label_text:
-            label = QLabel(label_text)
-            layout.addWidget(label)
-        
-        # Entry
-        self.line_edit = QLineEdit()
-        self.line_edit.setPlaceholderText(f"Selecciona {self.file_type}...")
-        layout.addWidget(self.line_edit, stretch=1)
-        
-        # Botón
-        btn = QPushButton("Buscar")
-        btn.setFixedWidth(70)
-        btn.clicked.connect(self._browse)
-        layout.addWidget(btn)
+
+class _PathSelectorBase(QWidget):
+    """
+    Base común: label + entry + botón que abre un diálogo.
     
-    def _browse(self):
-        """Abre diálogo de archivo"""
-        if self.file_type == "Video":
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "Seleccionar Video",
-                "",
-                "Videos (*.mkv *.mp4);;Todos los archivos (*.*)"
-            )
-        else:
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                f"Seleccionar {self.file_type}",
-                "",
-                "Todos los archivos (*.*)"
-            )
-        
-        if file_path:
-            self.line_edit.setText(file_path)
+    Las subclases solo definen los datos del widget y de su diálogo.
+    """
     
-    def get_path(self) -> str:
-        """Obtiene la ruta seleccionada"""
-        return self.line_edit.text()
+    placeholder = "Selecciona..."
+    button_text = "Buscar"
     
-    def set_path(self, path: str):
-        """Establece la ruta"""
-        self.line_edit.setText(path)
-
-
-class FolderSelector(QWidget):
-    """Widget para seleccionar carpetas"""
+    # Diálogo que abre el botón
+    dialog_title = "Seleccionar"
+    file_mode = QFileDialog.FileMode.ExistingFile
+    accept_mode = QFileDialog.AcceptMode.AcceptOpen
+    name_filter = ""
     
     def __init__(self, label_text: str, parent=None):
         super().__init__(parent)
+        self._file_dialog = ReusableFileDialog(self)
         self._build_ui(label_text)
     
     def _build_ui(self, label_text: str):
         """Construye la interfaz"""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-        
-        # Label
-        if label_text:
-            label = QLabel(label_text)
-            layout.addWidget(label)
-        
-        # Entry
-        self.line_edit = QLineEdit()
-        self.line_edit.setPlaceholderText("Selecciona carpeta...")
-        layout.addWidget(self.line_edit, stretch=1)
-        
-        # Botón
-        btn = QPushButton("Buscar")
-        btn.setFixedWidth(70)
-        btn.clicked.connect(self._browse)
-        layout.addWidget(btn)
+        self.setUpdatesEnabled(False)
+        try:
+            layout = QHBoxLayout(self)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.setSpacing(5)
+            
+            # Label
+            if label_text:
+                label = QLabel(label_text)
+                layout.addWidget(label)
+            
+            # Entry
+            self.line_edit = QLineEdit()
+            self.line_edit.setPlaceholderText(self.placeholder)
+            layout.addWidget(self.line_edit, stretch=1)
+            
+            # Botón
+            btn = QPushButton(self.button_text)
+            btn.setFixedWidth(70)
+            btn.clicked.connect(self._browse)
+            layout.addWidget(btn)
+        finally:
+            self.setUpdatesEnabled(True)
     
-    def _browse(self):
-        """Abre diálogo de carpeta"""
-        folder_path = QFileDialog.getExistingDirectory(
-            self,
-            "Seleccionar Carpeta",
-            ""
+    def _open_dialog(self) -> str:
+        """Abre el diálogo correspondiente y devuelve la ruta ('' si se cancela)"""
+        return self._file_dialog.run(
+            self.dialog_title,
+            self.file_mode,
+            self.accept_mode,
+            self.name_filter,
+            self.get_path()
         )
-        
-        if folder_path:
-            self.line_edit.setText(folder_path)
+    
+    def _browse(self):
+        """Abre diálogo y guarda la ruta elegida"""
+        path = self._open_dialog()
+        if path:
+            self.line_edit.setText(path)
     
     def get_path(self) -> str:
         """Obtiene la ruta seleccionada"""
@@ -113,51 +78,36 @@ class FolderSelector(QWidget):
         self.line_edit.setText(path)
 
 
-class OutputSelector(QWidget):
-    """Widget para seleccionar archivo de salida"""
-    
-    def __init__(self, label_text: str, parent=None):
-        super().__init__(parent)
-        self._build_ui(label_text)
+class FileSelector(_PathSelectorBase):
+    """Widget para seleccionar archivos"""
     
-    def _build_ui(self, label_text: str):
-        """Construye la interfaz"""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(5)
-        
-        # Label
-        if label_text:
-            label = QLabel(label_text)
-            layout.addWidget(label)
-        
-        # Entry
-        self.line_edit = QLineEdit()
-        self.line_edit.setPlaceholderText("Selecciona salida...")
-        layout.addWidget(self.line_edit, stretch=1)
-        
-        # Botón
-        btn = QPushButton("Guardar")
-        btn.setFixedWidth(70)
-        btn.clicked.connect(self._browse)
-        layout.addWidget(btn)
+    # Filtro del diálogo por tipo de archivo
+    _FILTERS = {
+        "Video": "Videos (*.mkv *.mp4);;Todos los archivos (*.*)",
+    }
     
-    def _browse(self):
-        """Abre diálogo de guardar"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Guardar Como",
-            "",
-            "MKV (*.mkv);;Todos los archivos (*.*)"
-        )
-        
-        if file_path:
-            self.line_edit.setText(file_path)
+    def __init__(self, label_text: str, file_type: str = "Video", parent=None):
+        self.file_type = file_type
+        self.placeholder = f"Selecciona {file_type}..."
+        self.dialog_title = f"Seleccionar {file_type}"
+        self.name_filter = self._FILTERS.get(file_type, "Todos los archivos (*.*)")
+        super().__init__(label_text, parent)
+
+
+class FolderSelector(_PathSelectorBase):
+    """Widget para seleccionar carpetas"""
     
-    def get_path(self) -> str:
-        """Obtiene la ruta seleccionada"""
-        return self.line_edit.text()
+    placeholder = "Selecciona carpeta..."
+    dialog_title = "Seleccionar Carpeta"
+    file_mode = QFileDialog.FileMode.Directory
+
+
+class OutputSelector(_PathSelectorBase):
+    """Widget para seleccionar archivo de salida"""
     
-    def set_path(self, path: str):
-        """Establece la ruta"""
-        self.line_edit.setText(path)
+    placeholder = "Selecciona salida..."
+    button_text = "Guardar"
+    dialog_title = "Guardar Como"
+    file_mode = QFileDialog.FileMode.AnyFile
+    accept_mode = QFileDialog.AcceptMode.AcceptSave
+    name_filter = "MKV (*.mkv);;Todos los archivos (*.*)"
@@ -4,10 +4,59 @@ MPV Dual Preview Widget - Widget con MPV embebido
 Maneja toda la lógica de MPV separada de la UI principal.
 """
 from PyQt6.QtWidgets import QWidget, QFrame
-from PyQt6.QtCore import QTimer, pyqtSignal
+from PyQt6.QtCore import QTimer, QEvent, QEventLoop, QMetaObject, Qt, pyqtSignal
+import os
 import platform
+import time
 from pathlib import Path
 
+try:
+    import mpv
+    MPV_AVAILABLE = True
+except (ImportError, OSError):
+    MPV_AVAILABLE = False
+
+# Plataforma resuelta una sola vez; en Windows MPV se embebe vía wid
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Opciones comunes a ambas instancias MPV
+_MPV_COMMON_KWARGS = dict(
+    keep_open='yes',
+    idle=True,
+    sub_auto='no',
+    hr_seek='yes',
+    hr_seek_framedrop='no',
+    # Decodificación por hardware (con fallback a software) y caché amplia
+    hwdec='auto-safe',
+    cache='yes',
+    demuxer_max_bytes='256MiB',
+    demuxer_readahead_secs=10
+)
+
+# Instancia LAT: sin subtítulos ni OSC/OSD (no hace falta componer overlays)
+_MPV_LAT_KWARGS = dict(
+    osc=False,
+    osd_level=0,
+    sid='no',
+    sub_visibility=False
+)
+
+
+# Propiedades de MPV observadas para los timestamps
+_OBSERVED_PROPS = ('time-pos', 'duration')
+
+# Extensiones de subtítulos externos, en orden de preferencia
+_SUB_EXTS_ORDER = ('.ass', '.ssa', '.srt', '.sub')
+_SUB_EXTS = frozenset(_SUB_EXTS_ORDER)
+
+# Ajuste interactivo: sin nuevos ajustes durante esto (ms), LAT se reubica en modo exacto
+_SYNC_BURST_MS = 300
+# Durante la ráfaga, offsets menores a esto (s) usan seek por keyframe en LAT
+_KEYFRAME_MAX_OFFSET = 0.5
+
+# Ventana mínima (s) entre logs repetidos de la misma categoría (errores siempre pasan)
+_LOG_RATE_LIMIT = 0.25
+
 
 class MPVDualPreviewWidget(QWidget):
     """
@@ -20,6 +69,11 @@ class MPVDualPreviewWidget(QWidget):
     log_signal = pyqtSignal(str, str)  # (mensaje, nivel)
     timestamps_updated = pyqtSignal(str, str)  # (time_jp, time_lat)
     
+    # Interno: emitido desde el hilo de MPV cuando cambia una propiedad observada
+    _props_changed = pyqtSignal()
+    # Interno: emitido desde el hilo de MPV cuando cambia 'track-list' del JP
+    _tracks_changed = pyqtSignal()
+    
     def __init__(self, preview_jp_frame: QFrame, preview_lat_frame: QFrame, parent=None):
         super().__init__(parent)
         
@@ -34,9 +88,53 @@ class MPVDualPreviewWidget(QWidget):
         self.current_video_lat = None
         self.is_playing = False
         
-        # Timer para timestamps
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._update_timestamps)
+        # Estado local autoritativo de pausa/mute (se escribe en MPV solo si cambia)
+        self._paused = True
+        self._mute_jp = True
+        self._mute_lat = False
+        
+        # Últimos valores publicados por los observers: {(lado, propiedad): valor}
+        self._mpv_props = {}
+        
+        # Pistas de subtítulos del JP (las actualiza el observer de 'track-list')
+        self._jp_sub_tracks = []
+        self._last_timestamps = None
+        
+        # Duración ya formateada (constante por video)
+        self._dur_str_jp = "0:00:00"
+        self._dur_str_lat = "0:00:00"
+        
+        # Último log emitido por categoría (rate-limit de los caminos calientes)
+        self._last_log_ts = {}
+        
+        # Último sub_delay aplicado (evita escrituras duplicadas en MPV)
+        self._last_sub_delay = None
+        
+        # Ajuste interactivo (lo indica quien llama): LAT por keyframe y commit exacto al terminar
+        self._sync_interactive = False
+        self._burst_lat_seek = None  # (posición LAT calculada, offset en s)
+        self._sync_commit_timer = QTimer(self)
+        self._sync_commit_timer.setSingleShot(True)
+        self._sync_commit_timer.setInterval(_SYNC_BURST_MS)
+        self._sync_commit_timer.timeout.connect(self._commit_sync)
+        
+        # True mientras load_videos/_apply_sync_now esperan a MPV en un QEventLoop local
+        # (timers y clicks siguen llegando: no se debe reentrar sobre estado a medias)
+        self._syncing = False
+        
+        # Debounce de apply_sync: solo se aplica el último par de offsets
+        self._pending_sync = None
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(100)
+        self._sync_timer.timeout.connect(self._apply_sync_deferred)
+        
+        # Timestamps alineados al ciclo de pintado: se recalculan en el UpdateRequest
+        # de la ventana (un frame), o con debounce de 100 ms si aún no hay ventana
+        self._pos_dirty = False
+        self._vsync_window = None
+        self._timestamps_pending = False
+        self._props_changed.connect(self._schedule_timestamps)
     
     def load_videos(self, video_jp_path: str, video_lat_path: str):
         """
@@ -46,6 +144,11 @@ class MPVDualPreviewWidget(QWidget):
             video_jp_path: Ruta al video japonés
             video_lat_path: Ruta al video latino
         """
+        if self._syncing:
+            self.log_signal.emit("⚠ Espera a que termine la carga/sincronización en curso", "warning")
+            return
+        
+        self._syncing = True
         try:
             self.log_signal.emit(f"Cargando Video 1: {video_jp_path}", "info")
             self.log_signal.emit(f"Cargando Video 2: {video_lat_path}", "info")
@@ -56,19 +159,34 @@ class MPVDualPreviewWidget(QWidget):
             if not self.mpv_lat:
                 self._init_mpv_lat()
             
-            # Cargar videos
-            self.mpv_jp.play(video_jp_path)
-            self.mpv_jp.pause = True
+            # Cargar videos y esperar (sin bloquear Qt) a que MPV los abra
+            def _play_both():
+                self.mpv_jp.play(video_jp_path)
+                self.mpv_jp.pause = True
+                self.mpv_lat.play(video_lat_path)
+                self.mpv_lat.pause = True
+            
+            self._await_event((self.mpv_jp, self.mpv_lat), 'file-loaded', 3000, _play_both)
+            self._refresh_jp_tracks()
+            
+            # MPV embebido y con video: pinta cada pixel, Qt deja de rellenar el fondo
+            if _IS_WINDOWS:
+                for frame in (self.preview_jp_frame, self.preview_lat_frame):
+                    frame.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+                    frame.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
             
-            self.mpv_lat.play(video_lat_path)
-            self.mpv_lat.pause = True
+            # Formatear la duración una sola vez por carga
+            self._dur_str_jp = self._format_time(self.mpv_jp.duration or 0)
+            self._dur_str_lat = self._format_time(self.mpv_lat.duration or 0)
             
-            import time
-            time.sleep(0.3)
+            self._paused = True
+            self.is_playing = False
             
             # Por defecto: JP muted, LAT audible
-            self.mpv_jp.mute = True
-            self.mpv_lat.mute = False
+            self._mute_jp = True
+            self._mute_lat = False
+            self.mpv_jp.mute = self._mute_jp
+            self.mpv_lat.mute = self._mute_lat
             
             # Cargar subtítulos del video LAT en el preview JP
             self._load_subtitles_to_jp(video_lat_path)
@@ -76,107 +194,222 @@ class MPVDualPreviewWidget(QWidget):
             self.current_video_jp = video_jp_path
             self.current_video_lat = video_lat_path
             
-            # Iniciar timer de timestamps
-            self.timer.start(500)
+            # Publicar timestamps iniciales
+            self._schedule_timestamps()
             
             self.log_signal.emit("✅ Previews cargados", "success")
-            
+        
         except Exception as e:
             self.log_signal.emit(f"Error: {str(e)}", "error")
             raise
+        finally:
+            self._syncing = False
+    
+    def _await_tracks(self, timeout_ms: int, action):
+        """
+        Ejecuta `action` y espera (sin congelar la UI) a que cambie 'track-list' del JP.
+        
+        La señal llega encolada desde el hilo de MPV, así que no se pierde aunque
+        el observer dispare antes de entrar al QEventLoop.
+        """
+        loop = QEventLoop()
+        timeout = QTimer()
+        timeout.setSingleShot(True)
+        timeout.timeout.connect(loop.quit)
+        self._tracks_changed.connect(loop.quit, Qt.ConnectionType.QueuedConnection)
+        try:
+            action()
+            timeout.start(timeout_ms)
+            loop.exec()
+        finally:
+            timeout.stop()
+            self._tracks_changed.disconnect(loop.quit)
+    
+    def _await_event(self, players: tuple, event_name: str, timeout_ms: int, action=None):
+        """
+        Espera un evento de MPV en todas las instancias dadas sin congelar la UI.
+        
+        Registra el callback antes de ejecutar `action` (para no perder el evento)
+        y corre un QEventLoop local hasta que todas lo emitan o venza el timeout.
+        
+        Args:
+            players: Instancias MPV a observar
+            event_name: Nombre del evento ('file-loaded', 'playback-restart', ...)
+            timeout_ms: Tiempo máximo de espera
+            action: Callable que dispara el evento (play, seek...)
+        """
+        loop = QEventLoop()
+        pending = {id(p) for p in players}
+        callbacks = []
+        
+        def make_callback(player):
+            @player.event_callback(event_name)
+            def _on_event(_event):
+                pending.discard(id(player))
+                if not pending:
+                    # Llamado desde el hilo de eventos de MPV: encolar en Qt
+                    QMetaObject.invokeMethod(loop, "quit", Qt.ConnectionType.QueuedConnection)
+            return _on_event
+        
+        for player in players:
+            callbacks.append(make_callback(player))
+        
+        timeout = QTimer()
+        timeout.setSingleShot(True)
+        timeout.timeout.connect(loop.quit)
+        try:
+            if action is not None:
+                action()
+            if pending:
+                timeout.start(timeout_ms)
+                loop.exec()
+        finally:
+            timeout.stop()
+            for callback in callbacks:
+                callback.unregister_mpv_events()
+    
+    def _create_mpv(self, frame: QFrame, **extra):
+        """Crea una instancia MPV (embebida en `frame` en Windows)"""
+        if not MPV_AVAILABLE:
+            raise RuntimeError("MPV no disponible")
+        
+        if _IS_WINDOWS:
+            return mpv.MPV(wid=str(int(frame.winId())), **_MPV_COMMON_KWARGS, **extra)
+        return mpv.MPV(**_MPV_COMMON_KWARGS, **extra)
     
     def _init_mpv_jp(self):
         """Inicializa MPV para video JP con subtítulos habilitados"""
-        import mpv
-        
-        if platform.system() == 'Windows':
-            wid = int(self.preview_jp_frame.winId())
-            self.mpv_jp = mpv.MPV(
-                wid=str(wid), 
-                keep_open='yes', 
-                idle=True,
-                sub_auto='no',
-                hr_seek='yes',
-                hr_seek_framedrop='no'
-            )
-        else:
-            self.mpv_jp = mpv.MPV(
-                keep_open='yes', 
-                idle=True,
-                sub_auto='no',
-                hr_seek='yes',
-                hr_seek_framedrop='no'
-            )
+        self.mpv_jp = self._create_mpv(self.preview_jp_frame)
+        
+        for name in _OBSERVED_PROPS:
+            self.mpv_jp.observe_property(name, self._on_prop_jp)
+        self.mpv_jp.observe_property('track-list', self._on_tracks_jp)
     
     def _init_mpv_lat(self):
         """Inicializa MPV para video LAT SIN subtítulos"""
-        import mpv
-        
-        if platform.system() == 'Windows':
-            wid = int(self.preview_lat_frame.winId())
-            self.mpv_lat = mpv.MPV(
-                wid=str(wid), 
-                keep_open='yes', 
-                idle=True,
-                sub_auto='no',
-                hr_seek='yes',
-                hr_seek_framedrop='no'
-            )
+        self.mpv_lat = self._create_mpv(self.preview_lat_frame, **_MPV_LAT_KWARGS)
+        
+        for name in _OBSERVED_PROPS:
+            self.mpv_lat.observe_property(name, self._on_prop_lat)
+    
+    def _refresh_jp_tracks(self):
+        """Lee 'track-list' del JP de forma síncrona (el observer puede ir atrasado)"""
+        self._jp_sub_tracks = [t for t in (self.mpv_jp.track_list or []) if t.get('type') == 'sub']
+    
+    def _on_tracks_jp(self, name, value):
+        """Observer MPV (hilo de MPV): pistas de subtítulos del JP"""
+        self._jp_sub_tracks = [t for t in (value or []) if t.get('type') == 'sub']
+        self._tracks_changed.emit()
+    
+    def _on_prop_jp(self, name, value):
+        """Observer MPV (hilo de MPV): guarda el valor y avisa a Qt"""
+        if name == 'duration':
+            self._dur_str_jp = self._format_time(value or 0)
         else:
-            self.mpv_lat = mpv.MPV(
-                keep_open='yes', 
-                idle=True,
-                sub_auto='no',
-                hr_seek='yes',
-                hr_seek_framedrop='no'
-            )
+            self._mpv_props[('jp', name)] = value
+        self._props_changed.emit()
+    
+    def _on_prop_lat(self, name, value):
+        """Observer MPV (hilo de MPV): guarda el valor y avisa a Qt"""
+        if name == 'duration':
+            self._dur_str_lat = self._format_time(value or 0)
+        else:
+            self._mpv_props[('lat', name)] = value
+        self._props_changed.emit()
+    
+    def _schedule_timestamps(self):
+        """Marca los timestamps como sucios y pide un update para el próximo frame"""
+        self._pos_dirty = True
+        window = self._get_vsync_window()
+        if window is not None:
+            window.requestUpdate()
+        elif not self._timestamps_pending:
+            self._timestamps_pending = True
+            QTimer.singleShot(100, self._update_timestamps)
+    
+    def _get_vsync_window(self):
+        """QWindow de nivel superior del preview (filtro de eventos instalado una vez)"""
+        if self._vsync_window is None:
+            window = self.preview_jp_frame.window().windowHandle()
+            if window is None:
+                return None
+            window.installEventFilter(self)
+            self._vsync_window = window
+        return self._vsync_window
+    
+    def eventFilter(self, obj, event):
+        """Actualiza los timestamps justo antes del repintado (UpdateRequest)"""
+        if (obj is self._vsync_window and self._pos_dirty
+                and event.type() == QEvent.Type.UpdateRequest):
+            self._update_timestamps()
+        return super().eventFilter(obj, event)
     
     def _load_subtitles_to_jp(self, video_lat_path: str):
         """Carga los subtítulos del video LAT en el preview JP"""
         try:
-            import os
-            
+            # Un solo listado del directorio en vez de un stat por extensión
             base_path = os.path.splitext(video_lat_path)[0]
-            subtitle_extensions = ['.ass', '.ssa', '.srt', '.sub']
+            dirname, stem = os.path.split(base_path)
             
-            subtitle_file = None
-            for ext in subtitle_extensions:
-                potential_sub = base_path + ext
-                if os.path.exists(potential_sub):
-                    subtitle_file = potential_sub
-                    self.log_signal.emit(f"✅ Encontrado: {potential_sub}", "success")
-                    break
+            found = {}
+            with os.scandir(dirname or '.') as it:
+                for entry in it:
+                    name_stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
+                    if name_stem == stem and ext in _SUB_EXTS:
+                        found.setdefault(ext, entry.path)
             
+            subtitle_file = next((found[ext] for ext in _SUB_EXTS_ORDER if ext in found), None)
             if subtitle_file:
-                import time
-                
+                self.log_signal.emit(f"✅ Encontrado: {subtitle_file}", "success")
                 self.log_signal.emit(f"Cargando subtítulos en Video 1: {subtitle_file}", "info")
                 
-                self.mpv_jp.sub_add(subtitle_file, select=True)
-                time.sleep(0.1)
+                # Esperar a que MPV publique la nueva pista (en vez de dormir el hilo de la UI)
+                self._await_tracks(1000, lambda: self.mpv_jp.sub_add(subtitle_file, select=True))
+                self._refresh_jp_tracks()
                 
                 self.mpv_jp.sid = 1
                 self.mpv_jp.sub_visibility = True
                 
-                try:
-                    track_list = self.mpv_jp.track_list
-                    sub_tracks = [t for t in track_list if t.get('type') == 'sub']
-                    self.log_signal.emit(f"✅ Subtítulos cargados: {os.path.basename(subtitle_file)} ({len(sub_tracks)} pistas)", "success")
-                except:
-                    self.log_signal.emit(f"✅ Subtítulos cargados: {os.path.basename(subtitle_file)}", "success")
+                sub_tracks = self._jp_sub_tracks
+                self.log_signal.emit(f"✅ Subtítulos cargados: {os.path.basename(subtitle_file)} ({len(sub_tracks)} pistas)", "success")
             else:
                 self.log_signal.emit("⚠ No se encontró archivo de subtítulos externo", "warning")
-                    
+        
         except Exception as e:
             self.log_signal.emit(f"Error cargando subtítulos: {str(e)}", "error")
     
-    def apply_sync(self, audio_offset_ms: int, subtitle_offset_ms: int):
+    def apply_sync(self, audio_offset_ms: int, subtitle_offset_ms: int, interactive: bool = False):
+        """
+        Programa la sincronización (debounce de 100 ms).
+        
+        Llamadas rápidas sucesivas se agrupan: solo se aplican los últimos offsets.
+        
+        Args:
+            audio_offset_ms: Offset de audio en milisegundos
+            subtitle_offset_ms: Offset de subtítulos en milisegundos
+            interactive: True si viene de un ajuste del usuario (botones de offset)
+        """
+        self._pending_sync = (audio_offset_ms, subtitle_offset_ms, interactive)
+        self._sync_timer.start()
+    
+    def _apply_sync_deferred(self):
+        """Aplica los offsets pendientes del debounce"""
+        pending, self._pending_sync = self._pending_sync, None
+        if pending is not None:
+            self._apply_sync_now(*pending)
+    
+    def _apply_sync_now(self, audio_offset_ms: int, subtitle_offset_ms: int, interactive: bool = False):
         """
         Aplica sincronización con ALTA PRECISIÓN.
         
+        En un ajuste interactivo el seek de LAT usa precisión por keyframe; si no
+        llegan más ajustes en 300 ms, _commit_sync reubica LAT en modo exacto.
+        
         Args:
             audio_offset_ms: Offset de audio en milisegundos
             subtitle_offset_ms: Offset de subtítulos en milisegundos
+            interactive: True si viene de un ajuste del usuario
         """
         if not self.mpv_jp or not self.mpv_lat:
             return
@@ -184,16 +417,24 @@ class MPVDualPreviewWidget(QWidget):
         if not self.current_video_jp or not self.current_video_lat:
             return
         
+        # Reentrada desde el QEventLoop de una espera en curso: reprogramar
+        if self._syncing:
+            if self._pending_sync is None:
+                self._pending_sync = (audio_offset_ms, subtitle_offset_ms, interactive)
+            self._sync_timer.start()
+            return
+        
+        self._sync_interactive = interactive
+        self._syncing = True
+        
         try:
-            import time
-            
             current_pos_jp = self.mpv_jp.time_pos or 0
             was_playing = self.is_playing
             
-            # Pausar ambos
-            self.mpv_jp.pause = True
-            self.mpv_lat.pause = True
-            time.sleep(0.05)
+            # Pausar ambos (asíncrono: no esperar a cada instancia por separado)
+            self.mpv_jp.command_async('set_property', 'pause', 'yes')
+            self.mpv_lat.command_async('set_property', 'pause', 'yes')
+            self._paused = True
             
             # Retroceder un poco para suavizar
             rewind_amount = 2.0
@@ -206,26 +447,61 @@ class MPVDualPreviewWidget(QWidget):
             if sync_pos_lat < 0:
                 sync_pos_lat = 0
             
-            # Seek con precisión exacta
-            self.mpv_jp.seek(sync_pos_jp, reference='absolute', precision='exact')
-            self.mpv_lat.seek(sync_pos_lat, reference='absolute', precision='exact')
+            # JP siempre exacto; LAT por keyframe mientras dura un ajuste interactivo
+            if self._sync_interactive and abs(offset_seconds) < _KEYFRAME_MAX_OFFSET:
+                lat_precision = 'keyframe'
+                self._burst_lat_seek = (sync_pos_lat, offset_seconds)
+                self._sync_commit_timer.start()  # Commit exacto al terminar la ráfaga
+            else:
+                lat_precision = 'exact'
+                self._burst_lat_seek = None
+                self._sync_commit_timer.stop()
             
-            time.sleep(0.2)
+            # Seek en paralelo en ambas instancias (esperar a que ambos terminen)
+            def _seek_both():
+                self.mpv_jp.command_async('seek', sync_pos_jp, 'absolute', 'exact')
+                self.mpv_lat.command_async('seek', sync_pos_lat, 'absolute', lat_precision)
+            
+            self._await_event((self.mpv_jp, self.mpv_lat), 'playback-restart', 500, _seek_both)
             
             # Aplicar subtitle delay
             if subtitle_offset_ms != 0:
                 subtitle_delay = subtitle_offset_ms / 1000.0
-                self.mpv_jp.sub_delay = subtitle_delay
-                self.log_signal.emit(f"Subtitle delay aplicado: {subtitle_delay:.3f}s", "info")
+                self._set_sub_delay(subtitle_delay)
+                self._log('sub_delay', f"Subtitle delay aplicado: {subtitle_delay:.3f}s", "info")
             
             # Reanudar si estaba reproduciendo
             if was_playing:
-                time.sleep(0.05)
-                self.mpv_jp.pause = False
-                self.mpv_lat.pause = False
-            
-            self.log_signal.emit(f"✓ Sync: JP={sync_pos_jp:.3f}s, LAT={sync_pos_lat:.3f}s (offset={audio_offset_ms}ms)", "success")
+                self._set_paused(False)
             
+            self._log('sync', f"✓ Sync: JP={sync_pos_jp:.3f}s, LAT={sync_pos_lat:.3f}s (offset={audio_offset_ms}ms)", "success")
+        
+        except Exception as e:
+            self.log_signal.emit(f"Error en sync: {str(e)}", "error")
+        finally:
+            self._syncing = False
+    
+    def _commit_sync(self):
+        """
+        Fin de la ráfaga de ajustes: reubica solo LAT en modo exacto.
+        
+        Usa la posición ya calculada en la ráfaga (sin retroceder ni pausar de nuevo);
+        si se está reproduciendo, la recalcula desde la posición actual de JP.
+        """
+        if self._syncing:
+            self._sync_commit_timer.start()  # Reintentar cuando termine la espera en curso
+            return
+        
+        burst, self._burst_lat_seek = self._burst_lat_seek, None
+        self._sync_interactive = False
+        if burst is None or not self.mpv_jp or not self.mpv_lat:
+            return
+        
+        sync_pos_lat, offset_seconds = burst
+        try:
+            if self.is_playing:
+                sync_pos_lat = max(0, (self.mpv_jp.time_pos or 0) - offset_seconds)
+            self.mpv_lat.command_async('seek', sync_pos_lat, 'absolute', 'exact')
         except Exception as e:
             self.log_signal.emit(f"Error en sync: {str(e)}", "error")
     
@@ -233,8 +509,30 @@ class MPVDualPreviewWidget(QWidget):
         """Aplica solo el offset de subtítulos"""
         if self.mpv_jp:
             subtitle_delay = subtitle_offset_ms / 1000.0
-            self.mpv_jp.sub_delay = subtitle_delay
-            self.log_signal.emit(f"Subtitle delay: {subtitle_delay:.3f}s", "info")
+            if self._set_sub_delay(subtitle_delay):
+                self._log('sub_delay', f"Subtitle delay: {subtitle_delay:.3f}s", "info")
+    
+    def _log(self, category: str, message: str, level: str):
+        """Emite log_signal como máximo una vez cada 250 ms por categoría"""
+        now = time.monotonic()
+        if level != "error" and now - self._last_log_ts.get(category, 0.0) < _LOG_RATE_LIMIT:
+            return
+        self._last_log_ts[category] = now
+        self.log_signal.emit(message, level)
+    
+    def _set_sub_delay(self, delay_seconds: float) -> bool:
+        """
+        Escribe sub_delay en el MPV JP solo si cambió (tolerancia 1 ms).
+        
+        Returns:
+            True si se aplicó, False si era el mismo valor
+        """
+        last = self._last_sub_delay
+        if last is not None and abs(delay_seconds - last) < 1e-3:
+            return False
+        self._last_sub_delay = delay_seconds
+        self.mpv_jp.sub_delay = delay_seconds
+        return True
     
     def toggle_play(self):
         """Toggle play/pause"""
@@ -242,8 +540,7 @@ class MPVDualPreviewWidget(QWidget):
             return
         
         self.is_playing = not self.is_playing
-        self.mpv_jp.pause = not self.is_playing
-        self.mpv_lat.pause = not self.is_playing
+        self._set_paused(not self.is_playing)
     
     def stop(self):
         """Detiene y reinicia"""
@@ -252,10 +549,17 @@ class MPVDualPreviewWidget(QWidget):
         
         self.mpv_jp.seek(0, reference='absolute')
         self.mpv_lat.seek(0, reference='absolute')
-        self.mpv_jp.pause = True
-        self.mpv_lat.pause = True
+        self._set_paused(True)
         self.is_playing = False
     
+    def _set_paused(self, paused: bool):
+        """Escribe pause en ambas instancias solo si el estado cambia"""
+        if paused == self._paused:
+            return
+        self._paused = paused
+        self.mpv_jp.pause = paused
+        self.mpv_lat.pause = paused
+    
     def seek(self, seconds: int):
         """Navega en ambos videos"""
         if not self.mpv_jp or not self.mpv_lat:
@@ -269,54 +573,66 @@ class MPVDualPreviewWidget(QWidget):
         if not self.mpv_jp:
             return False
         
-        self.mpv_jp.mute = not self.mpv_jp.mute
-        return self.mpv_jp.mute
+        self._mute_jp = not self._mute_jp
+        self.mpv_jp.mute = self._mute_jp
+        return self._mute_jp
     
     def toggle_mute_lat(self) -> bool:
         """Toggle mute LAT. Returns nuevo estado (True = muted)"""
         if not self.mpv_lat:
             return False
         
-        self.mpv_lat.mute = not self.mpv_lat.mute
-        return self.mpv_lat.mute
+        self._mute_lat = not self._mute_lat
+        self.mpv_lat.mute = self._mute_lat
+        return self._mute_lat
     
     def _update_timestamps(self):
-        """Actualiza timestamps y emite signal"""
-        try:
-            time_jp = "0:00:00/0:00:00"
-            time_lat = "0:00:00/0:00:00"
-            
-            if self.mpv_jp and self.current_video_jp:
-                pos = self.mpv_jp.time_pos or 0
-                dur = self.mpv_jp.duration or 0
-                time_jp = f"Time: {self._format_time(pos)}/{self._format_time(dur)}"
-            
-            if self.mpv_lat and self.current_video_lat:
-                pos = self.mpv_lat.time_pos or 0
-                dur = self.mpv_lat.duration or 0
-                time_lat = f"Time: {self._format_time(pos)}/{self._format_time(dur)}"
-            
+        """Emite timestamps a partir de los valores observados (sin leer MPV)"""
+        self._timestamps_pending = False
+        self._pos_dirty = False
+        props = self._mpv_props
+        
+        time_jp = "0:00:00/0:00:00"
+        time_lat = "0:00:00/0:00:00"
+        
+        if self.mpv_jp and self.current_video_jp:
+            pos = props.get(('jp', 'time-pos')) or 0
+            time_jp = f"Time: {self._format_time(pos)}/{self._dur_str_jp}"
+        
+        if self.mpv_lat and self.current_video_lat:
+            pos = props.get(('lat', 'time-pos')) or 0
+            time_lat = f"Time: {self._format_time(pos)}/{self._dur_str_lat}"
+        
+        # Solo emitir si el texto cambió
+        timestamps = (time_jp, time_lat)
+        if timestamps != self._last_timestamps:
+            self._last_timestamps = timestamps
             self.timestamps_updated.emit(time_jp, time_lat)
-        except:
-            pass
     
-    def _format_time(self, seconds: float) -> str:
+    @staticmethod
+    def _format_time(seconds: float) -> str:
         """Formatea segundos a H:MM:SS"""
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        s = int(seconds % 60)
+        m, s = divmod(int(seconds), 60)
+        h, m = divmod(m, 60)
         return f"{h}:{m:02d}:{s:02d}"
     
     def cleanup(self):
         """Limpia recursos"""
-        self.timer.stop()
+        if self._vsync_window is not None:
+            self._vsync_window.removeEventFilter(self)
+            self._vsync_window = None
         if self.mpv_jp:
             try:
+                for name in _OBSERVED_PROPS:
+                    self.mpv_jp.unobserve_property(name, self._on_prop_jp)
+                self.mpv_jp.unobserve_property('track-list', self._on_tracks_jp)
                 self.mpv_jp.terminate()
             except:
                 pass
         if self.mpv_lat:
             try:
+                for name in _OBSERVED_PROPS:
+                    self.mpv_lat.unobserve_property(name, self._on_prop_lat)
                 self.mpv_lat.terminate()
             except:
                 pass
@@ -16,6 +16,23 @@ except (ImportError, OSError) as e:
     print(f"⚠️ MPV no disponible: {e}")
     print("⚠️ Asegúrate de tener libmpv instalado y en el PATH del sistema")
 
+# Plataforma resuelta una sola vez; en Windows MPV se embebe vía wid
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Opciones de la instancia MPV
+_MPV_COMMON_KWARGS = dict(
+    keep_open='yes',
+    idle=True,
+    sub_auto='no',
+    hr_seek='yes',
+    hr_seek_framedrop='no',
+    # Decodificación por hardware (con fallback a software) y caché amplia
+    hwdec='auto-safe',
+    cache='yes',
+    demuxer_max_bytes='256MiB',
+    demuxer_readahead_secs=10
+)
+
 
 class MPVPreviewWidget(QWidget):
     """
@@ -40,8 +57,19 @@ class MPVPreviewWidget(QWidget):
         self.is_playing = False
         self.current_video = None
         
-        # Inicializar MPV
-        self._init_mpv()
+        # Últimos delays aplicados (evita escrituras duplicadas en MPV)
+        self._last_audio_delay = None
+        self._last_sub_delay = None
+        
+        # Pistas ya filtradas (las actualiza el observer de 'track-list')
+        self._audio_tracks = []
+        self._sub_tracks = []
+        # El observer corre asíncrono en el hilo de MPV: tras cargar/agregar pistas
+        # el cache puede ir atrasado y se relee una vez de forma síncrona
+        self._tracks_stale = False
+        
+        # MPV se crea en el primer uso (ver _ensure_mpv)
+        self._mpv_init_attempted = False
     
     def _init_mpv(self):
         """Inicializa MPV"""
@@ -50,24 +78,13 @@ class MPVPreviewWidget(QWidget):
             return
         
         try:
-            if platform.system() == 'Windows':
+            if _IS_WINDOWS:
                 wid = int(self.preview_frame.winId())
-                self.mpv = mpv.MPV(
-                    wid=str(wid),
-                    keep_open='yes',
-                    idle=True,
-                    sub_auto='no',
-                    hr_seek='yes',
-                    hr_seek_framedrop='no'
-                )
+                self.mpv = mpv.MPV(wid=str(wid), **_MPV_COMMON_KWARGS)
             else:
-                self.mpv = mpv.MPV(
-                    keep_open='yes',
-                    idle=True,
-                    sub_auto='no',
-                    hr_seek='yes',
-                    hr_seek_framedrop='no'
-                )
+                self.mpv = mpv.MPV(**_MPV_COMMON_KWARGS)
+            
+            self.mpv.observe_property('track-list', self._on_track_list)
             
             self.log_signal.emit("✅ MPV inicializado", "success")
         
@@ -75,6 +92,18 @@ class MPVPreviewWidget(QWidget):
             self.log_signal.emit(f"❌ Error inicializando MPV: {str(e)}", "error")
             self.mpv = None
     
+    def _ensure_mpv(self) -> bool:
+        """
+        Inicializa MPV de forma diferida (un solo intento).
+        
+        Returns:
+            True si hay instancia MPV disponible
+        """
+        if self.mpv is None and not self._mpv_init_attempted:
+            self._mpv_init_attempted = True
+            self._init_mpv()
+        return self.mpv is not None
+    
     def load_video(self, video_path: str):
         """
         Carga un video en el preview.
@@ -82,12 +111,15 @@ class MPVPreviewWidget(QWidget):
         Args:
             video_path: Ruta al video
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             self.log_signal.emit("❌ MPV no disponible", "error")
             return
         
         try:
             self.mpv.loadfile(video_path)
+            self._audio_tracks = []
+            self._sub_tracks = []
+            self._tracks_stale = True
             self.current_video = video_path
             self.is_playing = False
             self.log_signal.emit(f"✅ Video cargado: {video_path}", "success")
@@ -103,11 +135,12 @@ class MPVPreviewWidget(QWidget):
             audio_path: Ruta al audio
             select: Si True, selecciona este audio
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             return
         
         try:
             self.mpv.audio_add(audio_path, select='yes' if select else 'no')
+            self._tracks_stale = True
             self.log_signal.emit(f"✅ Audio agregado: {audio_path}", "success")
         
         except Exception as e:
@@ -121,11 +154,12 @@ class MPVPreviewWidget(QWidget):
             subtitle_path: Ruta a subtitulos
             select: Si True, selecciona estos subtitulos
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             return
         
         try:
             self.mpv.sub_add(subtitle_path, select='yes' if select else 'no')
+            self._tracks_stale = True
             self.log_signal.emit(f"✅ Subtitulos agregados: {subtitle_path}", "success")
         
         except Exception as e:
@@ -167,7 +201,7 @@ class MPVPreviewWidget(QWidget):
         Args:
             track_id: ID de la pista (1-indexed)
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             return
         
         self.mpv.aid = track_id
@@ -179,7 +213,7 @@ class MPVPreviewWidget(QWidget):
         Args:
             track_id: ID de la pista (1-indexed)
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             return
         
         self.mpv.sid = track_id
@@ -191,7 +225,7 @@ class MPVPreviewWidget(QWidget):
         Args:
             audio_path: Ruta al archivo de audio
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             return
         
         try:
@@ -203,6 +237,7 @@ class MPVPreviewWidget(QWidget):
             # El tercer parámetro puede ser: 'select', 'auto', 'cached'
             # 'select' = agregar y seleccionar automáticamente
             self.mpv.command('audio-add', abs_path, 'select')
+            self._tracks_stale = True
             print(f"✅ Audio externo agregado: {abs_path}")
         except Exception as e:
             print(f"❌ Error al cargar audio externo: {e}")
@@ -216,7 +251,7 @@ class MPVPreviewWidget(QWidget):
         Args:
             subtitle_path: Ruta al archivo de subtítulos
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             return
         
         try:
@@ -228,6 +263,7 @@ class MPVPreviewWidget(QWidget):
             # El tercer parámetro puede ser: 'select', 'auto', 'cached'
             # 'auto' = agregar sin seleccionar automáticamente
             self.mpv.command('sub-add', abs_path, 'auto')
+            self._tracks_stale = True
             print(f"✅ Subtítulos externos agregados: {abs_path}")
         except Exception as e:
             print(f"❌ Error al cargar subtítulos externos: {e}")
@@ -241,12 +277,15 @@ class MPVPreviewWidget(QWidget):
         Args:
             delay_ms: Delay en milisegundos (positivo = adelantar, negativo = atrasar)
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             return
         
         try:
             # MPV usa segundos, convertir de milisegundos
             delay_seconds = delay_ms / 1000.0
+            if self._last_audio_delay is not None and abs(delay_seconds - self._last_audio_delay) < 1e-3:
+                return
+            self._last_audio_delay = delay_seconds
             self.mpv.audio_delay = delay_seconds
         except Exception as e:
             print(f"Error al establecer delay de audio: {e}")
@@ -258,42 +297,53 @@ class MPVPreviewWidget(QWidget):
         Args:
             delay_ms: Delay en milisegundos (positivo = adelantar, negativo = atrasar)
         """
-        if not self.mpv:
+        if not self._ensure_mpv():
             return
         
         try:
             # MPV usa segundos, convertir de milisegundos
             delay_seconds = delay_ms / 1000.0
+            if self._last_sub_delay is not None and abs(delay_seconds - self._last_sub_delay) < 1e-3:
+                return
+            self._last_sub_delay = delay_seconds
             self.mpv.sub_delay = delay_seconds
         except Exception as e:
             print(f"Error al establecer delay de subtítulos: {e}")
     
+    def _on_track_list(self, name, value):
+        """Observer MPV (hilo de MPV): refiltra las pistas solo cuando cambian"""
+        track_list = value or []
+        self._audio_tracks = [t for t in track_list if t.get('type') == 'audio']
+        self._sub_tracks = [t for t in track_list if t.get('type') == 'sub']
+    
+    def _refresh_tracks_if_stale(self):
+        """Relee 'track-list' de forma síncrona si hubo una carga desde la última lectura"""
+        if self._tracks_stale:
+            self._tracks_stale = False
+            try:
+                self._on_track_list('track-list', self.mpv.track_list)
+            except Exception:
+                pass
+    
     def get_audio_tracks(self):
-        """Retorna lista de pistas de audio disponibles"""
+        """Retorna lista de pistas de audio disponibles (cacheada, sin IPC salvo tras una carga)"""
         if not self.mpv:
             return []
-        
-        try:
-            track_list = self.mpv.track_list
-            return [t for t in track_list if t.get('type') == 'audio']
-        except:
-            return []
+        self._refresh_tracks_if_stale()
+        return self._audio_tracks
     
     def get_subtitle_tracks(self):
-        """Retorna lista de pistas de subtitulos disponibles"""
+        """Retorna lista de pistas de subtitulos disponibles (cacheada, sin IPC salvo tras una carga)"""
         if not self.mpv:
             return []
-        
-        try:
-            track_list = self.mpv.track_list
-            return [t for t in track_list if t.get('type') == 'sub']
-        except:
-            return []
+        self._refresh_tracks_if_stale()
+        return self._sub_tracks
     
     def cleanup(self):
         """Limpia recursos"""
         if self.mpv:
             try:
+                self.mpv.unobserve_property('track-list', self._on_track_list)
                 self.mpv.terminate()
             except:
                 pass
@@ -5,10 +5,56 @@ Widget especializado que encapsula un frame de preview con controles
 de navegación y playback integrados, siguiendo principios de diseño profesional.
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFrame, 
-                              QLabel, QPushButton, QSizePolicy)
+                              QLabel, QPushButton, QSizePolicy, QButtonGroup)
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtGui import QFont
-from typing import Optional
+from typing import NamedTuple, Optional
+
+from ..layouts.theme_manager import ThemeManager, register_style_cache
+
+
+class _PanelStyles(NamedTuple):
+    """Hojas de estilo ya ensambladas para PreviewPanel"""
+    title_qss: str
+    frame_qss: str
+    time_label_qss: str
+    nav_qss: str
+    play_qss: str
+    stop_qss: str
+
+
+# Plantillas QSS (se formatean una vez por tema)
+_FRAME_TMPL = """
+            QFrame {{
+                background-color: #000000;
+                border: 2px solid {border};
+                border-radius: {radius_md}px;
+            }}
+        """
+
+# Botones de navegación: (atributo, texto, segundos)
+_NAV_BUTTONS = (
+    ("btn_minus10", "◀◀ -10s", -10),
+    ("btn_minus1", "◀ -1s", -1),
+    ("btn_plus1", "+1s ▶", 1),
+    ("btn_plus10", "+10s ▶▶", 10),
+)
+
+_PLAYBACK_BTN_TMPL = """
+            QPushButton {{
+                background-color: {bg};
+                color: {text};
+                border: 1px solid {border};
+                border-radius: {radius_md}px;
+                font-size: 18pt;
+            }}
+            QPushButton:hover {{
+                background-color: {bg_hover};
+            }}
+            QPushButton:pressed {{
+                background-color: {bg};
+            }}
+        """
 
 
 class PreviewPanel(QWidget):
@@ -35,6 +81,9 @@ class PreviewPanel(QWidget):
     seek_requested = pyqtSignal(float)  # Segundos a navegar (+ o -)
     mute_clicked = pyqtSignal()
     
+    # QSS compartido entre instancias, indexado por tema
+    _stylesheet_cache: dict = {}
+    
     def __init__(
         self,
         title: str = "Preview",
@@ -60,9 +109,10 @@ class PreviewPanel(QWidget):
         self.min_width = min_width
         self.min_height = min_height
         
+        self._theme_applied = False  # El tema se aplica en el primer showEvent
+        
         self._build_ui()
         self._connect_signals()
-        self._apply_theme()
     
     def _build_ui(self):
         """Construye la interfaz del widget"""
@@ -95,16 +145,15 @@ class PreviewPanel(QWidget):
         nav_layout = QHBoxLayout()
         nav_layout.setSpacing(4)
         
-        self.btn_minus10 = QPushButton("◀◀ -10s")
-        self.btn_minus1 = QPushButton("◀ -1s")
-        self.btn_plus1 = QPushButton("+1s ▶")
-        self.btn_plus10 = QPushButton("+10s ▶▶")
-        
-        nav_layout.addWidget(self.btn_minus10)
-        nav_layout.addWidget(self.btn_minus1)
-        nav_layout.addStretch()
-        nav_layout.addWidget(self.btn_plus1)
-        nav_layout.addWidget(self.btn_plus10)
+        # Un QButtonGroup con una sola conexión para los cuatro botones
+        self._nav_group = QButtonGroup(self)
+        for attr, text, delta in _NAV_BUTTONS:
+            btn = QPushButton(text)
+            btn.setProperty("seekDelta", delta)
+            setattr(self, attr, btn)
+            nav_layout.addWidget(btn)
+            self._nav_group.addButton(btn)
+        nav_layout.insertStretch(2)
         
         main_layout.addLayout(nav_layout)
         
@@ -134,11 +183,8 @@ class PreviewPanel(QWidget):
     
     def _connect_signals(self):
         """Conecta los signals internos"""
-        # Navegación
-        self.btn_minus10.clicked.connect(lambda: self.seek_requested.emit(-10))
-        self.btn_minus1.clicked.connect(lambda: self.seek_requested.emit(-1))
-        self.btn_plus1.clicked.connect(lambda: self.seek_requested.emit(1))
-        self.btn_plus10.clicked.connect(lambda: self.seek_requested.emit(10))
+        # Navegación: un solo slot, el delta viaja como propiedad del botón
+        self._nav_group.buttonClicked.connect(self._on_nav_clicked)
         
         # Playback
         self.btn_play.clicked.connect(self.play_clicked.emit)
@@ -148,72 +194,82 @@ class PreviewPanel(QWidget):
         if self.show_mute:
             self.btn_mute.clicked.connect(self.mute_clicked.emit)
     
+    def _on_nav_clicked(self, button: QPushButton):
+        """Slot compartido de navegación: lee el delta del botón pulsado"""
+        self.seek_requested.emit(button.property("seekDelta"))
+    
+    def showEvent(self, event):
+        """Aplica el tema de forma diferida, solo cuando el widget se muestra"""
+        if not self._theme_applied:
+            self._theme_applied = True
+            self._apply_theme()
+        super().showEvent(event)
+    
+    @classmethod
+    def _build_stylesheets(cls, theme) -> _PanelStyles:
+        """
+        Ensambla (una sola vez por tema) las hojas de estilo del panel.
+        
+        Args:
+            theme: Instancia de ThemeManager
+            
+        Returns:
+            _PanelStyles con los QSS listos para aplicar
+        """
+        key = id(theme)
+        styles = cls._stylesheet_cache.get(key)
+        if styles is None:
+            border = theme.get_color('border')
+            radius_md = theme.RADIUS['md']
+            text = theme.get_color('text_primary')
+            styles = _PanelStyles(
+                title_qss=theme.get_label_style('primary'),
+                frame_qss=_FRAME_TMPL.format(border=border, radius_md=radius_md),
+                time_label_qss=theme.get_label_style('secondary'),
+                nav_qss=theme.get_button_style('secondary'),
+                play_qss=_PLAYBACK_BTN_TMPL.format(
+                    bg=theme.get_color('success'),
+                    bg_hover=theme.get_color('success_hover'),
+                    text=text, border=border, radius_md=radius_md
+                ),
+                stop_qss=_PLAYBACK_BTN_TMPL.format(
+                    bg=theme.get_color('error'),
+                    bg_hover=theme.get_color('error_hover'),
+                    text=text, border=border, radius_md=radius_md
+                ),
+            )
+            cls._stylesheet_cache[key] = styles
+        return styles
+    
     def _apply_theme(self):
         """Aplica el tema visual"""
-        from ..layouts.theme_manager import ThemeManager
         theme = ThemeManager()
+        ss = self._build_stylesheets(theme)
         
         # Título
         self.title_label.setFont(theme.get_font('subtitle'))
-        self.title_label.setStyleSheet(theme.get_label_style('primary'))
+        self.title_label.setStyleSheet(ss.title_qss)
         
         # Frame de preview (negro para video)
-        self.preview_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: #000000;
-                border: 2px solid {theme.get_color('border')};
-                border-radius: {theme.RADIUS['md']}px;
-            }}
-        """)
+        self.preview_frame.setStyleSheet(ss.frame_qss)
         
         # Label de tiempo
         self.time_label.setFont(theme.get_font('mono'))
-        self.time_label.setStyleSheet(theme.get_label_style('secondary'))
+        self.time_label.setStyleSheet(ss.time_label_qss)
         
         # Botones de navegación
-        nav_button_style = theme.get_button_style('secondary')
-        self.btn_minus10.setStyleSheet(nav_button_style)
-        self.btn_minus1.setStyleSheet(nav_button_style)
-        self.btn_plus1.setStyleSheet(nav_button_style)
-        self.btn_plus10.setStyleSheet(nav_button_style)
+        self.btn_minus10.setStyleSheet(ss.nav_qss)
+        self.btn_minus1.setStyleSheet(ss.nav_qss)
+        self.btn_plus1.setStyleSheet(ss.nav_qss)
+        self.btn_plus10.setStyleSheet(ss.nav_qss)
         
-        # Botón play (verde)
-        self.btn_play.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.get_color('success')};
-                color: {theme.get_color('text_primary')};
-                border: 1px solid {theme.get_color('border')};
-                border-radius: {theme.RADIUS['md']}px;
-                font-size: 18pt;
-            }}
-            QPushButton:hover {{
-                background-color: {theme.get_color('success_hover')};
-            }}
-            QPushButton:pressed {{
-                background-color: {theme.get_color('success')};
-            }}
-        """)
-        
-        # Botón stop (rojo)
-        self.btn_stop.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {theme.get_color('error')};
-                color: {theme.get_color('text_primary')};
-                border: 1px solid {theme.get_color('border')};
-                border-radius: {theme.RADIUS['md']}px;
-                font-size: 18pt;
-            }}
-            QPushButton:hover {{
-                background-color: {theme.get_color('error_hover')};
-            }}
-            QPushButton:pressed {{
-                background-color: {theme.get_color('error')};
-            }}
-        """)
+        # Botones play (verde) / stop (rojo)
+        self.btn_play.setStyleSheet(ss.play_qss)
+        self.btn_stop.setStyleSheet(ss.stop_qss)
         
         # Botón mute
         if self.show_mute:
-            self.btn_mute.setStyleSheet(theme.get_button_style('secondary'))
+            self.btn_mute.setStyleSheet(ss.nav_qss)
     
     # === API PÚBLICA ===
     
@@ -270,3 +326,6 @@ class PreviewPanel(QWidget):
         self.btn_stop.setEnabled(enabled)
         if self.show_mute:
             self.btn_mute.setEnabled(enabled)
+
+
+register_style_cache(PreviewPanel._stylesheet_cache.clear)
@@ -4,6 +4,8 @@ Progress Bar Widget - PyQt6
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QProgressBar, QLabel
 from PyQt6.QtCore import Qt
 
+from .progress_coalescer import ProgressCoalescer
+
 
 class ProgressBar(QWidget):
     """Widget de barra de progreso"""
@@ -11,6 +13,9 @@ class ProgressBar(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._build_ui()
+        
+        # Progreso limitado a 10 Hz y sin setValue/setText redundantes
+        self._coalescer = ProgressCoalescer(self, self.progress_bar.setValue, self.label.setText)
     
     def _build_ui(self):
         """Construye la interfaz"""
@@ -32,16 +37,15 @@ class ProgressBar(QWidget):
         layout.addWidget(self.label)
     
     def set_progress(self, value: int, text: str = ""):
-        """Establece el progreso"""
-        self.progress_bar.setValue(value)
-        if text:
-            self.label.setText(text)
+        """Establece el progreso (se aplica como máximo a 10 Hz)"""
+        self._coalescer.push(value, text)
     
     def set_text(self, text: str):
         """Establece solo el texto"""
-        self.label.setText(text)
+        self._coalescer.set_text(text)
     
     def reset(self):
         """Resetea la barra"""
+        self._coalescer.reset()
         self.progress_bar.setValue(0)
         self.label.setText("")
@@ -0,0 +1,108 @@
+"""
+Progress Coalescer - Limita las actualizaciones de progreso de los widgets
+
+Contraparte en la UI de ProgressThrottle (workers/generic.py): aplica la
+primera actualización en el acto y agrupa las siguientes a como máximo 10 Hz.
+"""
+from PyQt6.QtCore import QObject, QTimer
+from typing import Callable, Optional
+
+
+# Intervalo mínimo (ms) entre dos actualizaciones aplicadas
+_COALESCE_INTERVAL_MS = 100
+
+
+class ProgressCoalescer:
+    """
+    Agrupa set_progress() de un widget y descarta valores/textos repetidos.
+    
+    Fuera de una ventana de 100 ms la actualización se aplica en el acto;
+    dentro de ella solo se guarda la última y se aplica al cerrarse la ventana.
+    """
+    
+    def __init__(
+        self,
+        parent: QObject,
+        apply_value: Callable[[int], None],
+        apply_text: Callable[[str], None]
+    ):
+        """
+        Args:
+            parent: Dueño del timer interno
+            apply_value: Muestra un valor de progreso en el widget
+            apply_text: Muestra un texto de progreso en el widget
+        """
+        self._apply_value = apply_value
+        self._apply_text = apply_text
+        
+        self._pending_value: Optional[int] = None
+        self._pending_text: Optional[str] = None
+        
+        # Últimos valores mostrados (evita setValue/setText redundantes)
+        self._last_value = -1
+        self._last_text: Optional[str] = None
+        
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(_COALESCE_INTERVAL_MS)
+        self._timer.timeout.connect(self._on_timeout)
+    
+    @property
+    def pending_value(self) -> Optional[int]:
+        """Último valor aún no aplicado (None si no hay ninguno)"""
+        return self._pending_value
+    
+    def push(self, value: int, text: str = ""):
+        """
+        Registra un progreso nuevo.
+        
+        Args:
+            value: Valor de progreso (0-100)
+            text: Texto opcional ('' conserva el anterior)
+        """
+        self._pending_value = value
+        if text:
+            self._pending_text = text
+        if not self._timer.isActive():
+            self._flush()
+            self._timer.start()
+    
+    def set_text(self, text: str):
+        """Muestra un texto en el acto (es más reciente que el pendiente)"""
+        self._pending_text = None
+        if text != self._last_text:
+            self._last_text = text
+            self._apply_text(text)
+    
+    def reset(self, value: int = 0, text: str = ""):
+        """
+        Descarta lo pendiente y registra lo que el widget muestra ahora.
+        
+        Args:
+            value: Valor que el widget acaba de mostrar
+            text: Texto que el widget acaba de mostrar
+        """
+        self._timer.stop()
+        self._pending_value = None
+        self._pending_text = None
+        self._last_value = value
+        self._last_text = text
+    
+    def _on_timeout(self):
+        """Cierra la ventana: aplica lo acumulado y abre otra si había algo"""
+        if self._pending_value is not None or self._pending_text:
+            self._flush()
+            self._timer.start()
+    
+    def _flush(self):
+        """Aplica el último progreso pendiente"""
+        value, self._pending_value = self._pending_value, None
+        text, self._pending_text = self._pending_text, None
+        
+        if value is not None and value != self._last_value:
+            self._last_value = value
+            self._apply_value(value)
+        
+        if text and text != self._last_text:
+            self._last_text = text
+            self._apply_text(text)
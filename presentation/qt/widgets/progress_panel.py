@@ -7,8 +7,32 @@ y botón de acción en un componente cohesivo.
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QProgressBar,
                               QLabel, QPushButton, QSizePolicy)
 from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtGui import QGuiApplication
 from typing import Optional
 
+from ..layouts.theme_manager import ThemeManager, register_style_cache
+from .progress_coalescer import ProgressCoalescer
+
+
+# Estados de la aplicación en los que se pausa la animación indeterminada
+_PAUSED_APP_STATES = (
+    Qt.ApplicationState.ApplicationHidden,
+    Qt.ApplicationState.ApplicationSuspended,
+)
+
+# Sufijo para el botón de acción grande
+_BIG_BUTTON_QSS = """
+            QPushButton {
+                font-size: 16pt;
+                font-weight: bold;
+            }
+        """
+
+
+def _scope(qss: str, type_name: str, object_name: str) -> str:
+    """Restringe los selectores de un tipo de widget a un objectName concreto"""
+    return qss.replace(type_name, f"{type_name}#{object_name}")
+
 
 class ProgressPanel(QWidget):
     """
@@ -27,6 +51,9 @@ class ProgressPanel(QWidget):
     # Signals
     action_clicked = pyqtSignal()
     
+    # QSS completo del panel por variante de botón (compartido entre instancias)
+    _PROGRESS_STYLE: dict = {}
+    
     def __init__(
         self,
         button_text: str = "Procesar",
@@ -49,9 +76,16 @@ class ProgressPanel(QWidget):
         self.button_variant = button_variant
         self.show_percentage = show_percentage
         
+        # Modo indeterminado pedido (la animación solo corre si el panel es visible)
+        self._wants_indeterminate = False
+        QGuiApplication.instance().applicationStateChanged.connect(self._on_app_state_changed)
+        
         self._build_ui()
         self._connect_signals()
         self._apply_theme()
+        
+        # Progreso limitado a 10 Hz y sin setValue/setText redundantes
+        self._coalescer = ProgressCoalescer(self, self._show_value, self.status_label.setText)
     
     def _build_ui(self):
         """Construye la interfaz del widget"""
@@ -70,6 +104,7 @@ class ProgressPanel(QWidget):
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(False)  # Usamos label personalizado
+        self.progress_bar.setObjectName("progressBar")
         self.progress_bar.setSizePolicy(
             QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Preferred
@@ -78,6 +113,7 @@ class ProgressPanel(QWidget):
         
         # Label de mensaje/status
         self.status_label = QLabel("")
+        self.status_label.setObjectName("progressStatus")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         progress_layout.addWidget(self.status_label)
         
@@ -86,12 +122,19 @@ class ProgressPanel(QWidget):
         # Sección central: Porcentaje (opcional)
         if self.show_percentage:
             self.percentage_label = QLabel("0%")
+            self.percentage_label.setObjectName("progressPercent")
             self.percentage_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.percentage_label.setMinimumWidth(60)
+            # Oculto hasta el primer progreso > 0 (conserva su hueco en el layout)
+            percent_policy = self.percentage_label.sizePolicy()
+            percent_policy.setRetainSizeWhenHidden(True)
+            self.percentage_label.setSizePolicy(percent_policy)
+            self.percentage_label.hide()
             main_layout.addWidget(self.percentage_label)
         
         # Sección derecha: Botón de acción
         self.action_button = QPushButton(self.button_text)
+        self.action_button.setObjectName("progressAction")
         self.action_button.setMinimumSize(120, 50)
         self.action_button.setSizePolicy(
             QSizePolicy.Policy.Preferred,
@@ -105,50 +148,51 @@ class ProgressPanel(QWidget):
     
     def _apply_theme(self):
         """Aplica el tema visual"""
-        from ..layouts.theme_manager import ThemeManager
         theme = ThemeManager()
         
+        # Una sola hoja de estilo en la raíz (selectores por objectName)
+        panel_style = self._PROGRESS_STYLE.get(self.button_variant)
+        if panel_style is None:
+            panel_style = "".join((
+                _scope(theme.get_progress_bar_style(), "QProgressBar", "progressBar"),
+                _scope(theme.get_label_style('secondary'), "QLabel", "progressStatus"),
+                _scope(theme.get_label_style('primary'), "QLabel", "progressPercent"),
+                # Estilo de la variante + personalización para botón grande
+                _scope(theme.get_button_style(self.button_variant) + _BIG_BUTTON_QSS,
+                       "QPushButton", "progressAction"),
+            ))
+            self._PROGRESS_STYLE[self.button_variant] = panel_style
+        self.setStyleSheet(panel_style)
+        
         # Barra de progreso
-        self.progress_bar.setStyleSheet(theme.get_progress_bar_style())
         self.progress_bar.setMinimumHeight(20)
         
         # Label de status
         self.status_label.setFont(theme.get_font('small'))
-        self.status_label.setStyleSheet(theme.get_label_style('secondary'))
         
         # Label de porcentaje
         if self.show_percentage:
             self.percentage_label.setFont(theme.get_font('title'))
-            self.percentage_label.setStyleSheet(theme.get_label_style('primary'))
-        
-        # Botón de acción
-        button_style = theme.get_button_style(self.button_variant)
-        # Personalizar para botón grande
-        button_style += f"""
-            QPushButton {{
-                font-size: 16pt;
-                font-weight: bold;
-            }}
-        """
-        self.action_button.setStyleSheet(button_style)
     
     # === API PÚBLICA ===
     
     def set_progress(self, value: int, message: str = ""):
         """
-        Actualiza el progreso.
+        Actualiza el progreso (se aplica como máximo a 10 Hz).
         
         Args:
             value: Valor de progreso (0-100)
             message: Mensaje de status opcional
         """
+        self._coalescer.push(value, message)
+    
+    def _show_value(self, value: int):
+        """Muestra un valor de progreso en la barra y el label de porcentaje"""
         self.progress_bar.setValue(value)
-        
         if self.show_percentage:
             self.percentage_label.setText(f"{value}%")
-        
-        if message:
-            self.status_label.setText(message)
+            if value > 0 and self.percentage_label.isHidden():
+                self.percentage_label.show()
     
     def set_status(self, message: str):
         """
@@ -157,13 +201,15 @@ class ProgressPanel(QWidget):
         Args:
             message: Mensaje a mostrar
         """
-        self.status_label.setText(message)
+        self._coalescer.set_text(message)
     
     def reset(self):
         """Resetea el progreso a 0"""
+        self._coalescer.reset()
         self.progress_bar.setValue(0)
         if self.show_percentage:
             self.percentage_label.setText("0%")
+            self.percentage_label.hide()
         self.status_label.setText("")
     
     def set_button_text(self, text: str):
@@ -200,18 +246,52 @@ class ProgressPanel(QWidget):
         Returns:
             Valor de progreso (0-100)
         """
+        pending = self._coalescer.pending_value
+        if pending is not None:
+            return pending
         return self.progress_bar.value()
     
     def set_indeterminate(self, indeterminate: bool):
         """
         Establece modo indeterminado (animación continua).
         
+        La animación se pausa mientras el panel está oculto o la
+        aplicación está minimizada/suspendida, y se reanuda al volver.
+        
         Args:
             indeterminate: True para modo indeterminado
         """
-        if indeterminate:
-            self.progress_bar.setMinimum(0)
-            self.progress_bar.setMaximum(0)  # Modo indeterminado
+        self._wants_indeterminate = indeterminate
+        self._sync_indeterminate(self.isVisible())
+    
+    def _sync_indeterminate(self, visible: bool):
+        """Activa la animación solo si se pidió y el panel está a la vista"""
+        active = (
+            self._wants_indeterminate
+            and visible
+            and QGuiApplication.applicationState() not in _PAUSED_APP_STATES
+        )
+        if active:
+            self.progress_bar.setRange(0, 0)  # Modo indeterminado
         else:
-            self.progress_bar.setMinimum(0)
-            self.progress_bar.setMaximum(100)
+            self.progress_bar.setRange(0, 100)
+    
+    def _on_app_state_changed(self, state):
+        """Pausa/reanuda la animación indeterminada según el estado de la app"""
+        if self._wants_indeterminate:
+            self._sync_indeterminate(self.isVisible())
+    
+    def showEvent(self, event):
+        """Reanuda la animación indeterminada al mostrarse"""
+        super().showEvent(event)
+        if self._wants_indeterminate:
+            self._sync_indeterminate(True)
+    
+    def hideEvent(self, event):
+        """Detiene la animación indeterminada mientras está oculto"""
+        super().hideEvent(event)
+        if self._wants_indeterminate:
+            self._sync_indeterminate(False)
+
+
+register_style_cache(ProgressPanel._PROGRESS_STYLE.clear)
@@ -4,10 +4,36 @@ Simple Preview Panel - Panel de preview sin controles
 Widget simplificado solo con el frame de preview y botón de mute,
 para usar en dual preview donde los controles están centralizados.
 """
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QStyle
 from PyQt6.QtCore import pyqtSignal, Qt, QSize
 from PyQt6.QtGui import QFont
 
+from ..layouts.theme_manager import ThemeManager, register_style_cache
+
+
+# Glifos de mute -> iconos estándar de Qt (el API de set_mute_text no cambia)
+_MUTE_PIXMAPS = {
+    "🔊": QStyle.StandardPixmap.SP_MediaVolume,
+    "🔇": QStyle.StandardPixmap.SP_MediaVolumeMuted,
+}
+
+# Plantillas QSS (se formatean una vez por tema)
+_TITLE_TMPL = """
+                QLabel {{
+                    color: {text};
+                    padding: {padding}px;
+                    font-weight: bold;
+                }}
+            """
+
+_FRAME_TMPL = """
+                QFrame {{
+                    background-color: #000000;
+                    border: 2px solid {border};
+                    border-radius: {radius_md}px;
+                }}
+            """
+
 
 class SimplePreviewPanel(QWidget):
     """
@@ -26,6 +52,9 @@ class SimplePreviewPanel(QWidget):
     # Signals
     mute_clicked = pyqtSignal()
     
+    # QSS (título, frame) compartido entre instancias, indexado por tema
+    _stylesheet_cache: dict = {}
+    
     def __init__(self, title: str = "Preview", min_width: int = 400, min_height: int = 300, parent=None):
         super().__init__(parent)
         self.title = title
@@ -51,8 +80,9 @@ class SimplePreviewPanel(QWidget):
         header_layout.addStretch()
         
         # Botón de mute
-        self.mute_btn = QPushButton("🔊 Mute")
+        self.mute_btn = QPushButton()
         self.mute_btn.setMinimumSize(80, 30)
+        self.set_mute_text("🔊 Mute")
         self.mute_btn.clicked.connect(self.mute_clicked.emit)
         header_layout.addWidget(self.mute_btn)
         
@@ -65,30 +95,42 @@ class SimplePreviewPanel(QWidget):
         self.preview_frame.setFrameShadow(QFrame.Shadow.Sunken)
         main_layout.addWidget(self.preview_frame, stretch=1)
     
+    @classmethod
+    def _build_stylesheets(cls, theme) -> tuple:
+        """
+        Ensambla (una sola vez por tema) las hojas de estilo del panel.
+        
+        Returns:
+            (title_qss, frame_qss)
+        """
+        key = id(theme)
+        styles = cls._stylesheet_cache.get(key)
+        if styles is None:
+            styles = cls._stylesheet_cache[key] = (
+                _TITLE_TMPL.format(
+                    text=theme.get_color('text_primary'),
+                    padding=theme.get_spacing('sm')
+                ),
+                _FRAME_TMPL.format(
+                    border=theme.get_color('border'),
+                    radius_md=theme.RADIUS['md']
+                ),
+            )
+        return styles
+    
     def _apply_theme(self):
         """Aplica el tema visual"""
         try:
-            from ..layouts.theme_manager import ThemeManager
             theme = ThemeManager()
             
+            title_qss, frame_qss = self._build_stylesheets(theme)
+            
             # Título
             self.title_label.setFont(theme.get_font('subtitle'))
-            self.title_label.setStyleSheet(f"""
-                QLabel {{
-                    color: {theme.get_color('text_primary')};
-                    padding: {theme.get_spacing('sm')}px;
-                    font-weight: bold;
-                }}
-            """)
+            self.title_label.setStyleSheet(title_qss)
             
-            # Preview frame (negro para video)
-            self.preview_frame.setStyleSheet(f"""
-                QFrame {{
-                    background-color: #000000;
-                    border: 2px solid {theme.get_color('border')};
-                    border-radius: {theme.RADIUS['md']}px;
-                }}
-            """)
+            # Preview frame (negro hasta que MPV pinte encima)
+            self.preview_frame.setStyleSheet(frame_qss)
             
             # Botón de mute
             self.mute_btn.setStyleSheet(theme.get_button_style('secondary'))
@@ -112,4 +154,13 @@ class SimplePreviewPanel(QWidget):
         Args:
             text: Texto a mostrar (🔊 Mute o 🔇 Unmute)
         """
-        self.mute_btn.setText(text)
+        glyph, _, label = text.partition(" ")
+        pixmap = _MUTE_PIXMAPS.get(glyph)
+        if pixmap is None:
+            self.mute_btn.setText(text)
+            return
+        self.mute_btn.setIcon(self.style().standardIcon(pixmap))
+        self.mute_btn.setText(label)
+
+
+register_style_cache(SimplePreviewPanel._stylesheet_cache.clear)
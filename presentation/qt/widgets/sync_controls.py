@@ -6,9 +6,11 @@ Usa layouts responsive y ThemeManager para estilos consistentes.
 """
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
                               QLabel, QLineEdit, QPushButton, QFrame, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 
+from ..layouts.theme_manager import ThemeManager
+
 
 class SyncControls(QWidget):
     """
@@ -24,12 +26,48 @@ class SyncControls(QWidget):
     # Signal emitido cuando cambian los offsets
     offset_changed = pyqtSignal(int, int)  # audio_offset_ms, subtitle_offset_ms
     
+    # Botones de ajuste: (texto, ms); 0 = reset
+    _ADJUSTMENTS = (
+        ("-1s", -1000),
+        ("-100ms", -100),
+        ("-10ms", -10),
+        ("Reset", 0),
+        ("+10ms", 10),
+        ("+100ms", 100),
+        ("+1s", 1000),
+    )
+    
+    # Fuentes compartidas entre secciones e instancias (se crean en el primer uso)
+    _title_font: QFont = None
+    _btn_font: QFont = None
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.audio_offset_ms = 0
         self.subtitle_offset_ms = 0
-        self._build_ui()
-        self._apply_theme()
+        
+        # offset_changed se emite una sola vez cuando el usuario deja de pulsar (80 ms)
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(80)
+        self._emit_timer.timeout.connect(self._emit_offsets)
+        
+        # Sección -> método de ajuste (lo usa el slot compartido de los botones)
+        self._adjust_callbacks = {
+            "audio": self._adjust_audio,
+            "subtitle": self._adjust_subtitle,
+        }
+        
+        # Secciones y tema se construyen en el primer showEvent
+        self._built = False
+    
+    def showEvent(self, event):
+        """Construye la UI la primera vez que el widget se muestra"""
+        if not self._built:
+            self._built = True
+            self._build_ui()
+            self._apply_theme()
+        super().showEvent(event)
     
     def _build_ui(self):
         """Construye la interfaz"""
@@ -40,18 +78,18 @@ class SyncControls(QWidget):
         # Audio (izquierda)
         audio_widget = self._create_sync_section(
             "Sincronización de Audio",
-            self._adjust_audio
+            "audio"
         )
         layout.addWidget(audio_widget, stretch=1)
         
         # Subtítulos (derecha)
         subtitle_widget = self._create_sync_section(
             "Sincronización de Subtítulos",
-            self._adjust_subtitle
+            "subtitle"
         )
         layout.addWidget(subtitle_widget, stretch=1)
     
-    def _create_sync_section(self, title: str, callback):
+    def _create_sync_section(self, title: str, section: str):
         """Crea una sección de sincronización"""
         widget = QFrame()
         widget.setFrameShape(QFrame.Shape.StyledPanel)
@@ -61,8 +99,10 @@ class SyncControls(QWidget):
         
         # Título
         title_label = QLabel(title)
-        title_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
-        title_label.setFont(title_font)
+        if SyncControls._title_font is None:
+            SyncControls._title_font = QFont("Segoe UI", 10, QFont.Weight.Bold)
+            SyncControls._btn_font = QFont("Segoe UI", 8)
+        title_label.setFont(SyncControls._title_font)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
@@ -70,7 +110,8 @@ class SyncControls(QWidget):
         offset_layout = QHBoxLayout()
         offset_layout.addWidget(QLabel("Offset:"))
         
-        offset_entry = QLineEdit("0")
+        offset_ms = self.audio_offset_ms if section == "audio" else self.subtitle_offset_ms
+        offset_entry = QLineEdit(str(offset_ms))
         offset_entry.setReadOnly(True)
         offset_entry.setAlignment(Qt.AlignmentFlag.AlignCenter)
         offset_entry.setFixedWidth(90)
@@ -81,7 +122,7 @@ class SyncControls(QWidget):
         layout.addLayout(offset_layout)
         
         # Guardar referencia al entry
-        if title.startswith("Sincronización de Audio"):
+        if section == "audio":
             self.audio_entry = offset_entry
         else:
             self.subtitle_entry = offset_entry
@@ -90,29 +131,26 @@ class SyncControls(QWidget):
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(4)
         
-        adjustments = [
-            ("-1s", -1000),
-            ("-100ms", -100),
-            ("-10ms", -10),
-            ("Reset", 0),
-            ("+10ms", 10),
-            ("+100ms", 100),
-            ("+1s", 1000)
-        ]
-        
-        # Todos los botones en una sola fila
-        for text, value in adjustments:
+        # Todos los botones en una sola fila; sección y ms viajan como propiedades
+        for text, value in self._ADJUSTMENTS:
             btn = QPushButton(text)
             btn.setMinimumWidth(55)
             btn.setMaximumHeight(28)
-            btn.setFont(QFont("Segoe UI", 8))
-            btn.clicked.connect(lambda checked, v=value: callback(v))
+            btn.setFont(SyncControls._btn_font)
+            btn.setProperty("syncSection", section)
+            btn.setProperty("adjustment", value)
+            btn.clicked.connect(self._on_adjust_clicked)
             buttons_layout.addWidget(btn)
         
         layout.addLayout(buttons_layout)
         
         return widget
     
+    def _on_adjust_clicked(self):
+        """Slot compartido de ajuste: lee sección y ms del botón emisor"""
+        btn = self.sender()
+        self._adjust_callbacks[btn.property("syncSection")](btn.property("adjustment"))
+    
     def _adjust_audio(self, value: int):
         """Ajusta offset de audio"""
         if value == 0:
@@ -121,7 +159,7 @@ class SyncControls(QWidget):
             self.audio_offset_ms += value
         
         self.audio_entry.setText(str(self.audio_offset_ms))
-        self.offset_changed.emit(self.audio_offset_ms, self.subtitle_offset_ms)
+        self._emit_timer.start()
     
     def _adjust_subtitle(self, value: int):
         """Ajusta offset de subtítulos"""
@@ -131,6 +169,10 @@ class SyncControls(QWidget):
             self.subtitle_offset_ms += value
         
         self.subtitle_entry.setText(str(self.subtitle_offset_ms))
+        self._emit_timer.start()
+    
+    def _emit_offsets(self):
+        """Emite los offsets actuales (fin del debounce)"""
         self.offset_changed.emit(self.audio_offset_ms, self.subtitle_offset_ms)
     
     def get_audio_offset_ms(self) -> int:
@@ -152,7 +194,6 @@ class SyncControls(QWidget):
     def _apply_theme(self):
         """Aplica el tema visual usando ThemeManager"""
         try:
-            from ..layouts.theme_manager import ThemeManager
             theme = ThemeManager()
             
             # Aplicar estilo al widget principal
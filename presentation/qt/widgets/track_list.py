@@ -3,11 +3,121 @@ Track List Widget - Lista de tracks (audios/subtitulos)
 
 Widget para mostrar y gestionar lista de tracks cargados.
 """
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, 
-                              QListWidgetItem, QPushButton, QLabel)
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListView,
+                              QPushButton, QLabel, QStyle)
+from PyQt6.QtCore import pyqtSignal, Qt, QAbstractListModel, QModelIndex
 from PyQt6.QtGui import QFont
 from pathlib import Path
+from array import array
+
+
+# Hoja de estilo única para el widget (selectores por objectName / propiedad)
+_TRACK_LIST_QSS = """
+    QLabel#trackListTitle {
+        color: white;
+    }
+    QListView#trackList {
+        background-color: #2b2b2b;
+        color: white;
+        border: 1px solid #555;
+        border-radius: 3px;
+    }
+    QListView#trackList::item {
+        padding: 5px;
+    }
+    QListView#trackList::item:selected {
+        background-color: #0071bc;
+    }
+    QListView#trackList::item:hover {
+        background-color: #3a3a3a;
+    }
+    QPushButton[variant="danger"] {
+        background-color: #dc3545;
+        color: white;
+        border: none;
+        padding: 5px 10px;
+        border-radius: 3px;
+    }
+    QPushButton[variant="danger"]:hover {
+        background-color: #c82333;
+    }
+    QPushButton[variant="danger"]:disabled {
+        background-color: #6c757d;
+    }
+"""
+
+
+class TrackListModel(QAbstractListModel):
+    """
+    Modelo de tracks sobre arrays paralelos (sin un QListWidgetItem por fila).
+    
+    DisplayRole devuelve 'N. nombre (offset: Xms)' y UserRole el índice de la fila.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        # Tracks como arrays paralelos (un índice por track)
+        self._paths: list = []
+        self._offsets = array('i')  # offset_ms
+        self._names: list = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Cantidad de filas (lista plana: sin hijos)"""
+        return 0 if parent.isValid() else len(self._names)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Texto del track o su índice, calculados al vuelo"""
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            offset_ms = self._offsets[row]
+            offset_text = f" (offset: {offset_ms}ms)" if offset_ms != 0 else ""
+            return f"{row + 1}. {self._names[row]}{offset_text}"
+        if role == Qt.ItemDataRole.UserRole:
+            return row
+        return None
+    
+    def append_tracks(self, paths: list, offsets):
+        """Agrega tracks al final con una sola notificación de inserción"""
+        start = len(self._paths)
+        self.beginInsertRows(QModelIndex(), start, start + len(paths) - 1)
+        self._paths.extend(paths)
+        self._offsets.extend(offsets)
+        self._names.extend(Path(file_path).name for file_path in paths)
+        self.endInsertRows()
+    
+    def remove_track(self, row: int):
+        """Elimina un track y renumera las filas siguientes"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._paths[row]
+        del self._offsets[row]
+        del self._names[row]
+        self.endRemoveRows()
+        self.renumber_from(row)
+    
+    def renumber_from(self, row: int):
+        """Un solo dataChanged para el rango contiguo [row, fin)"""
+        last = len(self._names) - 1
+        if row <= last:
+            self.dataChanged.emit(
+                self.index(row), self.index(last),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.UserRole]
+            )
+    
+    def clear(self):
+        """Elimina todos los tracks"""
+        self.beginResetModel()
+        self._paths.clear()
+        del self._offsets[:]
+        self._names.clear()
+        self.endResetModel()
+    
+    def get_tracks(self):
+        """Lista de tracks ({'path', 'offset_ms', 'name'}, construida bajo demanda)"""
+        return [
+            {'path': path, 'offset_ms': offset_ms, 'name': name}
+            for path, offset_ms, name in zip(self._paths, self._offsets, self._names)
+        ]
 
 
 class TrackListWidget(QWidget):
@@ -34,7 +144,9 @@ class TrackListWidget(QWidget):
         super().__init__(parent)
         
         self.track_type = track_type
-        self.tracks = []
+        
+        # Los tracks viven en el modelo (arrays paralelos)
+        self.model = TrackListModel(self)
         
         self._build_ui()
     
@@ -44,57 +156,46 @@ class TrackListWidget(QWidget):
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
         
-        # Titulo
-        icon = "🎵" if self.track_type == "audio" else "📝"
-        title_text = f"{icon} {self.track_type.capitalize()}s"
+        # Un solo setStyleSheet en la raíz (se parsea una vez por widget)
+        self.setStyleSheet(_TRACK_LIST_QSS)
+        
+        # Titulo (icono estándar de Qt + texto)
+        title_layout = QHBoxLayout()
+        title_layout.setSpacing(5)
         
-        title = QLabel(title_text)
+        pixmap = (QStyle.StandardPixmap.SP_MediaVolume if self.track_type == "audio"
+                  else QStyle.StandardPixmap.SP_FileDialogDetailedView)
+        title_icon = QLabel()
+        title_icon.setPixmap(self.style().standardIcon(pixmap).pixmap(16, 16))
+        title_layout.addWidget(title_icon)
+        
+        title = QLabel(f"{self.track_type.capitalize()}s")
         title.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
-        title.setStyleSheet("color: white;")
-        layout.addWidget(title)
+        title.setObjectName("trackListTitle")
+        title_layout.addWidget(title)
+        title_layout.addStretch()
+        layout.addLayout(title_layout)
         
         # Lista
-        self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet("""
-            QListWidget {
-                background-color: #2b2b2b;
-                color: white;
-                border: 1px solid #555;
-                border-radius: 3px;
-            }
-            QListWidget::item {
-                padding: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #0071bc;
-            }
-            QListWidget::item:hover {
-                background-color: #3a3a3a;
-            }
-        """)
-        self.list_widget.itemClicked.connect(self._on_item_clicked)
-        layout.addWidget(self.list_widget)
+        self.list_view = QListView()
+        self.list_view.setObjectName("trackList")
+        self.list_view.setModel(self.model)
+        # Items de una sola línea: mismo tamaño para todos y layout por lotes
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setBatchSize(50)
+        self.list_view.setResizeMode(QListView.ResizeMode.Fixed)
+        self.list_view.setMovement(QListView.Movement.Static)
+        self.list_view.clicked.connect(self._on_item_clicked)
+        layout.addWidget(self.list_view)
         
         # Botones
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(5)
         
-        self.remove_btn = QPushButton("❌ Eliminar")
-        self.remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dc3545;
-                color: white;
-                border: none;
-                padding: 5px 10px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-            }
-        """)
+        self.remove_btn = QPushButton("Eliminar")
+        self.remove_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon))
+        self.remove_btn.setProperty("variant", "danger")
         self.remove_btn.clicked.connect(self._on_remove_clicked)
         self.remove_btn.setEnabled(False)
         btn_layout.addWidget(self.remove_btn)
@@ -110,66 +211,59 @@ class TrackListWidget(QWidget):
             file_path: Ruta al archivo
             offset_ms: Offset en milisegundos
         """
-        track_info = {
-            'path': file_path,
-            'offset_ms': offset_ms,
-            'name': Path(file_path).name
-        }
-        
-        self.tracks.append(track_info)
-        
-        # Crear item
-        offset_text = f" (offset: {offset_ms}ms)" if offset_ms != 0 else ""
-        item_text = f"{len(self.tracks)}. {track_info['name']}{offset_text}"
+        self.model.append_tracks([file_path], (offset_ms,))
+    
+    def add_tracks(self, paths: list, offsets: list = None):
+        """
+        Agrega varios tracks con una sola inserción en el modelo.
         
-        item = QListWidgetItem(item_text)
-        item.setData(Qt.ItemDataRole.UserRole, len(self.tracks) - 1)  # Guardar index
-        self.list_widget.addItem(item)
+        Args:
+            paths: Rutas a los archivos
+            offsets: Offsets en milisegundos (None = 0 para todos)
+        """
+        if not paths:
+            return
+        if offsets is None:
+            offsets = [0] * len(paths)
+        self.model.append_tracks(paths, offsets)
     
     def remove_selected(self):
         """Elimina el track seleccionado"""
-        current_row = self.list_widget.currentRow()
+        current_row = self.list_view.currentIndex().row()
         if current_row >= 0:
-            self.list_widget.takeItem(current_row)
-            del self.tracks[current_row]
+            self.model.remove_track(current_row)
             self.track_removed.emit(current_row)
-            
-            # Actualizar numeros
-            self._update_item_numbers()
     
     def clear_all(self):
         """Elimina todos los tracks"""
-        self.list_widget.clear()
-        self.tracks.clear()
+        self.model.clear()
+    
+    @property
+    def tracks(self):
+        """
+        Copia de solo lectura de los tracks como dicts (compatibilidad; ver get_tracks).
+        
+        Se construye en cada acceso: modificarla no altera la lista; usar
+        add_track/add_tracks/remove_selected/clear_all.
+        """
+        return self.get_tracks()
     
     def get_tracks(self):
-        """Retorna lista de tracks"""
-        return self.tracks.copy()
+        """Retorna lista de tracks ({'path', 'offset_ms', 'name'}, construida bajo demanda)"""
+        return self.model.get_tracks()
     
     def get_track_count(self):
         """Retorna cantidad de tracks"""
-        return len(self.tracks)
+        return self.model.rowCount()
     
-    def _on_item_clicked(self, item):
+    def _on_item_clicked(self, index):
         """Callback cuando se hace click en un item"""
-        index = item.data(Qt.ItemDataRole.UserRole)
-        self.track_selected.emit(index)
+        self.track_selected.emit(index.row())
         self.remove_btn.setEnabled(True)
     
     def _on_remove_clicked(self):
         """Callback del boton eliminar"""
         self.remove_selected()
         
-        if self.list_widget.count() == 0:
+        if self.model.rowCount() == 0:
             self.remove_btn.setEnabled(False)
-    
-    def _update_item_numbers(self):
-        """Actualiza los numeros de los items"""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            track = self.tracks[i]
-            
-            offset_text = f" (offset: {track['offset_ms']}ms)" if track['offset_ms'] != 0 else ""
-            item_text = f"{i + 1}. {track['name']}{offset_text}"
-            item.setText(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, i)
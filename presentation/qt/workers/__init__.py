@@ -4,15 +4,28 @@ Workers - Workers para threading
 Manejan operaciones largas en threads separados sin bloquear la UI.
 """
 
-from .remux_worker import RemuxWorker
+from .generic import Worker, WorkerSignals, ProgressThrottle, LogBatcher
+from .remux_worker import remux_task
 from .batch_worker import BatchWorker
-from .dualsync_worker import DualSyncSingleWorker, DualSyncBatchWorker
+from .dualsync_worker import dual_remux_task, DualSyncBatchWorker
 from .advanced_worker import AdvancedWorker
+from .episode_remux_runnable import EpisodeRemuxRunnable, EpisodeRemuxSignals
+from .pool import get_thread_pool, start_worker, usable_cpus, max_parallel_remux
 
 __all__ = [
-    'RemuxWorker',
+    'Worker',
+    'WorkerSignals',
+    'ProgressThrottle',
+    'LogBatcher',
+    'remux_task',
     'BatchWorker',
-    'DualSyncSingleWorker',
+    'dual_remux_task',
     'DualSyncBatchWorker',
     'AdvancedWorker',
+    'EpisodeRemuxRunnable',
+    'EpisodeRemuxSignals',
+    'get_thread_pool',
+    'start_worker',
+    'usable_cpus',
+    'max_parallel_remux',
 ]
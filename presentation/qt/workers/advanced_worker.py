@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Optional
 from core.domain.models import RemuxJob
 from core.services import RemuxService
+from .generic import LogBatcher
 
 
 class AdvancedWorker(QThread):
@@ -20,49 +21,75 @@ class AdvancedWorker(QThread):
     # Signals
     progress = pyqtSignal(int, str)  # (progreso_0_100, mensaje)
     finished = pyqtSignal(bool, str)  # (success, output_path_o_error)
-    log = pyqtSignal(str, str)  # (mensaje, nivel)
+    logs_batch = pyqtSignal(list)  # [(mensaje, nivel), ...] agrupados
     
     def __init__(self, job: RemuxJob, remux_service: RemuxService):
         super().__init__()
         self.job = job
         self.remux_service = remux_service
-        self._is_cancelled = False
+        self._validated = False
+        self._logs = LogBatcher(self.logs_batch.emit)
+    
+    def _validate(self) -> bool:
+        """
+        Comprueba que el video del job existe (un solo stat).
+        
+        Returns:
+            True si el job es válido; si no, emite el error y finished
+        """
+        self._validated = True
+        if not self.job.video_file.exists():
+            self._logs.queue(f"❌ Video no encontrado: {self.job.video_file}", "error")
+            self._logs.flush()
+            self.finished.emit(False, "Video no encontrado")
+            return False
+        return True
+    
+    def start(self, *args, **kwargs):
+        """Valida el job en el hilo que despacha: si falla, no se arranca el QThread"""
+        if self._validate():
+            super().start(*args, **kwargs)
     
     def run(self):
         """Ejecuta el remuxeo individual"""
         try:
-            self.log.emit("🎬 Iniciando remuxeo avanzado...", "info")
+            self._logs.queue("🎬 Iniciando remuxeo avanzado...", "info")
             
-            # Validar job
-            if not self.job.video_file.exists():
-                self.log.emit(f"❌ Video no encontrado: {self.job.video_file}", "error")
-                self.finished.emit(False, "Video no encontrado")
+            # Validar job (ya hecho en start() salvo que se llame a run() directamente)
+            if not self._validated and not self._validate():
                 return
             
             # Ejecutar remuxeo
-            self.log.emit(f"📹 Video: {self.job.video_file.name}", "info")
-            self.log.emit(f"🎵 Audios externos: {len(self.job.audio_tracks)}", "info")
-            self.log.emit(f"📝 Subtítulos externos: {len(self.job.subtitle_tracks)}", "info")
+            video_name = self.job.video_file.name
+            self._logs.queue(f"📹 Video: {video_name}", "info")
+            self._logs.queue(f"🎵 Audios externos: {len(self.job.audio_tracks)}", "info")
+            self._logs.queue(f"📝 Subtítulos externos: {len(self.job.subtitle_tracks)}", "info")
             
             self.progress.emit(10, "Preparando remuxeo...")
             
+            self._logs.flush()
+            
             # Ejecutar usando el servicio
             success = self._execute_remux()
             
-            if self._is_cancelled:
-                self.log.emit("⚠️ Remuxeo cancelado", "warning")
+            if self.isInterruptionRequested():
+                self._logs.queue("⚠️ Remuxeo cancelado", "warning")
+                self._logs.flush()
                 self.finished.emit(False, "Cancelado por el usuario")
                 return
             
             if success:
-                self.log.emit(f"✅ Remuxeo completado: {self.job.output_file}", "success")
+                self._logs.queue(f"✅ Remuxeo completado: {self.job.output_file}", "success")
+                self._logs.flush()
                 self.finished.emit(True, str(self.job.output_file))
             else:
-                self.log.emit("❌ Remuxeo falló", "error")
+                self._logs.queue("❌ Remuxeo falló", "error")
+                self._logs.flush()
                 self.finished.emit(False, "El remuxeo falló")
         
         except Exception as e:
-            self.log.emit(f"❌ Excepción: {str(e)}", "error")
+            self._logs.queue(f"❌ Excepción: {str(e)}", "error")
+            self._logs.flush()
             self.finished.emit(False, str(e))
     
     def _execute_remux(self) -> bool:
@@ -75,10 +102,13 @@ class AdvancedWorker(QThread):
         try:
             self.progress.emit(30, "Ejecutando FFmpeg...")
             
-            # Usar el servicio de remuxeo
-            result = self.remux_service.remux_episode(self.job)
+            # Usar el servicio de remuxeo (MKVMerge consulta la cancelación por línea)
+            result = self.remux_service.remux(
+                self.job,
+                cancel_check=self.isInterruptionRequested
+            )
             
-            if self._is_cancelled:
+            if self.isInterruptionRequested():
                 return False
             
             self.progress.emit(90, "Finalizando...")
@@ -87,13 +117,13 @@ class AdvancedWorker(QThread):
                 self.progress.emit(100, "Completado")
                 return True
             else:
-                self.log.emit(f"❌ Error: {result.error}", "error")
+                self._logs.queue(f"❌ Error: {result.error_message}", "error")
                 return False
         
         except Exception as e:
-            self.log.emit(f"❌ Error ejecutando remuxeo: {str(e)}", "error")
+            self._logs.queue(f"❌ Error ejecutando remuxeo: {str(e)}", "error")
             return False
     
     def cancel(self):
-        """Cancela el remuxeo"""
-        self._is_cancelled = True
+        """Cancela el remuxeo (interrupción cooperativa del QThread)"""
+        self.requestInterruption()
@@ -3,26 +3,30 @@ Batch Worker - Worker para procesamiento por lotes
 
 Ejecuta procesamiento de múltiples episodios en thread separado.
 """
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 from pathlib import Path
 from typing import Dict
+import threading
 
 from core.services import BatchService
 from core.domain.models import Episode
 
 
-class BatchWorker(QThread):
-    """
-    Worker para ejecutar procesamiento por lotes en thread separado.
-    
-    Procesa múltiples episodios sin bloquear la UI.
-    """
+class BatchSignals(QObject):
+    """Signals de BatchWorker (QRunnable no hereda de QObject)"""
     
-    # Signals
     progress = pyqtSignal(int, int, str)  # (episodio_num, progreso_0_100, mensaje)
     episode_completed = pyqtSignal(int, bool, str)  # (episodio_num, success, output/error)
     finished = pyqtSignal(int, int, int)  # (total, exitosos, fallidos)
     log = pyqtSignal(str, str)  # (mensaje, nivel)
+
+
+class BatchWorker(QRunnable):
+    """
+    Worker para ejecutar procesamiento por lotes en un thread del pool.
+    
+    Procesa múltiples episodios sin bloquear la UI; los signals viven en self.signals.
+    """
     
     def __init__(
         self,
@@ -43,22 +47,37 @@ class BatchWorker(QThread):
             subtitle_offset_ms: Offset de subtítulos
         """
         super().__init__()
+        self.signals = BatchSignals()
         self.batch_service = batch_service
         self.directory = directory
         self.output_directory = output_directory
         self.audio_offset_ms = audio_offset_ms
         self.subtitle_offset_ms = subtitle_offset_ms
-        self._is_cancelled = False
+        self._cancel = threading.Event()
+        # Episodios ya terminados (se conservan si el lote falla a mitad)
+        self._completed_success = 0
+        self._completed_fail = 0
+    
+    def _on_batch_progress(self, ep_num: int, progress_value: int, message: str):
+        """Callback de progreso del BatchService"""
+        if not self._cancel.is_set():
+            self.signals.progress.emit(ep_num, progress_value, message)
+    
+    def _on_episode_done(self, ep_num: int, success: bool, output_or_error: str):
+        """Cada episodio se reporta en cuanto termina (también si luego se cancela el lote)"""
+        if success:
+            self._completed_success += 1
+        else:
+            self._completed_fail += 1
+        self.signals.episode_completed.emit(ep_num, success, output_or_error)
     
     def run(self):
         """Ejecuta el procesamiento por lotes"""
+        self._completed_success = 0
+        self._completed_fail = 0
+        
         try:
-            self.log.emit("🚀 Iniciando procesamiento por lotes...", "info")
-            
-            # Callback de progreso
-            def progress_callback(ep_num: int, progress_value: int, message: str):
-                if not self._is_cancelled:
-                    self.progress.emit(ep_num, progress_value, message)
+            self.signals.log.emit("🚀 Iniciando procesamiento por lotes...", "info")
             
             # Ejecutar batch
             result = self.batch_service.process_directory(
@@ -66,33 +85,33 @@ class BatchWorker(QThread):
                 output_directory=self.output_directory,
                 audio_offset_ms=self.audio_offset_ms,
                 subtitle_offset_ms=self.subtitle_offset_ms,
-                progress_callback=progress_callback
+                progress_callback=self._on_batch_progress,
+                episode_done_callback=self._on_episode_done,
+                cancel_check=self._cancel.is_set
             )
             
             # Verificar si fue cancelado
-            if self._is_cancelled:
-                self.log.emit("⚠️ Procesamiento cancelado", "warning")
+            if self._cancel.is_set():
+                self.signals.log.emit("⚠️ Procesamiento cancelado", "warning")
                 return
             
-            # Emitir resultados individuales
-            for ep_result in result.results:
-                ep_num = ep_result.get('episode', 0)
-                success = ep_result.get('success', False)
-                output_or_error = ep_result.get('output') if success else ep_result.get('error', 'Error desconocido')
-                self.episode_completed.emit(ep_num, success, output_or_error)
-            
             # Emitir resultado final
-            self.log.emit(
+            self.signals.log.emit(
                 f"✅ Procesamiento completado: {result.successful}/{result.total_episodes} exitosos",
                 "success" if result.successful > 0 else "warning"
             )
-            self.finished.emit(result.total_episodes, result.successful, result.failed)
+            self.signals.finished.emit(result.total_episodes, result.successful, result.failed)
         
         except Exception as e:
-            self.log.emit(f"❌ Excepción: {str(e)}", "error")
-            self.finished.emit(0, 0, 1)
+            self.signals.log.emit(f"❌ Excepción: {str(e)}", "error")
+            # El episodio en curso cuenta como fallido; los ya terminados se conservan
+            self.signals.finished.emit(
+                self._completed_success + self._completed_fail + 1,
+                self._completed_success,
+                self._completed_fail + 1
+            )
     
     def cancel(self):
         """Cancela el procesamiento"""
-        self._is_cancelled = True
-        self.log.emit("⏹️ Cancelando procesamiento...", "warning")
+        self._cancel.set()
+        self.signals.log.emit("⏹️ Cancelando procesamiento...", "warning")
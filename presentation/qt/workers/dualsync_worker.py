@@ -4,181 +4,233 @@ DualSync Worker - Worker para remuxeo dual (JP + LAT)
 Maneja remuxeo individual y por lotes en thread separado.
 Usa DualVideoService con MKVMerge (arquitectura SOLID).
 """
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal
+from collections import deque
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict
+import threading
 import config
 
 from core.services import DualVideoService
 from core.domain import DualVideoRemuxJob, LanguageCode
+from .generic import WorkerSignals, ProgressThrottle, LogBatcher
+from .episode_remux_runnable import EpisodeRemuxRunnable, EpisodeRemuxSignals
+from .pool import start_worker, max_parallel_remux
 
 
-class DualSyncSingleWorker(QThread):
+# Idiomas y títulos de las pistas del remuxeo dual (única fuente para ambos workers)
+_DUAL_TRACK_DEFAULTS = dict(
+    primary_audio_language=LanguageCode.JAPANESE,
+    primary_audio_title=config.DEFAULT_AUDIO_JP_TITLE,
+    secondary_audio_language=LanguageCode.SPANISH_LATIN,
+    secondary_audio_title=config.DEFAULT_AUDIO_LAT_TITLE
+)
+
+
+def dual_remux_task(
+    dual_video_service: DualVideoService,
+    video_jp: str,
+    video_lat: str,
+    output: str,
+    audio_offset_ms: int,
+    subtitle_offset_ms: int,
+    *,
+    signals: WorkerSignals,
+    cancel_event: threading.Event
+):
     """
-    Worker para remuxeo individual de un video dual.
-    Usa DualVideoService con arquitectura SOLID.
+    Ejecuta el remuxeo individual de un video dual (en un thread del pool).
+    
+    Se encola con Worker(dual_remux_task, service, jp, lat, output, audio_ms, sub_ms).
     """
+    video_jp = Path(video_jp)
+    video_lat = Path(video_lat)
+    output = Path(output)
     
-    # Signals
-    progress = pyqtSignal(int, str)  # (progreso_0_100, mensaje)
-    finished = pyqtSignal(bool, str)  # (success, output_path_o_error)
-    log = pyqtSignal(str, str)  # (mensaje, nivel)
+    signals.log.emit("🎬 Iniciando remuxeo dual...", "info")
     
-    def __init__(self, dual_video_service: DualVideoService, video_jp: str, video_lat: str, 
-                 output: str, audio_offset_ms: int, subtitle_offset_ms: int):
-        super().__init__()
-        self.dual_video_service = dual_video_service
-        self.video_jp = Path(video_jp)
-        self.video_lat = Path(video_lat)
-        self.output = Path(output)
-        self.audio_offset_ms = audio_offset_ms
-        self.subtitle_offset_ms = subtitle_offset_ms
-        self._is_cancelled = False
+    # Crear job de remuxeo dual
+    job = DualVideoRemuxJob(
+        video_primary=video_jp,
+        video_secondary=video_lat,
+        output_file=output,
+        audio_offset_ms=audio_offset_ms,
+        subtitle_offset_ms=subtitle_offset_ms,
+        **_DUAL_TRACK_DEFAULTS
+    )
     
-    def run(self):
-        """Ejecuta el remuxeo individual"""
-        try:
-            self.log.emit("🎬 Iniciando remuxeo dual...", "info")
-            
-            # Crear job de remuxeo dual
-            job = DualVideoRemuxJob(
-                video_primary=self.video_jp,
-                video_secondary=self.video_lat,
-                output_file=self.output,
-                audio_offset_ms=self.audio_offset_ms,
-                subtitle_offset_ms=self.subtitle_offset_ms,
-                primary_audio_language=LanguageCode.JAPANESE,
-                primary_audio_title=config.DEFAULT_AUDIO_JP_TITLE,
-                secondary_audio_language=LanguageCode.SPANISH_LATIN,
-                secondary_audio_title=config.DEFAULT_AUDIO_LAT_TITLE
-            )
-            
-            self.log.emit(f"📹 Video JP: {self.video_jp.name}", "info")
-            self.log.emit(f"📹 Video LAT: {self.video_lat.name}", "info")
-            if self.audio_offset_ms != 0:
-                self.log.emit(f"⏱️ Offset de audio: {self.audio_offset_ms}ms", "info")
-            
-            # Ejecutar remuxeo con callback de progreso
-            result = self.dual_video_service.remux_dual(
-                job,
-                progress_callback=self._on_progress
-            )
-            
-            if self._is_cancelled:
-                self.log.emit("⚠️ Remuxeo cancelado", "warning")
-                self.finished.emit(False, "Cancelado por el usuario")
-                return
-            
-            if result.success:
-                self.log.emit(f"✅ Remuxeo completado: {self.output.name}", "success")
-                self.finished.emit(True, str(self.output))
-            else:
-                error_msg = result.error_message or "El remuxeo falló"
-                self.log.emit(f"❌ Remuxeo falló: {error_msg}", "error")
-                self.finished.emit(False, error_msg)
-        
-        except Exception as e:
-            self.log.emit(f"❌ Excepción: {str(e)}", "error")
-            self.finished.emit(False, str(e))
+    signals.log.emit(f"📹 Video JP: {video_jp.name}", "info")
+    signals.log.emit(f"📹 Video LAT: {video_lat.name}", "info")
+    if audio_offset_ms != 0:
+        signals.log.emit(f"⏱️ Offset de audio: {audio_offset_ms}ms", "info")
     
-    def _on_progress(self, progress: int):
-        """Callback de progreso"""
-        if not self._is_cancelled:
-            self.progress.emit(progress, f"Procesando... {progress}%")
+    # Ejecutar remuxeo con callback de progreso
+    result = dual_video_service.remux_dual(
+        job,
+        progress_callback=ProgressThrottle(signals.progress.emit, cancel_event, "Procesando... {progress}%"),
+        cancel_check=cancel_event.is_set
+    )
     
-    def cancel(self):
-        """Cancela el remuxeo"""
-        self._is_cancelled = True
+    if cancel_event.is_set():
+        signals.log.emit("⚠️ Remuxeo cancelado", "warning")
+        signals.finished.emit(False, "Cancelado por el usuario")
+        return
+    
+    if result.success:
+        signals.log.emit(f"✅ Remuxeo completado: {output.name}", "success")
+        signals.finished.emit(True, str(output))
+    else:
+        error_msg = result.error_message or "El remuxeo falló"
+        signals.log.emit(f"❌ Remuxeo falló: {error_msg}", "error")
+        signals.finished.emit(False, error_msg)
 
 
-class DualSyncBatchWorker(QThread):
-    """
-    Worker para procesamiento por lotes de videos duales.
-    Usa DualVideoService con arquitectura SOLID.
-    """
+class DualSyncBatchSignals(QObject):
+    """Signals de DualSyncBatchWorker"""
     
-    # Signals
     progress = pyqtSignal(int, str)  # (progreso_0_100, mensaje)
     episode_completed = pyqtSignal(int, bool, str)  # (ep_num, success, output/error)
     finished = pyqtSignal(list)  # Lista de resultados
-    log = pyqtSignal(str, str)  # (mensaje, nivel)
+    logs_batch = pyqtSignal(list)  # [(mensaje, nivel), ...] agrupados
+
+
+class DualSyncBatchWorker(QObject):
+    """
+    Coordinador del procesamiento por lotes de videos duales.
+    
+    Vive en el thread de la UI: encola un EpisodeRemuxRunnable por episodio en
+    el pool global, sin superar max_parallel_remux() a la vez, y agrega sus
+    resultados (los signals de los runnables llegan encolados a este thread).
+    """
     
     def __init__(self, dual_video_service: DualVideoService, episodes: Dict[int, Dict[str, str]], 
                  output_folder: str, audio_offset_ms: int, subtitle_offset_ms: int):
         super().__init__()
+        self.signals = DualSyncBatchSignals()
         self.dual_video_service = dual_video_service
         self.episodes = episodes
         self.output_folder = Path(output_folder)
         self.audio_offset_ms = audio_offset_ms
         self.subtitle_offset_ms = subtitle_offset_ms
-        self._is_cancelled = False
+        self._cancel = threading.Event()
+        self._logs = LogBatcher(self.signals.logs_batch.emit)
+        
+        # Signals compartidos por los runnables del lote
+        self._episode_signals = EpisodeRemuxSignals()
+        self._episode_signals.progress.connect(self._on_episode_progress)
+        self._episode_signals.finished.connect(self._on_episode_finished)
+        
+        self._max_running = max_parallel_remux()
+        self._queue: deque = deque()
+        self._running = 0
+        self._pending = 0
+        self._progress: dict = {}
+        self._results: list = []
     
-    def run(self):
-        """Ejecuta el procesamiento por lotes"""
-        results = []
+    def start(self):
+        """Prepara los jobs del lote y encola los primeros episodios en el pool"""
         total = len(self.episodes)
+        self._logs.queue(f"🚀 Iniciando procesamiento de {total} episodios...", "info")
         
-        self.log.emit(f"🚀 Iniciando procesamiento de {total} episodios...", "info")
+        # Argumentos comunes a todos los jobs del lote (se resuelven una vez)
+        job_defaults = dict(
+            _DUAL_TRACK_DEFAULTS,
+            audio_offset_ms=self.audio_offset_ms,
+            subtitle_offset_ms=self.subtitle_offset_ms
+        )
         
-        for idx, (ep_num, ep_data) in enumerate(sorted(self.episodes.items()), 1):
-            if self._is_cancelled:
-                self.log.emit("⚠️ Procesamiento cancelado", "warning")
-                break
-            
+        for ep_num, ep_data in sorted(self.episodes.items()):
             video_jp = ep_data.get('jp')
             video_lat = ep_data.get('lat')
             
             if not video_jp or not video_lat:
-                self.log.emit(f"⚠️ Episodio {ep_num}: Faltan archivos", "warning")
-                results.append({'episode': ep_num, 'success': False, 'error': 'Faltan archivos'})
-                self.episode_completed.emit(ep_num, False, 'Faltan archivos')
+                self._logs.queue(f"⚠️ Episodio {ep_num}: Faltan archivos", "warning")
+                self.signals.episode_completed.emit(ep_num, False, 'Faltan archivos')
+                self._results.append({'episode': ep_num, 'success': False, 'error': 'Faltan archivos'})
                 continue
             
-            output_path = self.output_folder / f"Episode_{ep_num:02d}_REMUX.mkv"
-            
-            self.log.emit(f"📺 Procesando Episodio {ep_num:02d}...", "info")
-            
-            # Calcular progreso general
-            overall_progress = int((idx - 1) / total * 100)
-            self.progress.emit(overall_progress, f"Episodio {ep_num:02d}/{total}")
-            
-            try:
-                # Crear job de remuxeo dual
-                job = DualVideoRemuxJob(
-                    video_primary=Path(video_jp),
-                    video_secondary=Path(video_lat),
-                    output_file=output_path,
-                    audio_offset_ms=self.audio_offset_ms,
-                    subtitle_offset_ms=self.subtitle_offset_ms,
-                    primary_audio_language=LanguageCode.JAPANESE,
-                    primary_audio_title=config.DEFAULT_AUDIO_JP_TITLE,
-                    secondary_audio_language=LanguageCode.SPANISH,
-                    secondary_audio_title=config.DEFAULT_AUDIO_LAT_TITLE
+            job = DualVideoRemuxJob(
+                video_primary=Path(video_jp),
+                video_secondary=Path(video_lat),
+                output_file=self.output_folder / f"Episode_{ep_num:02d}_REMUX.mkv",
+                **job_defaults
+            )
+            self._queue.append((ep_num, job))
+            self._progress[ep_num] = 0
+        
+        self._pending = len(self._queue)
+        if self._pending == 0:
+            self._finish()
+            return
+        
+        self._submit_episodes()
+        self._logs.flush()
+    
+    def _submit_episodes(self):
+        """Envía episodios al pool global sin superar _max_running a la vez"""
+        while self._queue and self._running < self._max_running:
+            ep_num, job = self._queue.popleft()
+            self._running += 1
+            self._logs.queue(f"📺 Procesando Episodio {ep_num:02d}...", "info")
+            start_worker(
+                EpisodeRemuxRunnable(
+                    ep_num, job, self.dual_video_service.remux_dual,
+                    self._episode_signals, self._cancel
                 )
-                
-                # Ejecutar remuxeo
-                result = self.dual_video_service.remux_dual(job)
-                
-                if result.success:
-                    self.log.emit(f"✅ Episodio {ep_num:02d} completado", "success")
-                    results.append({'episode': ep_num, 'success': True, 'file': output_path.name})
-                    self.episode_completed.emit(ep_num, True, str(output_path))
-                else:
-                    error_msg = result.error_message or 'Remuxeo falló'
-                    self.log.emit(f"❌ Episodio {ep_num:02d} falló: {error_msg}", "error")
-                    results.append({'episode': ep_num, 'success': False, 'error': error_msg})
-                    self.episode_completed.emit(ep_num, False, error_msg)
-            
-            except Exception as e:
-                self.log.emit(f"❌ Episodio {ep_num:02d}: {str(e)}", "error")
-                results.append({'episode': ep_num, 'success': False, 'error': str(e)})
-                self.episode_completed.emit(ep_num, False, str(e))
+            )
+    
+    def _on_episode_progress(self, ep_num: int, progress: int, message: str):
+        """Progreso de un episodio: emite el promedio del lote"""
+        self._progress[ep_num] = progress
+        self._emit_progress()
+    
+    def _emit_progress(self):
+        """Emite el progreso global del lote (promedio de los episodios)"""
+        done = len(self._progress) - self._pending
+        self.signals.progress.emit(
+            sum(self._progress.values()) // len(self._progress),
+            f"Episodios {done}/{len(self._progress)}"
+        )
+    
+    def _on_episode_finished(self, ep_num: int, success: bool, message: str):
+        """
+        Fin de un episodio: registra el resultado y encola el siguiente.
+        
+        Args:
+            ep_num: Número de episodio
+            success: True si fue exitoso
+            message: Archivo de salida o mensaje de error
+        """
+        if success:
+            self._logs.queue(f"✅ Episodio {ep_num:02d} completado", "success")
+            self._results.append({'episode': ep_num, 'success': True, 'file': Path(message).name})
+        else:
+            self._logs.queue(f"❌ Episodio {ep_num:02d} falló: {message}", "error")
+            self._results.append({'episode': ep_num, 'success': False, 'error': message})
+        self.signals.episode_completed.emit(ep_num, success, message)
         
-        self.finished.emit(results)
+        self._running -= 1
+        self._pending -= 1
+        self._progress[ep_num] = 100
+        self._emit_progress()
+        
+        if self._pending > 0:
+            self._submit_episodes()
+            self._logs.flush()
+            return
+        self._finish()
+    
+    def _finish(self):
+        """Reporta el resumen del lote"""
+        if self._cancel.is_set():
+            self._logs.queue("⚠️ Procesamiento cancelado", "warning")
         
-        success_count = sum(1 for r in results if r.get('success'))
-        self.log.emit(f"✅ Completado: {success_count}/{total} exitosos", "success")
+        self._results.sort(key=lambda r: r['episode'])
+        success_count = sum(1 for r in self._results if r.get('success'))
+        self._logs.queue(f"✅ Completado: {success_count}/{len(self.episodes)} exitosos", "success")
+        self._logs.flush()
+        self.signals.finished.emit(self._results)
     
     def cancel(self):
-        """Cancela el procesamiento"""
-        self._is_cancelled = True
+        """Cancela el procesamiento (los episodios encolados no arrancan)"""
+        self._cancel.set()
@@ -0,0 +1,87 @@
+"""
+Episode Remux Runnable - Remuxeo de un episodio en QThreadPool
+
+Permite procesar varios episodios de un lote en paralelo.
+"""
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from functools import partial
+from typing import Callable, Union
+import threading
+
+from core.domain.models import RemuxJob, RemuxResult, DualVideoRemuxJob
+from .generic import ProgressThrottle
+
+
+class EpisodeRemuxSignals(QObject):
+    """
+    Signals compartidos por los runnables de un lote.
+    
+    QRunnable no hereda de QObject, así que los signals viven aquí.
+    """
+    
+    progress = pyqtSignal(int, int, str)  # (episodio_num, progreso_0_100, mensaje)
+    finished = pyqtSignal(int, bool, str)  # (episodio_num, success, output/error)
+
+
+class EpisodeRemuxRunnable(QRunnable):
+    """
+    Runnable que remuxea un único episodio.
+    
+    Se encola en un QThreadPool; el resultado se reporta por EpisodeRemuxSignals.
+    """
+    
+    def __init__(
+        self,
+        ep_num: int,
+        job: Union[RemuxJob, DualVideoRemuxJob],
+        remux: Callable[..., RemuxResult],
+        signals: EpisodeRemuxSignals,
+        cancel_event: threading.Event
+    ):
+        """
+        Inicializa el runnable.
+        
+        Args:
+            ep_num: Número de episodio
+            job: Trabajo de remuxeo del episodio (RemuxJob o DualVideoRemuxJob)
+            remux: Método del servicio que lo ejecuta, p. ej. RemuxService.remux
+                o DualVideoService.remux_dual (job, progress_callback, cancel_check)
+            signals: Signals compartidos del lote
+            cancel_event: Evento de cancelación compartido del lote
+        """
+        super().__init__()
+        self.ep_num = ep_num
+        self.job = job
+        self.remux = remux
+        self.signals = signals
+        self.cancel_event = cancel_event
+    
+    def run(self):
+        """Ejecuta el remuxeo del episodio en un thread del pool"""
+        ep_num = self.ep_num
+        
+        # Episodios aún en cola cuando se cancela el lote: se reportan sin ejecutarse
+        if self.cancel_event.is_set():
+            self.signals.finished.emit(ep_num, False, "Cancelado por el usuario")
+            return
+        
+        try:
+            result = self.remux(
+                self.job,
+                ProgressThrottle(
+                    partial(self.signals.progress.emit, ep_num),
+                    self.cancel_event,
+                    "Remuxeando... {progress}%"
+                ),
+                cancel_check=self.cancel_event.is_set
+            )
+            
+            if self.cancel_event.is_set():
+                self.signals.finished.emit(ep_num, False, "Cancelado por el usuario")
+            elif result.success:
+                self.signals.finished.emit(ep_num, True, str(result.output_file or self.job.output_file))
+            else:
+                self.signals.finished.emit(ep_num, False, result.error_message or "Error desconocido")
+        
+        except Exception as e:
+            self.signals.finished.emit(ep_num, False, str(e))
@@ -0,0 +1,131 @@
+"""
+Generic Worker - Runnable genérico para el QThreadPool
+
+Ejecuta cualquier función de tarea en un thread del pool. La tarea recibe
+los signals y el evento de cancelación como argumentos con nombre:
+
+    start_worker(Worker(remux_task, job, remux_service))
+"""
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from contextlib import nullcontext
+from typing import Callable, Optional
+import threading
+import time
+
+
+# Intervalo mínimo entre emisiones de progreso (máx. 10 eventos/s hacia la UI)
+_PROGRESS_MIN_INTERVAL = 0.1
+
+# Vaciado del buffer de logs: cada 100 ms o cada 32 mensajes
+_LOG_FLUSH_INTERVAL = 0.1
+_LOG_FLUSH_SIZE = 32
+
+
+class WorkerSignals(QObject):
+    """Signals de Worker (QRunnable no hereda de QObject)"""
+    
+    progress = pyqtSignal(int, str)  # (progreso_0_100, mensaje)
+    status = pyqtSignal(str)  # Mensaje de estado
+    finished = pyqtSignal(bool, str)  # (success, output_path_o_error)
+    log = pyqtSignal(str, str)  # (mensaje, nivel)
+
+
+class ProgressThrottle:
+    """
+    Callback de progreso limitado para los services.
+    
+    Descarta valores repetidos y emite como máximo cada 100 ms (el 100% siempre pasa).
+    """
+    
+    def __init__(self, emit: Callable[[int, str], None], cancel_event: threading.Event, message: str):
+        """
+        Args:
+            emit: Emisor de progreso (progreso, mensaje), p. ej. signals.progress.emit
+            cancel_event: Si está activo no se emite nada
+            message: Formato del mensaje ({progress} = porcentaje)
+        """
+        self.emit = emit
+        self.cancel_event = cancel_event
+        self.message = message
+        self._last_emit_ts = 0.0
+        self._last_emit_value = -1
+    
+    def __call__(self, progress: int):
+        if self.cancel_event.is_set() or progress == self._last_emit_value:
+            return
+        now = time.monotonic()
+        if progress < 100 and now - self._last_emit_ts < _PROGRESS_MIN_INTERVAL:
+            return
+        self._last_emit_ts = now
+        self._last_emit_value = progress
+        self.emit(progress, self.message.format(progress=progress))
+
+
+class LogBatcher:
+    """
+    Buffer de logs de un worker emitido en lotes [(mensaje, nivel), ...].
+    
+    Se vacía cada 100 ms o cada 32 mensajes, pero solo al llegar otro log:
+    hay que llamar a flush() antes de bloquear y al terminar.
+    """
+    
+    def __init__(self, emit: Callable[[list], None], lock: Optional[threading.Lock] = None):
+        """
+        Args:
+            emit: Emisor del lote, p. ej. signals.logs_batch.emit
+            lock: Lock si varios threads escriben en el mismo buffer
+        """
+        self.emit = emit
+        self._lock = lock if lock is not None else nullcontext()
+        self._buffer: list = []
+        self._last_flush = time.monotonic()
+    
+    def queue(self, message: str, level: str):
+        """Acumula un log y vacía el buffer si toca (tamaño o tiempo)"""
+        with self._lock:
+            self._buffer.append((message, level))
+            due = (len(self._buffer) >= _LOG_FLUSH_SIZE
+                   or time.monotonic() - self._last_flush >= _LOG_FLUSH_INTERVAL)
+        if due:
+            self.flush()
+    
+    def flush(self):
+        """Emite los logs acumulados en una sola señal"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self.emit(batch)
+
+
+class Worker(QRunnable):
+    """
+    Runnable genérico: ejecuta fn(*args, signals=..., cancel_event=..., **kwargs).
+    
+    Se encola con pool.start_worker(); los signals viven en self.signals.
+    """
+    
+    def __init__(self, fn: Callable, *args, **kwargs):
+        """
+        Args:
+            fn: Función de tarea a ejecutar en el pool
+            *args, **kwargs: Argumentos de la tarea
+        """
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self._cancel = threading.Event()
+    
+    def run(self):
+        """Ejecuta la tarea; una excepción no capturada se reporta como fallo"""
+        try:
+            self.fn(*self.args, signals=self.signals, cancel_event=self._cancel, **self.kwargs)
+        except Exception as e:
+            self.signals.log.emit(f"❌ Excepción: {str(e)}", "error")
+            self.signals.finished.emit(False, str(e))
+    
+    def cancel(self):
+        """Pide a la tarea que se detenga (cancelación cooperativa)"""
+        self._cancel.set()
@@ -0,0 +1,69 @@
+"""
+Pool - QThreadPool compartido por los workers
+
+Los workers son QRunnable: se encolan en el pool global de Qt, que
+dimensiona sus threads con idealThreadCount() y los recicla entre trabajos.
+"""
+from PyQt6.QtCore import QRunnable, QThreadPool
+import os
+import sys
+import config
+
+
+def usable_cpus() -> int:
+    """
+    Retorna las CPUs que el proceso puede usar realmente.
+    
+    En contenedores/Flatpak os.cpu_count() devuelve las CPUs del host;
+    la afinidad del proceso refleja el límite real.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        try:
+            return max(1, len(os.sched_getaffinity(0)))
+        except OSError:
+            pass
+    elif sys.platform == "win32":
+        try:
+            import ctypes
+            from ctypes import wintypes
+            
+            process_mask = ctypes.c_size_t()
+            system_mask = ctypes.c_size_t()
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            if kernel32.GetProcessAffinityMask(
+                kernel32.GetCurrentProcess(),
+                ctypes.byref(process_mask),
+                ctypes.byref(system_mask)
+            ):
+                count = bin(process_mask.value).count("1")
+                if count:
+                    return count
+        except (OSError, AttributeError):
+            pass
+    return os.cpu_count() or 1
+
+
+def max_parallel_remux() -> int:
+    """
+    Retorna cuántos episodios de un lote remuxear a la vez.
+    
+    mkvmerge corre como subproceso (libera el GIL), así que el límite real
+    son las CPUs usables y el tope de config, que protege al disco.
+    """
+    return max(1, min(usable_cpus(), config.MAX_PARALLEL_REMUX))
+
+
+def get_thread_pool() -> QThreadPool:
+    """Retorna el pool global de Qt"""
+    return QThreadPool.globalInstance()
+
+
+def start_worker(worker: QRunnable) -> None:
+    """
+    Encola un worker en el pool global.
+    
+    Args:
+        worker: Runnable a ejecutar (el pool lo libera al terminar)
+    """
+    get_thread_pool().start(worker)